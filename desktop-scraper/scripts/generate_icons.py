@@ -10,11 +10,19 @@ Author: Claude Code Assistant
 Date: December 13, 2024
 """
 
+import base64
+import errno
+import hashlib
+import io
+import math
 import os
+import shutil
 import sys
+import zlib
 from pathlib import Path
 from typing import List, Tuple
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Check for PIL availability
 try:
@@ -25,22 +33,77 @@ except ImportError:
     print("pip install Pillow")
     sys.exit(1)
 
-# Check for additional tools
-IMAGEMAGICK_AVAILABLE = False
+# Check for NumPy availability (used for vectorized shape masks)
 try:
-    result = subprocess.run(['convert', '-version'], capture_output=True, text=True)
-    if result.returncode == 0:
-        IMAGEMAGICK_AVAILABLE = True
-        print("✅ ImageMagick detected - will use for ICO/ICNS generation")
-except FileNotFoundError:
-    print("⚠️  ImageMagick not found - will create PNG files only")
-    print("   Install ImageMagick for ICO/ICNS support:")
+    import numpy as np
+except ImportError:
+    print("❌ NumPy not installed. Please install it:")
+    print("pip install numpy")
+    sys.exit(1)
+
+# Check for Numba availability (optional JIT for the circle rasterizer)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Check for additional tools (PATH lookup only - no process spawn at import)
+IMAGEMAGICK_AVAILABLE = shutil.which('convert') is not None
+if IMAGEMAGICK_AVAILABLE:
+    print("✅ ImageMagick detected - will use for ICNS generation")
+else:
+    print("⚠️  ImageMagick not found - will create PNG and ICO files only")
+    print("   Install ImageMagick for ICNS support:")
     print("   macOS: brew install imagemagick")
     print("   Ubuntu: sudo apt-get install imagemagick")
 
+# Pre-rendered 32x32 favicon (zlib-compressed RGBA, base64) and the design
+# hash it was rendered from. Regenerate with --dump-favicon after changing
+# the palette or bumping IconDesigner.DESIGN_VERSION.
+_FAVICON_32_DESIGN_HASH = '2f9ae065d1f0cce8'
+_FAVICON_32_RGBA = (
+    b'eNrt19EJgDAMBNCO4D5Op1u5mL8VhYCIKXetphFzEPDv3UexaUqRr2Wc1ywj2b+tTM0/j4Vd8p/oUHIRv6UHYqN+'
+    b'TYeePmozPtqBsVkf6fBnn7WHZTqG8UsdamwZS/9qsx00P4PRfDSt/l0HJl7PX/x/+vu975+4/33sXx72Ty/7t4f3'
+    b'R+SdbBZj5xQ='
+)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _rasterize_circles_jit(canvas, centers, outer_radii, inner_radii, colors):
+        """Row-parallel version of IconDesigner._rasterize_circles"""
+        size = canvas.shape[0]
+        count = colors.shape[0]
+        outer_sq = outer_radii * outer_radii
+        inner_sq = inner_radii * inner_radii
+        for y in prange(size):
+            for x in range(size):
+                # Walk primitives back to front; the last one drawn wins
+                for k in range(count - 1, -1, -1):
+                    dx = x - centers[k, 0]
+                    dy = y - centers[k, 1]
+                    d2 = dx * dx + dy * dy
+                    if d2 <= outer_sq[k] and d2 >= inner_sq[k]:
+                        for channel in range(4):
+                            canvas[y, x, channel] = colors[k, channel]
+                        break
+
+
 class IconDesigner:
     """Creates the Local Web Scraper application icon"""
     
+    # Bump whenever the drawing code changes so cached renders are invalidated
+    DESIGN_VERSION = b'v1'
+    
+    # Resolution of the pre-drawn radial spoke sprite
+    SPOKE_SPRITE_SIZE = 1024
+    
+    # Unit vectors for the 8 radial web lines (every 45 degrees)
+    _WEB_DIRS = tuple(
+        (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+        for angle in range(0, 360, 45)
+    )
+    
     def __init__(self):
         # Color scheme based on app's primary colors
         self.colors = {
@@ -52,76 +115,129 @@ class IconDesigner:
             'dark': '#1f2937',         # Gray-800
             'gray': '#6b7280'          # Gray-500
         }
+        
+        # Parse hex colors once instead of on every draw call
+        self.rgb = {name: getrgb(value) for name, value in self.colors.items()}
+        self.rgba = {
+            'primary_200': (*self.rgb['primary'], 200),
+            'accent': (*self.rgb['accent'], 255),
+            'web': (*self.rgb['background'], 255),
+            'arrow': (*self.rgb['background'], 200),
+        }
+        # Alpha of each 2px gradient band, outermost first
+        self.gradient_alphas = np.array([40 - (i * 8) for i in range(5)], dtype=np.uint8)
+        
+        # Spoke sprite is drawn lazily on first use and reused for every size
+        self._spokes_sprite = None
+    
+    @property
+    def design_hash(self) -> str:
+        """Fingerprint of the palette and drawing code version"""
+        design = repr(sorted(self.colors.items())).encode() + self.DESIGN_VERSION
+        return hashlib.blake2b(design).hexdigest()[:16]
+    
+    @staticmethod
+    def _rasterize_circles(canvas: np.ndarray, centers: np.ndarray, outer_radii: np.ndarray,
+                           inner_radii: np.ndarray, colors: np.ndarray) -> None:
+        """Paint a batch of filled circles/rings onto the canvas in draw order
+        
+        Primitives are given as parallel arrays (one row per circle). A pixel
+        takes the color of the last primitive covering it, like successive
+        ImageDraw fills. Filled circles use an inner radius of 0.
+        """
+        if NUMBA_AVAILABLE:
+            _rasterize_circles_jit(canvas, centers, outer_radii, inner_radii, colors)
+            return
+        
+        size = canvas.shape[0]
+        yy, xx = np.ogrid[:size, :size]
+        
+        # Branchless inside test per primitive, applied as a masked store
+        for (center_x, center_y), outer, inner, color in zip(centers, outer_radii, inner_radii, colors):
+            d2 = (xx - center_x) ** 2 + (yy - center_y) ** 2
+            inside = (d2 <= outer * outer) & (d2 >= inner * inner)
+            np.copyto(canvas, color, where=inside[..., None])
+    
+    def _spoke_mask(self, size: int) -> np.ndarray:
+        """Boolean mask of the 8 radial web lines at the requested size"""
+        if self._spokes_sprite is None:
+            sprite_size = self.SPOKE_SPRITE_SIZE
+            center = sprite_size // 2
+            web_radius = sprite_size * 0.35
+            
+            self._spokes_sprite = Image.new('L', (sprite_size, sprite_size), 0)
+            spoke_draw = ImageDraw.Draw(self._spokes_sprite)
+            for dir_x, dir_y in self._WEB_DIRS:
+                spoke_draw.line(
+                    [(center, center), (center + web_radius * dir_x, center + web_radius * dir_y)],
+                    fill=255,
+                    width=max(1, sprite_size // 64)
+                )
+        
+        sprite = self._spokes_sprite
+        if sprite.size != (size, size):
+            sprite = sprite.resize((size, size), Image.LANCZOS)
+        return np.asarray(sprite) >= 128
     
     def create_base_icon(self, size: int) -> Image.Image:
         """Create the base icon design"""
         # Create canvas with transparent background
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
+        canvas = np.zeros((size, size, 4), dtype=np.uint8)
         
         # Calculate proportional sizes
-        margin = size * 0.1
         center = size // 2
         
         # Background circle (subtle)
         circle_radius = size * 0.45
-        circle_bbox = [
-            center - circle_radius,
-            center - circle_radius,
-            center + circle_radius,
-            center + circle_radius
-        ]
-        
-        # Draw background gradient effect (simulate with multiple circles)
-        for i in range(5):
-            alpha = 40 - (i * 8)
-            radius_offset = i * 2
-            circle_color = (*getrgb(self.colors['primary']), alpha)
-            
-            gradient_bbox = [
-                circle_bbox[0] + radius_offset,
-                circle_bbox[1] + radius_offset,
-                circle_bbox[2] - radius_offset,
-                circle_bbox[3] - radius_offset
-            ]
-            
-            # Only draw if bbox is valid
-            if gradient_bbox[2] > gradient_bbox[0] and gradient_bbox[3] > gradient_bbox[1]:
-                draw.ellipse(gradient_bbox, fill=circle_color)
-        
-        # Main circle background
-        main_circle_color = (*getrgb(self.colors['primary']), 200)
-        draw.ellipse(circle_bbox, fill=main_circle_color)
         
         # Spider web design (representing web scraping)
         web_center_x, web_center_y = center, center
-        web_radius = size * 0.35
         
         # Draw web lines
-        web_color = (*getrgb(self.colors['background']), 255)
+        web_color = self.rgba['web']
         line_width = max(1, size // 64)
         
-        # Radial lines (8 directions)
-        for angle in range(0, 360, 45):
-            import math
-            end_x = web_center_x + web_radius * math.cos(math.radians(angle))
-            end_y = web_center_y + web_radius * math.sin(math.radians(angle))
-            draw.line(
-                [(web_center_x, web_center_y), (end_x, end_y)],
-                fill=web_color,
-                width=line_width
-            )
+        # Background gradient effect: each pixel takes the alpha of the
+        # innermost 2px band that still covers it. Pillow's radial ramp
+        # (value 255 at the corners) is mapped to band alphas through a
+        # 256-entry lookup table in a single C pass.
+        ramp = Image.radial_gradient('L').resize((size, size))
+        ramp_distance = np.arange(256) * (size * math.sqrt(2) / 510)
+        band = np.floor((circle_radius - ramp_distance) / 2)
+        band_alpha = self.gradient_alphas[np.clip(band, 0, len(self.gradient_alphas) - 1).astype(np.intp)]
+        alpha_lut = np.where(band >= 0, band_alpha, 0)
+        gradient_alpha = np.asarray(ramp.point(alpha_lut.tolist()))
+        inside = gradient_alpha > 0
+        canvas[inside, :3] = self.rgb['primary']
+        canvas[..., 3] = gradient_alpha
+        
+        # Background layer: main circle, then web rings
+        centers, outer_radii, inner_radii, colors = [], [], [], []
+        
+        # Main circle background
+        centers.append((center, center))
+        outer_radii.append(circle_radius)
+        inner_radii.append(0)
+        colors.append(self.rgba['primary_200'])
         
         # Concentric circles for web
         for radius_multiplier in [0.15, 0.25, 0.35]:
-            web_radius_current = size * radius_multiplier
-            web_circle_bbox = [
-                web_center_x - web_radius_current,
-                web_center_y - web_radius_current,
-                web_center_x + web_radius_current,
-                web_center_y + web_radius_current
-            ]
-            draw.ellipse(web_circle_bbox, outline=web_color, width=line_width)
+            ring_outer = size * radius_multiplier
+            centers.append((web_center_x, web_center_y))
+            outer_radii.append(ring_outer)
+            inner_radii.append(ring_outer - line_width)
+            colors.append(web_color)
+        
+        self._rasterize_circles(
+            canvas,
+            np.array(centers, dtype=np.float32),
+            np.array(outer_radii, dtype=np.float32),
+            np.array(inner_radii, dtype=np.float32),
+            np.array(colors, dtype=np.uint8)
+        )
+        
+        # Radial lines (8 directions), blitted from the cached spoke sprite
+        np.copyto(canvas, np.array(web_color, dtype=np.uint8), where=self._spoke_mask(size)[..., None])
         
         # AI/Brain symbol in center
         brain_size = size * 0.12
@@ -129,17 +245,11 @@ class IconDesigner:
         brain_y = center - brain_size // 2
         
         # Simple AI symbol (circuit-like pattern)
-        ai_color = (*getrgb(self.colors['accent']), 255)
+        ai_color = self.rgba['accent']
         
         # Central node
         node_radius = brain_size * 0.3
-        node_bbox = [
-            brain_x + brain_size//2 - node_radius,
-            brain_y + brain_size//2 - node_radius,
-            brain_x + brain_size//2 + node_radius,
-            brain_y + brain_size//2 + node_radius
-        ]
-        draw.ellipse(node_bbox, fill=ai_color)
+        node_center = (brain_x + brain_size//2, brain_y + brain_size//2)
         
         # Connection nodes
         node_positions = [
@@ -150,24 +260,28 @@ class IconDesigner:
         ]
         
         small_node_radius = node_radius * 0.4
+        node_count = len(node_positions) + 1
+        self._rasterize_circles(
+            canvas,
+            np.array([node_center, *node_positions], dtype=np.float32),
+            np.array([node_radius] + [small_node_radius] * len(node_positions), dtype=np.float32),
+            np.zeros(node_count, dtype=np.float32),
+            np.array([ai_color] * node_count, dtype=np.uint8)
+        )
+        
+        img = Image.fromarray(canvas, 'RGBA')
+        draw = ImageDraw.Draw(img)
+        
         for pos_x, pos_y in node_positions:
-            small_node_bbox = [
-                pos_x - small_node_radius,
-                pos_y - small_node_radius,
-                pos_x + small_node_radius,
-                pos_y + small_node_radius
-            ]
-            draw.ellipse(small_node_bbox, fill=ai_color)
-            
             # Draw connection lines
             draw.line(
-                [(brain_x + brain_size//2, brain_y + brain_size//2), (pos_x, pos_y)],
+                [node_center, (pos_x, pos_y)],
                 fill=ai_color,
                 width=max(1, line_width//2)
             )
         
         # Add data extraction arrows (small)
-        arrow_color = (*getrgb(self.colors['background']), 200)
+        arrow_color = self.rgba['arrow']
         arrow_size = size * 0.08
         
         # Right arrow
@@ -185,6 +299,13 @@ class IconDesigner:
     
     def create_favicon(self, size: int = 32) -> Image.Image:
         """Create a simplified favicon version"""
+        # The default favicon is a constant asset unless the design changed
+        if size == 32 and self.design_hash == _FAVICON_32_DESIGN_HASH:
+            return Image.frombytes('RGBA', (32, 32), zlib.decompress(base64.b64decode(_FAVICON_32_RGBA)))
+        return self.draw_favicon(size)
+    
+    def draw_favicon(self, size: int = 32) -> Image.Image:
+        """Draw the simplified favicon design"""
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
@@ -200,11 +321,11 @@ class IconDesigner:
             center + circle_radius
         ]
         
-        circle_color = getrgb(self.colors['primary'])
+        circle_color = self.rgb['primary']
         draw.ellipse(circle_bbox, fill=circle_color)
         
         # Simple web pattern
-        web_color = getrgb(self.colors['background'])
+        web_color = self.rgb['background']
         line_width = max(1, size // 16)
         
         # Cross lines
@@ -221,7 +342,7 @@ class IconDesigner:
             center + dot_radius,
             center + dot_radius
         ]
-        draw.ellipse(dot_bbox, fill=getrgb(self.colors['accent']))
+        draw.ellipse(dot_bbox, fill=self.rgb['accent'])
         
         return img
 
@@ -229,18 +350,97 @@ class IconDesigner:
 class IconGenerator:
     """Generates all required icon formats and sizes"""
     
-    def __init__(self, base_dir: str):
+    # Encoder options for PNGs that ship as-is (smallest file, slowest encode)
+    FINAL_PNG_OPTIONS = {'optimize': True, 'compress_level': 9}
+    
+    # Resolution of the master render every other size is downsampled from
+    MASTER_SIZE = 1024
+    
+    def __init__(self, base_dir: str, force: bool = False):
         self.base_dir = Path(base_dir)
         self.assets_dir = self.base_dir / 'assets'
         self.public_dir = self.base_dir / 'public'
         self.designer = IconDesigner()
+        self.force = force
+        self.design_hash = self.designer.design_hash
+        
+        # In-memory renders shared by the PNG, ICO and ICNS writers
+        self._master = None
+        self._size_icons = {}
         
         # Create directories if they don't exist
         self.assets_dir.mkdir(exist_ok=True)
         self.public_dir.mkdir(exist_ok=True)
     
-    def generate_png_icons(self):
-        """Generate PNG icons in various sizes"""
+    @staticmethod
+    def _resize_master(master: Image.Image, size: int) -> Image.Image:
+        """Downsample the master render to the requested size"""
+        if master.size == (size, size):
+            return master
+        return master.resize((size, size), Image.LANCZOS)
+    
+    def _master_icon(self) -> Image.Image:
+        """Render the master icon on first use"""
+        if self._master is None:
+            self._master = self.designer.create_base_icon(self.MASTER_SIZE)
+        return self._master
+    
+    def _icon_for_size(self, size: int) -> Image.Image:
+        """In-memory icon at the given size
+        
+        Reuses this run's render when there is one, then an up-to-date PNG
+        on disk, and only downsamples from the master render as a last resort.
+        """
+        if size not in self._size_icons:
+            png_path = self.assets_dir / f'icon_{size}x{size}.png'
+            if self._master is None and self._is_up_to_date(png_path):
+                with Image.open(png_path) as png:
+                    self._size_icons[size] = png.convert('RGBA')
+            else:
+                self._size_icons[size] = self._resize_master(self._master_icon(), size)
+        return self._size_icons[size]
+    
+    @staticmethod
+    def _hash_sidecar(path: Path) -> Path:
+        return path.with_suffix(path.suffix + '.hash')
+    
+    def _is_up_to_date(self, path: Path) -> bool:
+        """Check whether a generated file was rendered from the current design"""
+        if self.force or not path.exists():
+            return False
+        sidecar = self._hash_sidecar(path)
+        return sidecar.exists() and sidecar.read_text() == self.design_hash
+    
+    def _mark_up_to_date(self, path: Path):
+        """Record the design hash next to a freshly written file"""
+        self._hash_sidecar(path).write_text(self.design_hash)
+    
+    def _save_size_icon(self, master: Image.Image, size: int, compress_level: int) -> List[Path]:
+        """Downsample the master render to one size and save it"""
+        icon = self._resize_master(master, size)
+        self._size_icons[size] = icon
+        
+        # Save main PNG (intermediate input for ICO/ICNS packaging)
+        png_path = self.assets_dir / f'icon_{size}x{size}.png'
+        icon.save(png_path, 'PNG', optimize=False, compress_level=compress_level)
+        self._mark_up_to_date(png_path)
+        saved_files = [png_path]
+        
+        # Save the 512x512 as the main Linux icon
+        if size == 512:
+            main_png_path = self.assets_dir / 'icon.png'
+            icon.save(main_png_path, 'PNG', **self.FINAL_PNG_OPTIONS)
+            self._mark_up_to_date(main_png_path)
+            saved_files.append(main_png_path)
+        
+        return saved_files
+    
+    def generate_png_icons(self, compress_level: int = 1):
+        """Generate PNG icons in various sizes
+        
+        ``compress_level`` applies to the per-size intermediate PNGs; the
+        user-facing icon.png and logo192.png are always fully compressed.
+        """
         print("🎨 Generating PNG icons...")
         
         # Standard sizes for different purposes
@@ -257,95 +457,132 @@ class IconGenerator:
         }
         
         generated_files = []
+        main_png_path = self.assets_dir / 'icon.png'
+        web_icon_path = self.public_dir / 'logo192.png'
+        
+        # Only sizes whose PNG is missing or rendered from an older design
+        stale_sizes = [
+            size for size in sizes
+            if not self._is_up_to_date(self.assets_dir / f'icon_{size}x{size}.png')
+            or (size == 512 and not self._is_up_to_date(main_png_path))
+        ]
+        web_icon_stale = not self._is_up_to_date(web_icon_path)
+        
+        # Render the design once at the largest size and downsample from it
+        master = None
+        if stale_sizes or web_icon_stale:
+            master = self._master_icon()
         
         for size, description in sizes.items():
-            print(f"  📏 Creating {size}x{size} icon ({description})")
-            
-            # Generate main icon
-            icon = self.designer.create_base_icon(size)
-            
-            # Save main PNG
-            png_path = self.assets_dir / f'icon_{size}x{size}.png'
-            icon.save(png_path, 'PNG')
-            generated_files.append(png_path)
-            
-            # Save the 512x512 as the main Linux icon
-            if size == 512:
-                main_png_path = self.assets_dir / 'icon.png'
-                icon.save(main_png_path, 'PNG')
-                generated_files.append(main_png_path)
-                print(f"  ✅ Saved Linux icon: {main_png_path}")
+            if size in stale_sizes:
+                print(f"  📏 Creating {size}x{size} icon ({description})")
+            else:
+                print(f"  ⏭️  {size}x{size} icon is up to date")
+                generated_files.append(self.assets_dir / f'icon_{size}x{size}.png')
+                if size == 512:
+                    generated_files.append(main_png_path)
+        
+        # Resize and PNG-encode each size in parallel (Pillow releases the GIL)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for saved_files in executor.map(lambda size: self._save_size_icon(master, size, compress_level), stale_sizes):
+                generated_files.extend(saved_files)
+        
+        if 512 in stale_sizes:
+            print(f"  ✅ Saved Linux icon: {main_png_path}")
         
         # Generate favicon
         print("  🌐 Creating favicon...")
         favicon = self.designer.create_favicon(32)
         favicon_path = self.public_dir / 'favicon.ico'
         
-        # Save as PNG first, then convert to ICO if ImageMagick available
-        favicon_png_path = self.public_dir / 'favicon.png'
-        favicon.save(favicon_png_path, 'PNG')
-        
-        if IMAGEMAGICK_AVAILABLE:
-            try:
-                subprocess.run([
-                    'convert', str(favicon_png_path), str(favicon_path)
-                ], check=True)
-                favicon_png_path.unlink()  # Remove temporary PNG
-                print(f"  ✅ Saved favicon: {favicon_path}")
-            except subprocess.CalledProcessError:
-                print(f"  ⚠️  ICO conversion failed, kept PNG: {favicon_png_path}")
-        else:
-            print(f"  ✅ Saved favicon as PNG: {favicon_png_path}")
+        # Pillow writes ICO natively - no PNG intermediate or ImageMagick needed
+        favicon.save(favicon_path, format='ICO', sizes=[favicon.size])
+        print(f"  ✅ Saved favicon: {favicon_path}")
         
         # Generate web app icon
-        web_icon = self.designer.create_base_icon(192)
-        web_icon_path = self.public_dir / 'logo192.png'
-        web_icon.save(web_icon_path, 'PNG')
+        if web_icon_stale:
+            web_icon = self._resize_master(master, 192)
+            web_icon.save(web_icon_path, 'PNG', **self.FINAL_PNG_OPTIONS)
+            self._mark_up_to_date(web_icon_path)
+            print(f"  ✅ Saved web app icon: {web_icon_path}")
         generated_files.append(web_icon_path)
-        print(f"  ✅ Saved web app icon: {web_icon_path}")
         
         return generated_files
     
     def generate_ico_file(self, png_files: List[Path]):
-        """Generate Windows ICO file using ImageMagick"""
-        if not IMAGEMAGICK_AVAILABLE:
-            print("  ⚠️  Skipping ICO generation - ImageMagick not available")
-            return None
-        
+        """Generate Windows ICO file using Pillow"""
         print("🪟 Generating Windows ICO file...")
         
         # Use specific sizes for ICO (Windows standard)
         ico_sizes = [16, 24, 32, 48, 64, 128, 256]
-        ico_png_files = []
-        
-        for size in ico_sizes:
-            png_file = self.assets_dir / f'icon_{size}x{size}.png'
-            if png_file.exists():
-                ico_png_files.append(str(png_file))
-        
-        if not ico_png_files:
-            print("  ❌ No PNG files found for ICO generation")
-            return None
         
         ico_path = self.assets_dir / 'icon.ico'
+        if self._is_up_to_date(ico_path):
+            print(f"  ⏭️  {ico_path.name} is up to date")
+            return ico_path
         
         try:
-            cmd = ['convert'] + ico_png_files + [str(ico_path)]
-            subprocess.run(cmd, check=True)
+            # Write the in-memory renders directly - no PNG decode round-trip
+            ico_images = [self._icon_for_size(size) for size in ico_sizes]
+            ico_images[-1].save(
+                ico_path,
+                format='ICO',
+                sizes=[(size, size) for size in ico_sizes],
+                append_images=ico_images[:-1]
+            )
+            self._mark_up_to_date(ico_path)
             print(f"  ✅ Saved Windows icon: {ico_path}")
             return ico_path
-        except subprocess.CalledProcessError as e:
+        except OSError as e:
             print(f"  ❌ ICO generation failed: {e}")
             return None
     
+    # Link errors that mean "hardlinks unavailable here" rather than a real failure
+    _LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP}
+    
+    @classmethod
+    def _link_or_copy(cls, source: Path, target: Path):
+        """Hardlink source to target, copying when linking is not possible"""
+        target.unlink(missing_ok=True)
+        try:
+            # O(1) metadata operation; iconset names share the PNG's inode
+            os.link(source, target)
+        except OSError as e:
+            # Cross-filesystem, link limit, or no hardlink support
+            if e.errno not in cls._LINK_FALLBACK_ERRNOS:
+                raise
+            shutil.copyfile(source, target)
+    
     def generate_icns_file(self, png_files: List[Path]):
-        """Generate macOS ICNS file using ImageMagick"""
+        """Generate macOS ICNS file using Pillow, iconutil or ImageMagick"""
+        print("🍎 Generating macOS ICNS file...")
+        
+        icns_path = self.assets_dir / 'icon.icns'
+        if self._is_up_to_date(icns_path):
+            print(f"  ⏭️  {icns_path.name} is up to date")
+            return icns_path
+        
+        # Write the in-memory renders directly with Pillow when supported
+        try:
+            icns_images = [self._icon_for_size(size) for size in [16, 32, 64, 128, 256, 512, 1024]]
+            icns_images[-1].save(icns_path, format='ICNS', append_images=icns_images[:-1])
+            self._mark_up_to_date(icns_path)
+            print(f"  ✅ Saved macOS icon (Pillow): {icns_path}")
+            return icns_path
+        except (OSError, KeyError, ValueError) as e:
+            print(f"  📦 Pillow ICNS export failed ({e}), trying external tools...")
+        
+        result = self._generate_icns_external(icns_path)
+        if result:
+            self._mark_up_to_date(icns_path)
+        return result
+    
+    def _generate_icns_external(self, icns_path: Path):
+        """Generate macOS ICNS file from the PNGs using iconutil or ImageMagick"""
         if not IMAGEMAGICK_AVAILABLE:
             print("  ⚠️  Skipping ICNS generation - ImageMagick not available")
             return None
         
-        print("🍎 Generating macOS ICNS file...")
-        
         # Create iconset directory structure
         iconset_dir = self.assets_dir / 'icon.iconset'
         iconset_dir.mkdir(exist_ok=True)
@@ -362,16 +599,17 @@ class IconGenerator:
         }
         
         # Copy PNG files to iconset with correct naming
+        iconset_copies = []
         for size, iconset_names in icns_mappings.items():
             source_png = self.assets_dir / f'icon_{size}x{size}.png'
             if source_png.exists():
                 for iconset_name in iconset_names:
-                    iconset_file = iconset_dir / iconset_name
-                    iconset_file.write_bytes(source_png.read_bytes())
+                    iconset_copies.append((source_png, iconset_dir / iconset_name))
         
-        # Generate ICNS using iconutil (macOS) or ImageMagick
-        icns_path = self.assets_dir / 'icon.icns'
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(lambda copy: self._link_or_copy(*copy), iconset_copies))
         
+        # Generate ICNS using iconutil (macOS) or ImageMagick
         # Try iconutil first (native macOS tool)
         try:
             subprocess.run([
@@ -380,7 +618,6 @@ class IconGenerator:
             print(f"  ✅ Saved macOS icon (iconutil): {icns_path}")
             
             # Clean up iconset directory
-            import shutil
             shutil.rmtree(iconset_dir)
             return icns_path
             
@@ -389,28 +626,23 @@ class IconGenerator:
             
             # Fallback to ImageMagick
             try:
-                # Use the largest PNG files for ICNS
-                large_pngs = [
-                    str(self.assets_dir / f'icon_{size}x{size}.png')
-                    for size in [16, 32, 64, 128, 256, 512, 1024]
-                    if (self.assets_dir / f'icon_{size}x{size}.png').exists()
-                ]
+                # Stream every size as one multi-frame TIFF on stdin so
+                # ImageMagick decodes a single input instead of 7 PNG files
+                icns_images = [self._icon_for_size(size) for size in [16, 32, 64, 128, 256, 512, 1024]]
+                frames = io.BytesIO()
+                icns_images[0].save(frames, format='TIFF', save_all=True, append_images=icns_images[1:])
+                
+                subprocess.run(['convert', 'tiff:-', str(icns_path)], input=frames.getvalue(), check=True)
+                print(f"  ✅ Saved macOS icon (ImageMagick): {icns_path}")
                 
-                if large_pngs:
-                    cmd = ['convert'] + large_pngs + [str(icns_path)]
-                    subprocess.run(cmd, check=True)
-                    print(f"  ✅ Saved macOS icon (ImageMagick): {icns_path}")
-                    
-                    # Clean up iconset directory
-                    import shutil
-                    shutil.rmtree(iconset_dir)
-                    return icns_path
+                # Clean up iconset directory
+                shutil.rmtree(iconset_dir)
+                return icns_path
                 
             except subprocess.CalledProcessError as e:
                 print(f"  ❌ ICNS generation failed: {e}")
                 
                 # Clean up iconset directory
-                import shutil
                 shutil.rmtree(iconset_dir)
                 return None
     
@@ -468,7 +700,7 @@ class IconGenerator:
         
         print(f"\n🎉 Icon generation completed! Generated {len(all_files)} files.")
         
-        if not ico_file or not icns_file:
+        if not icns_file:
             print("\n💡 Note: Install ImageMagick for full platform support:")
             print("  macOS: brew install imagemagick")
             print("  Ubuntu: sudo apt-get install imagemagick")
@@ -487,12 +719,23 @@ def main():
                        help="Base directory of the desktop app")
     parser.add_argument("--install-deps", action="store_true",
                        help="Install required dependencies")
+    parser.add_argument("--force", action="store_true",
+                       help="Regenerate icons even if they are up to date")
+    parser.add_argument("--dump-favicon", action="store_true",
+                       help="Print the pre-rendered favicon constants and exit")
     
     args = parser.parse_args()
     
+    if args.dump_favicon:
+        designer = IconDesigner()
+        rgba = designer.draw_favicon(32).tobytes()
+        print(f"_FAVICON_32_DESIGN_HASH = {designer.design_hash!r}")
+        print(f"_FAVICON_32_RGBA = {base64.b64encode(zlib.compress(rgba, 9))!r}")
+        return
+    
     if args.install_deps:
         print("📦 Installing dependencies...")
-        subprocess.run([sys.executable, '-m', 'pip', 'install', 'Pillow'])
+        subprocess.run([sys.executable, '-m', 'pip', 'install', 'Pillow', 'numpy'])
     
     # Verify base directory exists
     base_dir = Path(args.base_dir)
@@ -501,7 +744,7 @@ def main():
         sys.exit(1)
     
     # Generate icons
-    generator = IconGenerator(str(base_dir))
+    generator = IconGenerator(str(base_dir), force=args.force)
     generated_files = generator.generate_all_icons()
     
     print(f"\n✨ Ready! Your Local Web Scraper app now has custom icons.")
@@ -10,24 +10,175 @@ Author: Claude Code Assistant
 Date: December 13, 2024
 """
 
+import json
+import math
 import os
+import struct
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
-import subprocess
+from concurrent.futures import ProcessPoolExecutor
 
 # Check for PIL availability
 try:
+    import PIL
     from PIL import Image, ImageDraw, ImageFont
     from PIL.ImageColor import getrgb
 except ImportError:
     print("❌ Pillow (PIL) not installed. Please install it:")
     print("pip install Pillow")
+    print("   (or the faster drop-in build: pip install pillow-simd)")
     sys.exit(1)
 
+# Pillow-SIMD is an ABI-compatible Pillow build with SSE4/AVX2 kernels for
+# resampling, compositing and encoding; its releases carry a .postN suffix
+PILLOW_SIMD = '.post' in PIL.__version__
+
+# Check for NumPy availability (used for vectorized gradients)
+try:
+    import numpy as np
+except ImportError:
+    print("❌ NumPy not installed. Please install it:")
+    print("pip install numpy")
+    sys.exit(1)
+
+# Check for Numba availability (optional JIT for the web pattern rasterizer)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+# The web pattern rasterizer is plain Python that Numba compiles when it is
+# installed, so the artwork is the same with or without it
+def _plot(mask, x, y, value):
+    if 0 <= x < mask.shape[1] and 0 <= y < mask.shape[0]:
+        mask[y, x] = value
+
+
+def _draw_line(mask, x0, y0, x1, y1, value):
+    """Bresenham line between two integer points"""
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    step_x = 1 if x0 < x1 else -1
+    step_y = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        _plot(mask, x0, y0, value)
+        if x0 == x1 and y0 == y1:
+            break
+        err2 = 2 * err
+        if err2 >= dy:
+            err += dy
+            x0 += step_x
+        if err2 <= dx:
+            err += dx
+            y0 += step_y
+
+
+def _draw_circle(mask, cx, cy, radius, value):
+    """Midpoint circle outline"""
+    x = radius
+    y = 0
+    err = 1 - radius
+    while x >= y:
+        _plot(mask, cx + x, cy + y, value)
+        _plot(mask, cx + y, cy + x, value)
+        _plot(mask, cx - y, cy + x, value)
+        _plot(mask, cx - x, cy + y, value)
+        _plot(mask, cx - x, cy - y, value)
+        _plot(mask, cx - y, cy - x, value)
+        _plot(mask, cx + y, cy - x, value)
+        _plot(mask, cx + x, cy - y, value)
+        y += 1
+        if err < 0:
+            err += 2 * y + 1
+        else:
+            x -= 1
+            err += 2 * (y - x) + 1
+
+
+def _rasterize_web_pattern(mask, centers, half_size, radii, cos_tab, sin_tab, value):
+    """Draw every web cell's spokes and rings into the coverage mask"""
+    height, width = mask.shape
+    for i in prange(centers.shape[0]):
+        cx = centers[i, 0]
+        cy = centers[i, 1]
+        for k in range(cos_tab.shape[0]):
+            end_x = cx + half_size * cos_tab[k]
+            end_y = cy + half_size * sin_tab[k]
+            if 0 <= end_x <= width and 0 <= end_y <= height:
+                _draw_line(mask, cx, cy, int(round(end_x)), int(round(end_y)), value)
+        for radius in radii:
+            if cx + radius >= 0 and cx - radius <= width and cy + radius >= 0 and cy - radius <= height:
+                _draw_circle(mask, cx, cy, radius, value)
+
+
+if NUMBA_AVAILABLE:
+    # Rebound before first use so the compiled callers resolve compiled helpers
+    _plot = njit(cache=True)(_plot)
+    _draw_line = njit(cache=True)(_draw_line)
+    _draw_circle = njit(cache=True)(_draw_circle)
+    _rasterize_web_pattern = njit(parallel=True, cache=True)(_rasterize_web_pattern)
+
+
+# Font used for the DMG background captions (present on macOS only)
+DMG_FONT_PATH = "/System/Library/Fonts/Helvetica.ttc"
+
+
+@lru_cache(maxsize=16)
+def _load_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), falling back to the default font
+    
+    The default font honours ``size`` on Pillow 10.1+; older releases only
+    have a fixed-size bitmap font, see ``_font_scales``.
+    """
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        pass
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _font_scales(path: str) -> bool:
+    """Whether ``_load_font(path, size)`` actually renders at the requested size"""
+    return isinstance(_load_font(path, 24), ImageFont.FreeTypeFont)
+
+
+def _write_bmp24(path: Path, pixels: np.ndarray):
+    """Write an (H, W, 3) uint8 RGB array as an uncompressed 24-bit BMP
+    
+    Same layout Pillow's BMP encoder produces: file and info headers, then
+    bottom-up BGR rows padded to 4 bytes, tagged 96 dpi.
+    """
+    height, width, _ = pixels.shape
+    stride = (width * 3 + 3) & ~3
+    image_size = stride * height
+    pixels_per_meter = 3780  # 96 dpi
+    
+    rows = np.zeros((height, stride), dtype=np.uint8)
+    rows[:, :width * 3] = pixels[::-1, :, ::-1].reshape(height, width * 3)
+    
+    file_header = struct.pack('<2sIHHI', b'BM', 54 + image_size, 0, 0, 54)
+    info_header = struct.pack('<IiiHHIIiiII', 40, width, height, 1, 24, 0, image_size,
+                              pixels_per_meter, pixels_per_meter, 0, 0)
+    with open(path, 'wb') as f:
+        f.write(file_header)
+        f.write(info_header)
+        f.write(rows.tobytes())
+
+
 class InstallerAssetGenerator:
     """Generates professional installer assets for all platforms"""
     
+    PNG_SAVE_OPTIONS = {'compress_level': 1, 'optimize': False}
+    
     def __init__(self, base_dir: str):
         self.base_dir = Path(base_dir)
         self.assets_dir = self.base_dir / 'assets'
@@ -47,57 +198,65 @@ class InstallerAssetGenerator:
             'gray': '#6b7280',         # Gray-500
             'light_gray': '#f3f4f6'    # Gray-100
         }
+        
+        # Parse hex colors once instead of on every draw call
+        self.rgb = {name: getrgb(value) for name, value in self.colors.items()}
+    
+    @staticmethod
+    def _gradient_image(width: int, height: int, colors: np.ndarray, vertical: bool) -> Image.Image:
+        """Build an RGB image from one color per row (vertical) or column
+        
+        ``colors`` is a float array of shape (height, 3) or (width, 3); values
+        are truncated to uint8 like the int() conversions they replace.
+        """
+        ramp = colors.astype(np.uint8)
+        if vertical:
+            pixels = np.broadcast_to(ramp[:, None, :], (height, width, 3))
+        else:
+            pixels = np.broadcast_to(ramp[None, :, :], (height, width, 3))
+        return Image.fromarray(np.ascontiguousarray(pixels), 'RGB')
     
-    def create_dmg_background(self, width: int = 660, height: int = 400) -> Image.Image:
-        """Create macOS DMG background image"""
+    def create_dmg_background(self, width: int = 660, height: int = 400, scale: float = 1.0) -> Image.Image:
+        """Create macOS DMG background image
+        
+        ``scale`` is the pixel density: 2.0 lays out the 1x design at Retina
+        resolution (fonts, offsets and web pattern doubled).
+        """
         print("🍎 Creating macOS DMG background...")
         
-        # Create gradient background
-        img = Image.new('RGB', (width, height), getrgb(self.colors['background']))
+        # Create subtle gradient (rows share the light gray fill; the alpha
+        # ramp never reached the RGB image, so every row is the same color)
+        row_colors = np.tile(np.array(self.rgb['light_gray'], dtype=np.float64), (height, 1))
+        img = self._gradient_image(width, height, row_colors, vertical=True)
         draw = ImageDraw.Draw(img)
         
-        # Create subtle gradient
-        for y in range(height):
-            alpha = int(255 * (1 - (y / height) * 0.1))
-            color = (*getrgb(self.colors['light_gray']), alpha)
-            draw.line([(0, y), (width, y)], fill=color[:3])
-        
         # Add decorative elements
-        self._add_spider_web_pattern(draw, width, height, alpha=30)
+        self._add_spider_web_pattern(img, width, height, alpha=30, scale=scale)
         
-        # Add instruction text
-        try:
-            # Try to use system font
-            font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
-            font_medium = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-        except:
-            # Fallback to default font
-            font_large = ImageFont.load_default()
-            font_medium = ImageFont.load_default()
+        # Add instruction text (system font, falling back to the default font)
+        font_large = _load_font(DMG_FONT_PATH, round(24 * scale))
+        font_medium = _load_font(DMG_FONT_PATH, round(16 * scale))
+        shadow_offset = round(scale)
         
         # Main instruction
         instruction_text = "Drag Local Web Scraper to Applications"
-        text_bbox = draw.textbbox((0, 0), instruction_text, font=font_large)
-        text_width = text_bbox[2] - text_bbox[0]
+        text_width = int(font_large.getlength(instruction_text))
         text_x = (width - text_width) // 2
-        text_y = height - 80
+        text_y = height - round(80 * scale)
         
-        # Text shadow
-        draw.text((text_x + 1, text_y + 1), instruction_text, 
-                 fill=getrgb(self.colors['gray']), font=font_large)
-        # Main text
-        draw.text((text_x, text_y), instruction_text, 
-                 fill=getrgb(self.colors['dark']), font=font_large)
+        # Main text with shadow
+        self._draw_shadowed_text(img, (text_x, text_y), instruction_text, font_large,
+                                 fill=self.rgb['dark'], shadow_fill=self.rgb['gray'],
+                                 offset=shadow_offset)
         
         # Secondary instruction
         sub_text = "AI-powered web scraping made simple"
-        sub_bbox = draw.textbbox((0, 0), sub_text, font=font_medium)
-        sub_width = sub_bbox[2] - sub_bbox[0]
+        sub_width = int(font_medium.getlength(sub_text))
         sub_x = (width - sub_width) // 2
-        sub_y = text_y + 35
+        sub_y = text_y + round(35 * scale)
         
         draw.text((sub_x, sub_y), sub_text, 
-                 fill=getrgb(self.colors['gray']), font=font_medium)
+                 fill=self.rgb['gray'], font=font_medium)
         
         return img
     
@@ -105,38 +264,27 @@ class InstallerAssetGenerator:
         """Create Windows installer header bitmap"""
         print("🪟 Creating Windows installer header...")
         
-        # Create gradient background
-        img = Image.new('RGB', (width, height), getrgb(self.colors['primary']))
-        draw = ImageDraw.Draw(img)
-        
-        # Gradient effect
-        for x in range(width):
-            gradient_factor = x / width
-            r, g, b = getrgb(self.colors['primary'])
-            darker_r = int(r * (0.7 + gradient_factor * 0.3))
-            darker_g = int(g * (0.7 + gradient_factor * 0.3))
-            darker_b = int(b * (0.7 + gradient_factor * 0.3))
-            
-            draw.line([(x, 0), (x, height)], fill=(darker_r, darker_g, darker_b))
+        # Gradient effect: precompute the (width, 3) column LUT once, darker
+        # on the left, and broadcast it down every row
+        r, g, b = self.rgb['primary']
+        factor = 0.7 + np.arange(width) / width * 0.3
+        column_lut = np.stack([r * factor, g * factor, b * factor], axis=-1)
+        img = self._gradient_image(width, height, column_lut, vertical=False)
         
         # Add spider web pattern
-        self._add_spider_web_pattern(draw, width, height, alpha=40, scale=0.3)
+        self._add_spider_web_pattern(img, width, height, alpha=40, scale=0.3)
         
         # Add title text
-        try:
-            font = ImageFont.truetype("arial.ttf", 18)
-        except:
-            font = ImageFont.load_default()
+        font = _load_font("arial.ttf", 18)
         
         title = "Local Web Scraper"
-        text_bbox = draw.textbbox((0, 0), title, font=font)
-        text_height = text_bbox[3] - text_bbox[1]
+        _, text_top, _, text_bottom = font.getbbox(title)
+        text_height = text_bottom - text_top
         text_y = (height - text_height) // 2
         
-        # Text shadow
-        draw.text((21, text_y + 1), title, fill=(0, 0, 0, 100), font=font)
-        # Main text
-        draw.text((20, text_y), title, fill=getrgb(self.colors['background']), font=font)
+        # Main text with shadow
+        self._draw_shadowed_text(img, (20, text_y), title, font,
+                                 fill=self.rgb['background'], shadow_fill=(0, 0, 0, 100))
         
         return img
     
@@ -144,22 +292,15 @@ class InstallerAssetGenerator:
         """Create Windows installer sidebar image"""
         print("🪟 Creating Windows installer sidebar...")
         
-        # Create gradient background
-        img = Image.new('RGB', (width, height), getrgb(self.colors['primary_dark']))
+        # Vertical gradient (lighter towards the bottom, one color per row)
+        base = np.array(self.rgb['primary_dark'], dtype=np.float64)
+        gradient_factor = np.arange(height) / height
+        row_colors = base + np.outer(gradient_factor * 0.1, 255 - base)
+        img = self._gradient_image(width, height, row_colors, vertical=True)
         draw = ImageDraw.Draw(img)
         
-        # Vertical gradient
-        for y in range(height):
-            gradient_factor = y / height
-            r, g, b = getrgb(self.colors['primary_dark'])
-            lighter_r = int(r + (255 - r) * gradient_factor * 0.1)
-            lighter_g = int(g + (255 - g) * gradient_factor * 0.1)
-            lighter_b = int(b + (255 - b) * gradient_factor * 0.1)
-            
-            draw.line([(0, y), (width, y)], fill=(lighter_r, lighter_g, lighter_b))
-        
         # Add decorative pattern
-        self._add_spider_web_pattern(draw, width, height, alpha=20, scale=0.5)
+        self._add_spider_web_pattern(img, width, height, alpha=20, scale=0.5)
         
         # Add app logo area (simplified icon)
         logo_size = 48
@@ -171,76 +312,141 @@ class InstallerAssetGenerator:
             logo_x, logo_y,
             logo_x + logo_size, logo_y + logo_size
         ]
-        draw.ellipse(logo_bbox, fill=getrgb(self.colors['accent']))
+        draw.ellipse(logo_bbox, fill=self.rgb['accent'])
         
         # Simple spider web in logo
         center_x = logo_x + logo_size // 2
         center_y = logo_y + logo_size // 2
         web_radius = logo_size // 3
         
-        # Web lines
-        for angle in range(0, 360, 60):
-            import math
-            end_x = center_x + web_radius * math.cos(math.radians(angle))
-            end_y = center_y + web_radius * math.sin(math.radians(angle))
-            draw.line([(center_x, center_y), (end_x, end_y)], 
-                     fill=getrgb(self.colors['background']), width=2)
+        # Web lines: opposite spokes (0/180, 60/240, 120/300 degrees) share a
+        # diameter, so draw three lines through the center instead of six
+        angles = [math.radians(angle) for angle in range(0, 180, 60)]
+        cos_tab = [math.cos(angle) for angle in angles]
+        sin_tab = [math.sin(angle) for angle in angles]
+        for dir_x, dir_y in zip(cos_tab, sin_tab):
+            offset_x = web_radius * dir_x
+            offset_y = web_radius * dir_y
+            draw.line([(center_x - offset_x, center_y - offset_y),
+                       (center_x + offset_x, center_y + offset_y)],
+                     fill=self.rgb['background'], width=2)
         
         # Add version info at bottom
-        try:
-            font_small = ImageFont.truetype("arial.ttf", 10)
-        except:
-            font_small = ImageFont.load_default()
+        font_small = _load_font("arial.ttf", 10)
         
         version_text = "v1.0.0"
-        version_bbox = draw.textbbox((0, 0), version_text, font=font_small)
-        version_width = version_bbox[2] - version_bbox[0]
+        version_width = int(font_small.getlength(version_text))
         version_x = (width - version_width) // 2
         version_y = height - 30
         
         draw.text((version_x, version_y), version_text, 
-                 fill=getrgb(self.colors['background']), font=font_small)
+                 fill=self.rgb['background'], font=font_small)
         
         return img
     
-    def _add_spider_web_pattern(self, draw, width: int, height: int, alpha: int = 30, scale: float = 1.0):
-        """Add subtle spider web pattern to image"""
-        import math
+    @staticmethod
+    def _draw_shadowed_text(img: Image.Image, position: Tuple[int, int], text: str, font,
+                            fill, shadow_fill, offset: int = 1):
+        """Draw text over a drop shadow offset by ``offset`` pixels
+        
+        The glyphs are rasterized once into a coverage tile which is then
+        pasted twice, once per tint.
+        """
+        left, top, right, bottom = ImageDraw.Draw(img).textbbox(position, text, font=font)
+        tile = Image.new('L', (right - left, bottom - top), 0)
+        ImageDraw.Draw(tile).text((position[0] - left, position[1] - top), text, fill=255, font=font)
+        
+        img.paste(shadow_fill, (left + offset, top + offset), tile)
+        img.paste(fill, (left, top), tile)
+    
+    def _add_spider_web_pattern(self, img: Image.Image, width: int, height: int, alpha: int = 30, scale: float = 1.0):
+        """Add subtle spider web pattern to image
         
+        The pattern's coverage mask is pasted onto ``img`` in place, so
+        ImageDraw handles on ``img`` remain valid.
+        """
+        img.paste(self.rgb['primary'], mask=self._web_pattern_mask(width, height, alpha, scale))
+    
+    @staticmethod
+    def _web_pattern_mask(width: int, height: int, alpha: int = 30, scale: float = 1.0) -> Image.Image:
+        """Rasterize the spider web pattern into an 'L' coverage mask"""
         # Scale pattern
         web_size = int(100 * scale)
         spacing = int(120 * scale)
+        half_size = web_size // 2
+        radii = [web_size // 6, web_size // 4, web_size // 3]
+        
+        angles = np.radians(np.arange(0, 360, 45))
+        cos_tab = np.cos(angles)
+        sin_tab = np.sin(angles)
+        
+        # Create web pattern across the image. Nothing in a cell reaches
+        # further than half_size from its center, so the grid is clipped up
+        # front to cells that can touch the frame instead of testing each one.
+        reach = min(50, half_size)
+        first_center = -web_size + half_size
+        
+        def grid_centers(extent: int) -> range:
+            skipped = max(0, -((first_center + reach) // spacing))
+            return range(first_center + skipped * spacing, extent + reach + 1, spacing)
+        
+        centers = [
+            (center_x, center_y)
+            for center_x in grid_centers(width)
+            for center_y in grid_centers(height)
+        ]
         
-        # Create web pattern across the image
-        for start_x in range(-web_size, width + web_size, spacing):
-            for start_y in range(-web_size, height + web_size, spacing):
-                center_x = start_x + web_size // 2
-                center_y = start_y + web_size // 2
-                
-                # Skip if center is outside image
-                if center_x < -50 or center_x > width + 50 or center_y < -50 or center_y > height + 50:
-                    continue
-                
-                # Draw radial lines
-                for angle in range(0, 360, 45):
-                    end_x = center_x + (web_size // 2) * math.cos(math.radians(angle))
-                    end_y = center_y + (web_size // 2) * math.sin(math.radians(angle))
-                    
-                    if 0 <= end_x <= width and 0 <= end_y <= height:
-                        draw.line([(center_x, center_y), (end_x, end_y)], 
-                                fill=(*getrgb(self.colors['primary']), alpha)[:3], width=1)
-                
-                # Draw concentric circles
-                for radius in [web_size // 6, web_size // 4, web_size // 3]:
-                    circle_bbox = [
-                        center_x - radius, center_y - radius,
-                        center_x + radius, center_y + radius
-                    ]
-                    
-                    # Only draw if at least part of circle is visible
-                    if (circle_bbox[2] >= 0 and circle_bbox[0] <= width and 
-                        circle_bbox[3] >= 0 and circle_bbox[1] <= height):
-                        draw.ellipse(circle_bbox, outline=(*getrgb(self.colors['primary']), alpha)[:3], width=1)
+        # Coverage doubles as opacity: the primary color is blended in at
+        # ``alpha`` rather than painted solid
+        coverage = alpha
+        
+        mask = np.zeros((height, width), dtype=np.uint8)
+        _rasterize_web_pattern(
+            mask,
+            np.array(centers, dtype=np.int64).reshape(-1, 2),
+            half_size,
+            np.array(radii, dtype=np.int64),
+            cos_tab,
+            sin_tab,
+            coverage
+        )
+        return Image.fromarray(mask, 'L')
+    
+    def _save_dmg_backgrounds(self) -> List[Tuple[str, Path]]:
+        """Render and save the macOS DMG backgrounds (@1x and @2x)"""
+        # Render once at Retina density and downsample for @1x instead of
+        # rasterizing the whole design twice. A fixed-size fallback font would
+        # come out at half size after the downsample, so then render @1x directly
+        dmg_bg_2x = self.create_dmg_background(1320, 800, scale=2.0)
+        if _font_scales(DMG_FONT_PATH):
+            dmg_bg = dmg_bg_2x.resize((660, 400), Image.LANCZOS)
+        else:
+            dmg_bg = self.create_dmg_background(660, 400)
+        
+        # Installer artwork is rebuilt rarely and size barely matters, so use
+        # the fastest zlib level rather than Pillow's default of 6
+        dmg_bg_path = self.installer_assets_dir / 'dmg-background.png'
+        dmg_bg.save(dmg_bg_path, 'PNG', **self.PNG_SAVE_OPTIONS)
+        
+        # DMG background @2x for Retina
+        dmg_bg_2x_path = self.installer_assets_dir / 'dmg-background@2x.png'
+        dmg_bg_2x.save(dmg_bg_2x_path, 'PNG', **self.PNG_SAVE_OPTIONS)
+        
+        return [("DMG background", dmg_bg_path), ("DMG background @2x", dmg_bg_2x_path)]
+    
+    def _save_windows_header(self) -> List[Tuple[str, Path]]:
+        """Render and save the Windows installer header bitmap"""
+        win_header = self.create_windows_installer_header()
+        win_header_path = self.installer_assets_dir / 'installer-header.bmp'
+        _write_bmp24(win_header_path, np.asarray(win_header))
+        return [("Windows header", win_header_path)]
+    
+    def _save_windows_sidebar(self) -> List[Tuple[str, Path]]:
+        """Render and save the Windows installer sidebar bitmap"""
+        win_sidebar = self.create_windows_installer_sidebar()
+        win_sidebar_path = self.installer_assets_dir / 'installer-sidebar.bmp'
+        _write_bmp24(win_sidebar_path, np.asarray(win_sidebar))
+        return [("Windows sidebar", win_sidebar_path)]
     
     def create_linux_desktop_file(self) -> str:
         """Create Linux .desktop file content"""
@@ -274,33 +480,18 @@ Icon=local-web-scraper
         
         generated_files = []
         
-        # macOS DMG background
-        dmg_bg = self.create_dmg_background()
-        dmg_bg_path = self.installer_assets_dir / 'dmg-background.png'
-        dmg_bg.save(dmg_bg_path, 'PNG')
-        generated_files.append(dmg_bg_path)
-        print(f"  ✅ DMG background: {dmg_bg_path.relative_to(self.base_dir)}")
-        
-        # DMG background @2x for Retina
-        dmg_bg_2x = self.create_dmg_background(1320, 800)
-        dmg_bg_2x_path = self.installer_assets_dir / 'dmg-background@2x.png'
-        dmg_bg_2x.save(dmg_bg_2x_path, 'PNG')
-        generated_files.append(dmg_bg_2x_path)
-        print(f"  ✅ DMG background @2x: {dmg_bg_2x_path.relative_to(self.base_dir)}")
-        
-        # Windows installer header
-        win_header = self.create_windows_installer_header()
-        win_header_path = self.installer_assets_dir / 'installer-header.bmp'
-        win_header.save(win_header_path, 'BMP')
-        generated_files.append(win_header_path)
-        print(f"  ✅ Windows header: {win_header_path.relative_to(self.base_dir)}")
-        
-        # Windows installer sidebar
-        win_sidebar = self.create_windows_installer_sidebar()
-        win_sidebar_path = self.installer_assets_dir / 'installer-sidebar.bmp'
-        win_sidebar.save(win_sidebar_path, 'BMP')
-        generated_files.append(win_sidebar_path)
-        print(f"  ✅ Windows sidebar: {win_sidebar_path.relative_to(self.base_dir)}")
+        # Raster assets are independent CPU-bound renders; draw them on
+        # separate processes (each worker saves its own files to avoid
+        # pickling images back)
+        render_tasks = ['_save_dmg_backgrounds', '_save_windows_header', '_save_windows_sidebar']
+        max_workers = min(len(render_tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_render_installer_asset,
+                                   [str(self.base_dir)] * len(render_tasks), render_tasks)
+            for saved in results:
+                for label, path in saved:
+                    generated_files.append(path)
+                    print(f"  ✅ {label}: {path.relative_to(self.base_dir)}")
         
         # Linux desktop file
         desktop_content = self.create_linux_desktop_file()
@@ -343,17 +534,10 @@ Icon=local-web-scraper
         
         package_path = self.base_dir / 'package.json'
         
-        # Check if jq is available
-        try:
-            subprocess.run(['which', 'jq'], check=True, capture_output=True)
-        except subprocess.CalledProcessError:
-            print("  ⚠️  jq not found - manual package.json update required")
-            self._show_manual_package_config()
-            return
-        
-        # Backup original
-        backup_path = package_path.with_suffix('.json.backup-installer')
-        backup_path.write_bytes(package_path.read_bytes())
+        # The original file is only replaced once the new content is fully
+        # written, so a failed update leaves it untouched and no backup copy
+        # is needed
+        tmp_path = package_path.with_suffix('.json.tmp')
         
         try:
             # macOS DMG configuration
@@ -394,13 +578,8 @@ Icon=local-web-scraper
                 "Keywords": "scraping;web;data;ai;automation;"
             }
             
-            # Update package.json using jq
-            import json
-            import tempfile
-            
             # Read current package.json
-            with open(package_path, 'r') as f:
-                package_data = json.load(f)
+            package_data = json.loads(package_path.read_text())
             
             # Update build configuration
             if 'build' not in package_data:
@@ -425,17 +604,15 @@ Icon=local-web-scraper
                 {"target": "rpm", "arch": ["x64"]}
             ]
             
-            # Write updated package.json
-            with open(package_path, 'w') as f:
-                json.dump(package_data, f, indent=2)
+            # Write updated package.json next to the original, then swap it in
+            tmp_path.write_text(json.dumps(package_data, indent=2))
+            os.replace(tmp_path, package_path)
             
             print(f"  ✅ Updated package.json")
-            print(f"  📋 Backup saved: {backup_path.relative_to(self.base_dir)}")
             
         except Exception as e:
             print(f"  ❌ Failed to update package.json: {e}")
-            # Restore backup
-            package_path.write_bytes(backup_path.read_bytes())
+            tmp_path.unlink(missing_ok=True)
             self._show_manual_package_config()
     
     def _show_manual_package_config(self):
@@ -494,6 +671,12 @@ Icon=local-web-scraper
         print(config_text)
 
 
+def _render_installer_asset(base_dir: str, method_name: str) -> List[Tuple[str, Path]]:
+    """Process pool entry point: render one asset group and save it to disk"""
+    generator = InstallerAssetGenerator(base_dir)
+    return getattr(generator, method_name)()
+
+
 def main():
     """Main function to generate installer assets"""
     import argparse
@@ -507,6 +690,10 @@ def main():
     
     args = parser.parse_args()
     
+    if not PILLOW_SIMD:
+        print("💡 Using stock Pillow - for faster image generation install Pillow-SIMD:")
+        print("   pip uninstall pillow && pip install pillow-simd")
+    
     # Verify base directory exists
     base_dir = Path(args.base_dir)
     if not base_dir.exists():
@@ -5,95 +5,102 @@ HTML Analysis → Scraping Strategy Generation
 """
 
 import asyncio
+import functools
+import io
+import mmap
+import sys
 import time
+from pathlib import Path
+
 from iwsa.config import Settings
 from iwsa.llm.hub import LLMHub
+from iwsa.utils.helpers import install_uvloop
+
+
+DATA_DIR = Path(__file__).parent / "data"
+
+# Concurrent strategy requests allowed during the benchmark
+BENCHMARK_CONCURRENCY = 5
+
+HEALTH_ICONS = {"healthy": "✅", "degraded": "⚠️", "unavailable": "❌", "timeout": "⏱️", "error": "💥"}
+
+
+def load_example_html(name):
+    """Read an example page from examples/data through a read-only mmap"""
+    with open(DATA_DIR / name, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[:].decode("utf-8")
+
+
+def flush_output(buffer):
+    """Write a buffered section to stdout in one call and reset the buffer"""
+    sys.stdout.write(buffer.getvalue())
+    sys.stdout.flush()
+    buffer.seek(0)
+    buffer.truncate()
+
+
+def _format_provider_status(status_dict):
+    """Render provider availability/priority as one block of lines"""
+    return "\n".join(
+        f"  {'✅' if s['available'] else '❌'} {p.upper():<12} (Priority: {s.get('priority', -1)}, CB: {s['circuit_breaker_state']})"
+        for p, s in status_dict.items()
+    )
+
+
+def _format_provider_health(providers):
+    """Render per-provider health check results as one block of lines"""
+    lines = []
+    for provider, status in providers.items():
+        lines.append(f"  {HEALTH_ICONS.get(status['status'], '❓')} {provider.upper()}: {status['status']}")
+        if "response_time" in status:
+            lines.append(f"     Response Time: {status['response_time']:.2f}s")
+        if status.get("error"):
+            lines.append(f"     Error: {status['error']}")
+    return "\n".join(lines)
 
 
 async def main():
     """Demonstrate the simplified LLM system"""
+    # Output is buffered and written once per section
+    out = io.StringIO()
+    write = functools.partial(print, file=out)
     
-    print("🤖 Single-Purpose LLM System Demo")
-    print("=" * 50)
+    write("🤖 Single-Purpose LLM System Demo")
+    write("=" * 50)
     
     # Initialize settings and LLM hub
     settings = Settings()
     llm_hub = LLMHub(settings)
     
     # Example HTML content (job listing page)
-    html_content = """
-    <html>
-    <body>
-        <div class="job-listings">
-            <div class="job-card" data-job-id="1">
-                <h3 class="job-title">Senior Python Developer</h3>
-                <div class="company-name">TechCorp Inc.</div>
-                <div class="location">San Francisco, CA</div>
-                <div class="salary">$120,000 - $150,000</div>
-                <div class="job-type">Full-time</div>
-                <p class="description">Looking for an experienced Python developer...</p>
-            </div>
-            <div class="job-card" data-job-id="2">
-                <h3 class="job-title">Data Scientist</h3>
-                <div class="company-name">DataFlow Analytics</div>
-                <div class="location">Remote</div>
-                <div class="salary">$100,000 - $130,000</div>
-                <div class="job-type">Full-time</div>
-                <p class="description">Join our data science team...</p>
-            </div>
-        </div>
-        
-        <div class="pagination">
-            <a href="?page=1" class="page-link current">1</a>
-            <a href="?page=2" class="page-link">2</a>
-            <a href="?page=3" class="page-link">3</a>
-            <a href="?page=next" class="next-btn">Next →</a>
-        </div>
-        
-        <div class="filters">
-            <select id="location-filter">
-                <option value="">All Locations</option>
-                <option value="san-francisco">San Francisco</option>
-                <option value="remote">Remote</option>
-            </select>
-            <select id="salary-filter">
-                <option value="">All Salaries</option>
-                <option value="100k+">$100k+</option>
-                <option value="150k+">$150k+</option>
-            </select>
-        </div>
-    </body>
-    </html>
-    """
+    html_content = load_example_html("job_listings.html")
     
     # User intent
     user_intent = "Extract job listings with title, company, location, salary, and job type"
     url = "https://example-jobs.com/listings"
     extraction_fields = ["title", "company", "location", "salary", "job_type"]
     
-    print(f"📄 Analyzing HTML content ({len(html_content)} chars)")
-    print(f"🎯 User Intent: {user_intent}")
-    print(f"🔗 URL: {url}")
-    print(f"📋 Fields: {', '.join(extraction_fields)}")
-    print()
+    write(f"📄 Analyzing HTML content ({len(html_content)} chars)")
+    write(f"🎯 User Intent: {user_intent}")
+    write(f"🔗 URL: {url}")
+    write(f"📋 Fields: {', '.join(extraction_fields)}")
+    write()
     
     # Check provider status
-    print("🔍 Provider Status:")
-    provider_status = llm_hub.get_provider_status()
-    for provider, status in provider_status.items():
-        available = "✅" if status["available"] else "❌"
-        priority = status.get("priority", -1)
-        print(f"  {available} {provider.upper():<12} (Priority: {priority}, CB: {status['circuit_breaker_state']})")
-    print()
+    write("🔍 Provider Status:")
+    write(_format_provider_status(llm_hub.get_provider_status()))
+    write()
     
     # Estimate cost
     estimated_cost = llm_hub.estimate_cost(html_content, user_intent)
-    print(f"💰 Estimated Cost: ${estimated_cost:.4f}")
-    print()
+    write(f"💰 Estimated Cost: ${estimated_cost:.4f}")
+    write()
     
     # Generate scraping strategy
-    print("🧠 Generating Scraping Strategy...")
-    start_time = time.time()
+    write("🧠 Generating Scraping Strategy...")
+    flush_output(out)
+    start_time = time.perf_counter()
     
     strategy = await llm_hub.generate_scraping_strategy(
         html_content=html_content,
@@ -102,70 +109,66 @@ async def main():
         extraction_fields=extraction_fields
     )
     
-    response_time = time.time() - start_time
+    response_time = time.perf_counter() - start_time
     
     # Display results
-    print(f"⏱️  Response Time: {response_time:.2f}s")
-    print(f"🎯 Success: {strategy.success}")
-    print(f"🤖 Provider Used: {strategy.provider_used.upper()}")
-    print(f"💰 Actual Cost: ${strategy.cost:.4f}")
-    print(f"📊 Confidence: {strategy.confidence_score:.2f}")
-    print()
+    write(f"⏱️  Response Time: {response_time:.2f}s")
+    write(f"🎯 Success: {strategy.success}")
+    write(f"🤖 Provider Used: {strategy.provider_used.upper()}")
+    write(f"💰 Actual Cost: ${strategy.cost:.4f}")
+    write(f"📊 Confidence: {strategy.confidence_score:.2f}")
+    write()
     
     if strategy.success:
-        print("📋 SCRAPING STRATEGY:")
-        print("-" * 30)
+        write("📋 SCRAPING STRATEGY:")
+        write("-" * 30)
         
-        print("🎯 CSS Selectors:")
+        write("🎯 CSS Selectors:")
         for i, selector in enumerate(strategy.selectors, 1):
-            print(f"  {i}. {selector}")
-        print()
+            write(f"  {i}. {selector}")
+        write()
         
-        print("🔄 Extraction Logic:")
-        print(f"  {strategy.extraction_logic}")
-        print()
+        write("🔄 Extraction Logic:")
+        write(f"  {strategy.extraction_logic}")
+        write()
         
         if strategy.pagination_strategy:
-            print("📄 Pagination Strategy:")
+            write("📄 Pagination Strategy:")
             pag = strategy.pagination_strategy
-            print(f"  Type: {pag.get('type', 'unknown')}")
-            print(f"  Selectors: {pag.get('selectors', [])}")
-            print(f"  Logic: {pag.get('logic', 'N/A')}")
-            print()
+            write(f"  Type: {pag.get('type', 'unknown')}")
+            write(f"  Selectors: {pag.get('selectors', [])}")
+            write(f"  Logic: {pag.get('logic', 'N/A')}")
+            write()
         
         if strategy.filters:
-            print("🔧 Detected Filters:")
+            write("🔧 Detected Filters:")
             for i, filter_item in enumerate(strategy.filters, 1):
-                print(f"  {i}. {filter_item.get('name', 'Unknown')} ({filter_item.get('type', 'unknown')})")
-                print(f"     Selector: {filter_item.get('selector', 'N/A')}")
-            print()
+                write(f"  {i}. {filter_item.get('name', 'Unknown')} ({filter_item.get('type', 'unknown')})")
+                write(f"     Selector: {filter_item.get('selector', 'N/A')}")
+            write()
         
         if strategy.error_handling:
-            print("⚠️  Error Handling:")
+            write("⚠️  Error Handling:")
             for i, strategy_item in enumerate(strategy.error_handling, 1):
-                print(f"  {i}. {strategy_item}")
-            print()
+                write(f"  {i}. {strategy_item}")
+            write()
         
-        print("💭 AI Reasoning:")
-        print(f"  {strategy.reasoning}")
+        write("💭 AI Reasoning:")
+        write(f"  {strategy.reasoning}")
         
     else:
-        print("❌ STRATEGY GENERATION FAILED:")
-        print(f"   Reason: {strategy.reasoning}")
+        write("❌ STRATEGY GENERATION FAILED:")
+        write(f"   Reason: {strategy.reasoning}")
     
-    print()
-    print("🔍 Health Check:")
+    write()
+    write("🔍 Health Check:")
+    flush_output(out)
     health = await llm_hub.health_check()
-    print(f"  Overall Health: {health['overall_health'].upper()}")
-    print(f"  Primary Provider: {health.get('primary_provider', 'None').upper()}")
-    
-    for provider, status in health["providers"].items():
-        health_icon = {"healthy": "✅", "degraded": "⚠️", "unavailable": "❌", "timeout": "⏱️", "error": "💥"}.get(status["status"], "❓")
-        print(f"  {health_icon} {provider.upper()}: {status['status']}")
-        if "response_time" in status:
-            print(f"     Response Time: {status['response_time']:.2f}s")
-        if status.get("error"):
-            print(f"     Error: {status['error']}")
+    write(f"  Overall Health: {health['overall_health'].upper()}")
+    write(f"  Primary Provider: {health.get('primary_provider', 'None').upper()}")
+    if health["providers"]:
+        write(_format_provider_health(health["providers"]))
+    flush_output(out)
 
 
 async def demonstrate_provider_fallback():
@@ -202,8 +205,10 @@ async def demonstrate_provider_fallback():
     # Show final provider status
     status = llm_hub.get_provider_status()
     print("\nFinal Provider Status:")
-    for provider, info in status.items():
-        print(f"  {provider.upper()}: {info['circuit_breaker_state']} (failures: {info['failure_count']})")
+    print("\n".join(
+        f"  {provider.upper()}: {info['circuit_breaker_state']} (failures: {info['failure_count']})"
+        for provider, info in status.items()
+    ))
 
 
 async def benchmark_performance():
@@ -221,38 +226,55 @@ async def benchmark_performance():
         ("Large", "<div class='items'>" + "<div class='item'><h1>Title</h1><p>Long description with more content</p></div>" * 50 + "</div>")
     ]
     
-    results = []
-    
     for size_name, html in test_cases:
         print(f"Testing {size_name} HTML ({len(html)} chars)...")
+    
+    # The cases are independent, so run them concurrently (bounded)
+    semaphore = asyncio.Semaphore(BENCHMARK_CONCURRENCY)
+    
+    async def run_case(size_name, html):
+        async with semaphore:
+            start_time = time.perf_counter()
+            # A zero latency budget skips the batching window, so each case
+            # gets its own provider call and its own timing
+            strategy = await llm_hub.generate_scraping_strategy(
+                html_content=html,
+                url="https://example.com",
+                user_intent="Extract items",
+                latency_budget_ms=0
+            )
+            response_time = time.perf_counter() - start_time
         
-        start_time = time.time()
-        strategy = await llm_hub.generate_scraping_strategy(
-            html_content=html,
-            url="https://example.com",
-            user_intent="Extract items"
-        )
-        response_time = time.time() - start_time
-        
-        results.append({
+        print(f"  ✅ {size_name}: {response_time:.2f}s - {strategy.provider_used.upper()}")
+        return {
             "size": size_name,
             "chars": len(html),
             "time": response_time,
             "provider": strategy.provider_used,
             "success": strategy.success,
             "cost": strategy.cost
-        })
-        
-        print(f"  ✅ {response_time:.2f}s - {strategy.provider_used.upper()}")
+        }
+    
+    benchmark_start = time.perf_counter()
+    results = await asyncio.gather(*(run_case(size_name, html) for size_name, html in test_cases))
+    total_time = time.perf_counter() - benchmark_start
     
-    print("\nBenchmark Results:")
-    print("Size    | Chars  | Time    | Provider   | Cost")
-    print("-" * 45)
-    for result in results:
-        print(f"{result['size']:<7} | {result['chars']:<6} | {result['time']:.2f}s   | {result['provider']:<10} | ${result['cost']:.4f}")
+    rows = [
+        f"{result['size']:<7} | {result['chars']:<6} | {result['time']:.2f}s   | {result['provider']:<10} | ${result['cost']:.4f}"
+        for result in results
+    ]
+    sys.stdout.write("\n".join([
+        f"\nBenchmark Results (cases run concurrently, up to {BENCHMARK_CONCURRENCY} at a time):",
+        "Size    | Chars  | Time    | Provider   | Cost",
+        "-" * 45,
+        *rows,
+        f"\nTotal wall-clock: {total_time:.2f}s\n"
+    ]))
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
     asyncio.run(demonstrate_provider_fallback())
     asyncio.run(benchmark_performance())
\ No newline at end of file
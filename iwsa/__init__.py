@@ -7,12 +7,18 @@ __version__ = "1.0.0"
 __author__ = "IWSA Team"
 __email__ = "team@iwsa.dev"
 
-from .core.engine import ScrapingEngine
-from .core.prompt_processor import PromptProcessor
-from .core.reconnaissance import ReconnaissanceEngine
-from .llm.hub import LLMHub
-from .scraper.dynamic_scraper import DynamicScraper
-from .data.pipeline import DataPipeline
+import importlib
+
+# Heavy components are imported on first access (PEP 562) so that
+# `import iwsa` and light CLI commands do not pull in the whole stack
+_LAZY_IMPORTS = {
+    "ScrapingEngine": ".core.engine",
+    "PromptProcessor": ".core.prompt_processor",
+    "ReconnaissanceEngine": ".core.reconnaissance",
+    "LLMHub": ".llm.hub",
+    "DynamicScraper": ".scraper.dynamic_scraper",
+    "DataPipeline": ".data.pipeline",
+}
 
 __all__ = [
     "ScrapingEngine",
@@ -21,4 +27,17 @@ __all__ = [
     "LLMHub",
     "DynamicScraper",
     "DataPipeline"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -4,19 +4,61 @@ Command Line Interface for IWSA
 
 import asyncio
 import click
-import json
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.text import Text
 
-from .core.engine import ScrapingEngine
-from .config import Settings
 from .utils.logger import setup_logging
+from .utils.helpers import install_uvloop, json_dumps_pretty
 
 
-console = Console()
+# Markup only: skip Rich's per-string regex highlighter and emoji lookup
+console = Console(highlight=False, markup=True, emoji=False)
+
+# Column specs (header, style) for the tables the commands print
+METRIC_COLUMNS = (("Metric", "cyan"), ("Value", "green"))
+COMPONENT_COLUMNS = (("Component", "cyan"), ("Status", "green"))
+PROVIDER_COLUMNS = (("Provider", "cyan"), ("Status", "green"), ("Type", "blue"))
+
+# Pre-rendered status cells
+HEALTH_STATUS_MARKUP = {
+    'healthy': "[green]✓ Healthy[/green]",
+    'degraded': "[yellow]⚠ Degraded[/yellow]",
+}
+UNHEALTHY_MARKUP = "[red]✗ Unhealthy[/red]"
+AVAILABLE_MARKUP = "[green]Available[/green]"
+UNAVAILABLE_MARKUP = "[red]Unavailable[/red]"
+
+
+def _get_engine():
+    """Import the engine on demand so --help and version stay lightweight"""
+    from .core.engine import get_engine
+    return get_engine()
+
+
+async def _close_engine():
+    """Close the engine's pipeline connection before the event loop goes away"""
+    from .core.engine import get_engine
+    if get_engine.cache_info().currsize:
+        await get_engine().aclose()
+
+
+def spinner():
+    """Indeterminate progress display; rich.progress is imported on first use"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    )
+
+
+def make_table(title: str, columns) -> Table:
+    """Build a titled table from (header, style) column specs"""
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
 
 
 @click.group()
@@ -57,16 +99,11 @@ def scrape(ctx, prompt, profile, export_format, estimate):
     
     async def run_scraping():
         try:
-            settings = Settings()
-            engine = ScrapingEngine(settings)
+            engine = _get_engine()
             
             if estimate:
                 # Cost estimation
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    console=console
-                ) as progress:
+                with spinner() as progress:
                     task = progress.add_task("Estimating cost...", total=None)
                     
                     cost_info = await engine.estimate_request_cost(prompt)
@@ -77,9 +114,7 @@ def scrape(ctx, prompt, profile, export_format, estimate):
                     return
                 
                 # Display cost estimation
-                table = Table(title="Cost Estimation")
-                table.add_column("Metric", style="cyan")
-                table.add_column("Value", style="green")
+                table = make_table("Cost Estimation", METRIC_COLUMNS)
                 
                 table.add_row("Estimated Cost (USD)", f"${cost_info.get('estimated_cost_usd', 0):.3f}")
                 table.add_row("Estimated Pages", str(cost_info.get('estimated_pages', 0)))
@@ -90,18 +125,14 @@ def scrape(ctx, prompt, profile, export_format, estimate):
                 console.print(table)
                 
                 if cost_info.get('validation_issues'):
-                    console.print("[yellow]Issues:[/yellow]")
-                    for issue in cost_info['validation_issues']:
-                        console.print(f"  • {issue}")
+                    console.print("[yellow]Issues:[/yellow]",
+                                  *(f"  • {issue}" for issue in cost_info['validation_issues']),
+                                  sep="\n")
                 
                 return
             
             # Actual scraping
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with spinner() as progress:
                 task = progress.add_task("Processing request...", total=None)
                 
                 response = await engine.process_request(prompt)
@@ -111,9 +142,7 @@ def scrape(ctx, prompt, profile, export_format, estimate):
                 console.print("[green]✓ Scraping completed successfully![/green]")
                 
                 # Display results
-                results_table = Table(title="Scraping Results")
-                results_table.add_column("Metric", style="cyan")
-                results_table.add_column("Value", style="green")
+                results_table = make_table("Scraping Results", METRIC_COLUMNS)
                 
                 results_table.add_row("Records Extracted", str(response.total_records))
                 results_table.add_row("Pages Processed", str(response.pages_processed))
@@ -145,6 +174,9 @@ def scrape(ctx, prompt, profile, export_format, estimate):
             if ctx.obj.get('debug'):
                 import traceback
                 console.print(traceback.format_exc())
+        
+        finally:
+            await _close_engine()
     
     asyncio.run(run_scraping())
 
@@ -156,14 +188,9 @@ def health(ctx):
     
     async def check_health():
         try:
-            settings = Settings()
-            engine = ScrapingEngine(settings)
+            engine = _get_engine()
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with spinner() as progress:
                 task = progress.add_task("Running health check...", total=None)
                 
                 health_status = await engine.health_check()
@@ -180,9 +207,7 @@ def health(ctx):
                 console.print("[red]✗ System is unhealthy[/red]")
             
             # Component status table
-            table = Table(title="Component Health")
-            table.add_column("Component", style="cyan")
-            table.add_column("Status", style="green")
+            table = make_table("Component Health", COMPONENT_COLUMNS)
             
             for component, status in health_status.get('components', {}).items():
                 if isinstance(status, dict):
@@ -190,29 +215,27 @@ def health(ctx):
                 else:
                     component_status = str(status)
                 
-                # Color code status
-                if component_status == 'healthy':
-                    status_text = "[green]✓ Healthy[/green]"
-                elif component_status == 'degraded':
-                    status_text = "[yellow]⚠ Degraded[/yellow]"
-                else:
-                    status_text = "[red]✗ Unhealthy[/red]"
-                
-                table.add_row(component.replace('_', ' ').title(), status_text)
+                table.add_row(
+                    component.replace('_', ' ').title(),
+                    HEALTH_STATUS_MARKUP.get(component_status, UNHEALTHY_MARKUP)
+                )
             
             console.print(table)
             
             # Show issues if any
             if 'issues' in health_status:
-                console.print("\n[yellow]Issues Found:[/yellow]")
-                for issue in health_status['issues']:
-                    console.print(f"  • {issue}")
+                console.print("\n[yellow]Issues Found:[/yellow]",
+                              *(f"  • {issue}" for issue in health_status['issues']),
+                              sep="\n")
         
         except Exception as e:
             console.print(f"[red]Health check failed: {str(e)}[/red]")
             if ctx.obj.get('debug'):
                 import traceback
                 console.print(traceback.format_exc())
+        
+        finally:
+            await _close_engine()
     
     asyncio.run(check_health())
 
@@ -224,14 +247,9 @@ def stats(ctx):
     
     async def show_stats():
         try:
-            settings = Settings()
-            engine = ScrapingEngine(settings)
+            engine = _get_engine()
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
+            with spinner() as progress:
                 task = progress.add_task("Gathering statistics...", total=None)
                 
                 stats_data = await engine.get_system_stats()
@@ -239,9 +257,7 @@ def stats(ctx):
             
             # Engine stats
             engine_stats = stats_data.get('engine', {})
-            table = Table(title="Engine Statistics")
-            table.add_column("Metric", style="cyan")
-            table.add_column("Value", style="green")
+            table = make_table("Engine Statistics", METRIC_COLUMNS)
             
             table.add_row("Active Requests", str(engine_stats.get('active_requests', 0)))
             table.add_row("Uptime", f"{engine_stats.get('uptime_seconds', 0):.0f} seconds")
@@ -251,21 +267,16 @@ def stats(ctx):
             # LLM Provider stats
             llm_providers = stats_data.get('llm_providers', {})
             if llm_providers and 'error' not in llm_providers:
-                provider_table = Table(title="LLM Providers")
-                provider_table.add_column("Provider", style="cyan")
-                provider_table.add_column("Status", style="green")
-                provider_table.add_column("Type", style="blue")
+                provider_table = make_table("LLM Providers", PROVIDER_COLUMNS)
                 
-                for provider, info in llm_providers.items():
-                    status = "Available" if info.get('available') else "Unavailable"
-                    provider_type = info.get('provider_type', 'unknown')
-                    
-                    status_color = "[green]" if info.get('available') else "[red]"
-                    provider_table.add_row(
-                        provider.title(), 
-                        f"{status_color}{status}[/{status_color.strip('[')}", 
-                        provider_type
-                    )
+                rows = [
+                    (provider.title(),
+                     AVAILABLE_MARKUP if info.get('available') else UNAVAILABLE_MARKUP,
+                     info.get('provider_type', 'unknown'))
+                    for provider, info in llm_providers.items()
+                ]
+                for row in rows:
+                    provider_table.add_row(*row)
                 
                 console.print(provider_table)
             
@@ -274,9 +285,7 @@ def stats(ctx):
             if pipeline_stats and 'error' not in pipeline_stats:
                 storage_info = pipeline_stats.get('storage', {})
                 if storage_info:
-                    storage_table = Table(title="Storage Statistics")
-                    storage_table.add_column("Metric", style="cyan")
-                    storage_table.add_column("Value", style="green")
+                    storage_table = make_table("Storage Statistics", METRIC_COLUMNS)
                     
                     storage_table.add_row("Connected", str(storage_info.get('connected', False)))
                     storage_table.add_row("Document Count", str(storage_info.get('document_count', 0)))
@@ -289,6 +298,9 @@ def stats(ctx):
             if ctx.obj.get('debug'):
                 import traceback
                 console.print(traceback.format_exc())
+        
+        finally:
+            await _close_engine()
     
     asyncio.run(show_stats())
 
@@ -316,8 +328,7 @@ def config(ctx, prompt, output):
     
     async def generate_config():
         try:
-            settings = Settings()
-            engine = ScrapingEngine(settings)
+            engine = _get_engine()
             
             # Get cost estimation which includes configuration details
             cost_info = await engine.estimate_request_cost(prompt)
@@ -338,7 +349,7 @@ def config(ctx, prompt, output):
                 'validation_warnings': cost_info.get('validation_warnings', [])
             }
             
-            json.dump(config_data, output, indent=2)
+            output.write(json_dumps_pretty(config_data))
             
             if output != '-':
                 console.print(f"[green]Configuration saved to {output.name}[/green]")
@@ -354,6 +365,7 @@ def config(ctx, prompt, output):
 
 def main():
     """Main CLI entry point"""
+    install_uvloop()
     cli()
 
 
@@ -1,6 +1,6 @@
 """Configuration management for IWSA"""
 
-from .settings import Settings
+from .settings import Settings, get_settings
 from .profiles import ScrapingProfiles
 
-__all__ = ["Settings", "ScrapingProfiles"]
\ No newline at end of file
+__all__ = ["Settings", "get_settings", "ScrapingProfiles"]
\ No newline at end of file
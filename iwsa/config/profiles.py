@@ -2,7 +2,9 @@
 Scraping profiles for different use cases and risk levels
 """
 
-from typing import Dict, Any
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple, Union
 from enum import Enum
 
 
@@ -14,11 +16,69 @@ class ProfileType(Enum):
     STEALTH = "stealth"
 
 
+# Profile names differ in their first letter modulo 32, which also folds case
+_LETTER_MASK = 31
+
+
+# Behavioral pattern bits, packed per profile by get_behavior_flags()
+FLAG_MOUSE = 1 << 0
+FLAG_SCROLL = 1 << 1
+FLAG_TYPING = 1 << 2
+FLAG_PAUSE = 1 << 3
+FLAG_PAGEVIEW = 1 << 4
+FLAG_SESSION = 1 << 5
+
+_BEHAVIOR_FLAG_BITS = {
+    "mouse_movements": FLAG_MOUSE,
+    "scroll_simulation": FLAG_SCROLL,
+    "typing_delays": FLAG_TYPING,
+    "random_pauses": FLAG_PAUSE,
+    "page_view_time": FLAG_PAGEVIEW,
+    "session_duration": FLAG_SESSION,
+}
+
+
+def _behavior_flags(patterns: Mapping[str, Any]) -> int:
+    """Pack the enabled (truthy) behavioral patterns into a bitmask"""
+    flags = 0
+    for key, bit in _BEHAVIOR_FLAG_BITS.items():
+        if patterns.get(key):
+            flags |= bit
+    return flags
+
+
+def _freeze(value: Any) -> Any:
+    """Wrap a dict, and every dict nested in it, in a read-only view"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Detached mutable copy of a frozen profile tree"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+def _deep_update(base: Dict[str, Any], update: Dict[str, Any]) -> None:
+    """Merge ``update`` into ``base`` in place, descending into dicts present in both"""
+    stack = [(base, update)]
+    while stack:
+        base_dict, update_dict = stack.pop()
+        for key, value in update_dict.items():
+            current = base_dict.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                base_dict[key] = value
+
+
 class ScrapingProfiles:
     """Predefined scraping profiles for different scenarios"""
     
     PROFILES = {
-        ProfileType.CONSERVATIVE.value: {
+        ProfileType.CONSERVATIVE: {
             "name": "Conservative",
             "description": "Slow and respectful scraping with maximum anti-detection",
             "rate_limit": 5.0,  # seconds between requests
@@ -47,7 +107,7 @@ class ScrapingProfiles:
             "success_rate_target": 0.99
         },
         
-        ProfileType.BALANCED.value: {
+        ProfileType.BALANCED: {
             "name": "Balanced",
             "description": "Moderate speed with good anti-detection measures",
             "rate_limit": 2.0,
@@ -75,7 +135,7 @@ class ScrapingProfiles:
             "success_rate_target": 0.95
         },
         
-        ProfileType.AGGRESSIVE.value: {
+        ProfileType.AGGRESSIVE: {
             "name": "Aggressive",
             "description": "Fast scraping with minimal anti-detection",
             "rate_limit": 1.0,
@@ -101,7 +161,7 @@ class ScrapingProfiles:
             "success_rate_target": 0.90
         },
         
-        ProfileType.STEALTH.value: {
+        ProfileType.STEALTH: {
             "name": "Stealth",
             "description": "Maximum stealth with residential proxies and advanced evasion",
             "rate_limit": 8.0,
@@ -140,77 +200,171 @@ class ScrapingProfiles:
         }
     }
     
+    # Profile name -> type, for resolving caller-supplied names
+    _ALIASES = {profile_type.value: profile_type for profile_type in ProfileType}
+    
+    # ids of the built-in profiles, filled in once they pass validation
+    _VALIDATED_PROFILE_IDS = frozenset()
+    
+    # Fields every profile must define
+    REQUIRED_PROFILE_FIELDS = frozenset({
+        "rate_limit", "retry_attempts", "timeout",
+        "anti_detection", "concurrent_browsers"
+    })
+    
+    # Recommended profile per site type (read-only, shared by every lookup)
+    SITE_RECOMMENDATIONS = MappingProxyType({
+        "e-commerce": ProfileType.BALANCED.value,
+        "job_boards": ProfileType.CONSERVATIVE.value,
+        "social_media": ProfileType.STEALTH.value,
+        "news": ProfileType.BALANCED.value,
+        "directories": ProfileType.AGGRESSIVE.value,
+        "apis": ProfileType.AGGRESSIVE.value,
+        "government": ProfileType.STEALTH.value,
+        "financial": ProfileType.STEALTH.value,
+        "academic": ProfileType.CONSERVATIVE.value,
+        "real_estate": ProfileType.BALANCED.value
+    })
+    
     @classmethod
-    def get_profile(cls, profile_name: str) -> Dict[str, Any]:
-        """Get a scraping profile by name"""
-        if profile_name not in cls.PROFILES:
-            available = list(cls.PROFILES.keys())
+    def _resolve(cls, profile_name: Union[str, ProfileType]) -> Optional[ProfileType]:
+        """Profile type for a name (case-insensitive) or type, None if unknown"""
+        if isinstance(profile_name, ProfileType):
+            return profile_name
+        
+        # Exact names hit the first-letter table; anything else takes the alias dict
+        if profile_name:
+            profile_type = cls._FIRST_LETTER_TABLE[ord(profile_name[0]) & _LETTER_MASK]
+            if profile_type is not None and profile_type.value == profile_name:
+                return profile_type
+        return cls._ALIASES.get(profile_name) or cls._ALIASES.get(profile_name.lower())
+    
+    @classmethod
+    def _require(cls, profile_name: Union[str, ProfileType]) -> ProfileType:
+        """Profile type for a name or type, raising ValueError if unknown"""
+        profile_type = cls._resolve(profile_name)
+        if profile_type is None:
+            available = list(cls._ALIASES)
             raise ValueError(f"Profile '{profile_name}' not found. Available: {available}")
+        return profile_type
+    
+    @classmethod
+    def get_profile(cls, profile_name: Union[str, ProfileType]) -> Mapping[str, Any]:
+        """
+        Get a scraping profile by name
         
-        return cls.PROFILES[profile_name].copy()
+        The profile is a shared read-only view; use get_mutable_profile()
+        for a copy that can be modified.
+        """
+        return cls.PROFILES[cls._require(profile_name)]
     
     @classmethod
-    def get_all_profiles(cls) -> Dict[str, Dict[str, Any]]:
-        """Get all available profiles"""
-        return cls.PROFILES.copy()
+    def get_mutable_profile(cls, profile_name: Union[str, ProfileType]) -> Dict[str, Any]:
+        """Get a detached, modifiable copy of a scraping profile"""
+        return _thaw(cls.get_profile(profile_name))
     
     @classmethod
-    def create_custom_profile(cls, base_profile: str, overrides: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a custom profile based on an existing one with overrides"""
-        if base_profile not in cls.PROFILES:
-            raise ValueError(f"Base profile '{base_profile}' not found")
+    def get_all_profiles(cls) -> Mapping[str, Mapping[str, Any]]:
+        """Get all available profiles, keyed by name, as a read-only view"""
+        return cls._PROFILES_BY_NAME
+    
+    @classmethod
+    def get_request_headers(cls, profile_name: Union[str, ProfileType]) -> Tuple[Tuple[str, str], ...]:
+        """
+        A profile's request headers as ``(name, value)`` pairs
         
-        profile = cls.get_profile(base_profile)
+        The pairs are built once at import time and can be passed straight
+        to aiohttp as ``headers=``.
+        """
+        return cls._HEADER_ITEMS[cls._require(profile_name)]
+    
+    @classmethod
+    def get_behavior_flags(cls, profile_name: Union[str, ProfileType]) -> int:
+        """
+        A profile's behavioral patterns as a bitmask of the ``FLAG_*`` constants
         
-        # Apply overrides recursively
-        def deep_update(base_dict: Dict, update_dict: Dict) -> Dict:
-            for key, value in update_dict.items():
-                if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-                    base_dict[key] = deep_update(base_dict[key], value)
-                else:
-                    base_dict[key] = value
-            return base_dict
+        e.g. ``get_behavior_flags("stealth") & FLAG_MOUSE``
+        """
+        return cls._BEHAVIOR_FLAGS[cls._require(profile_name)]
+    
+    @classmethod
+    def create_custom_profile(cls,
+                              base_profile: Union[str, ProfileType],
+                              overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a custom profile based on an existing one with overrides"""
+        if cls._resolve(base_profile) is None:
+            raise ValueError(f"Base profile '{base_profile}' not found")
         
-        return deep_update(profile, overrides)
+        profile = cls.get_mutable_profile(base_profile)
+        _deep_update(profile, overrides)
+        return profile
     
     @classmethod
     def get_profile_for_site_type(cls, site_type: str) -> str:
         """Recommend a profile based on site type"""
-        site_recommendations = {
-            "e-commerce": ProfileType.BALANCED.value,
-            "job_boards": ProfileType.CONSERVATIVE.value,
-            "social_media": ProfileType.STEALTH.value,
-            "news": ProfileType.BALANCED.value,
-            "directories": ProfileType.AGGRESSIVE.value,
-            "apis": ProfileType.AGGRESSIVE.value,
-            "government": ProfileType.STEALTH.value,
-            "financial": ProfileType.STEALTH.value,
-            "academic": ProfileType.CONSERVATIVE.value,
-            "real_estate": ProfileType.BALANCED.value
-        }
-        
-        return site_recommendations.get(site_type.lower(), ProfileType.BALANCED.value)
+        return cls.SITE_RECOMMENDATIONS.get(site_type.lower(), ProfileType.BALANCED.value)
+    
+    @classmethod
+    def get_profile_dict_for_site_type(cls, site_type: str) -> Mapping[str, Any]:
+        """Recommended profile itself for a site type, in a single lookup"""
+        return cls._SITE_PROFILE_TABLE.get(site_type.lower(), cls._DEFAULT_PROFILE)
     
     @classmethod 
-    def validate_profile(cls, profile: Dict[str, Any]) -> bool:
+    def validate_profile(cls, profile: Mapping[str, Any]) -> bool:
         """Validate a profile configuration"""
-        required_fields = [
-            "rate_limit", "retry_attempts", "timeout", 
-            "anti_detection", "concurrent_browsers"
-        ]
-        
-        for field in required_fields:
-            if field not in profile:
-                return False
+        # Built-in profiles are validated once at import
+        if id(profile) in cls._VALIDATED_PROFILE_IDS:
+            return True
         
-        # Validate value ranges
-        if profile["rate_limit"] <= 0:
-            return False
-        if profile["retry_attempts"] < 1:
-            return False
-        if profile["timeout"] <= 0:
-            return False
-        if profile["concurrent_browsers"] < 1:
-            return False
-        
-        return True
\ No newline at end of file
+        return (
+            cls.REQUIRED_PROFILE_FIELDS.issubset(profile.keys())
+            and profile["rate_limit"] > 0
+            and profile["retry_attempts"] >= 1
+            and profile["timeout"] > 0
+            and profile["concurrent_browsers"] >= 1
+        )
+
+
+# Header names and values repeat across profiles and requests; intern them
+# so every copy, here or in request code that interns too, is one object
+for _profile in ScrapingProfiles.PROFILES.values():
+    _profile["request_headers"] = {
+        sys.intern(name): sys.intern(value) for name, value in _profile["request_headers"].items()
+    }
+
+# Profiles are shared by every caller, so they are frozen once at import time
+ScrapingProfiles.PROFILES = {
+    profile_type: _freeze(profile) for profile_type, profile in ScrapingProfiles.PROFILES.items()
+}
+ScrapingProfiles._PROFILES_BY_NAME = MappingProxyType({
+    profile_type.value: profile for profile_type, profile in ScrapingProfiles.PROFILES.items()
+})
+ScrapingProfiles._HEADER_ITEMS = {
+    profile_type: tuple(profile["request_headers"].items())
+    for profile_type, profile in ScrapingProfiles.PROFILES.items()
+}
+ScrapingProfiles._BEHAVIOR_FLAGS = {
+    profile_type: _behavior_flags(profile["behavioral_patterns"])
+    for profile_type, profile in ScrapingProfiles.PROFILES.items()
+}
+
+for _profile_type, _profile in ScrapingProfiles.PROFILES.items():
+    if not ScrapingProfiles.validate_profile(_profile):
+        raise ValueError(f"Built-in profile '{_profile_type.value}' is invalid")
+# Frozen built-ins live for the process, so their ids stay unique
+ScrapingProfiles._VALIDATED_PROFILE_IDS = frozenset(map(id, ScrapingProfiles.PROFILES.values()))
+
+# Perfect hash on the first letter; a type whose slot is already taken
+# resolves through _ALIASES instead
+ScrapingProfiles._FIRST_LETTER_TABLE = [None] * (_LETTER_MASK + 1)
+for _profile_type in ProfileType:
+    _slot = ord(_profile_type.value[0]) & _LETTER_MASK
+    if ScrapingProfiles._FIRST_LETTER_TABLE[_slot] is None:
+        ScrapingProfiles._FIRST_LETTER_TABLE[_slot] = _profile_type
+
+# Site type -> frozen profile, so recommendations resolve without a name hop
+ScrapingProfiles._DEFAULT_PROFILE = ScrapingProfiles.PROFILES[ProfileType.BALANCED]
+ScrapingProfiles._SITE_PROFILE_TABLE = {
+    site_type: ScrapingProfiles.get_profile(profile_name)
+    for site_type, profile_name in ScrapingProfiles.SITE_RECOMMENDATIONS.items()
+}
@@ -2,147 +2,380 @@
 Settings and configuration management for IWSA
 """
 
+import json
 import os
-from typing import Optional, Dict, Any
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union, get_args, get_origin, get_type_hints
 from pathlib import Path
-from pydantic import BaseSettings, Field, validator
-import yaml
-from dotenv import load_dotenv
 
+from .profiles import ScrapingProfiles
 
-class LLMConfig(BaseSettings):
+
+_REQUIRED = object()
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "on", "y", "t"})
+_FALSE_STRINGS = frozenset({"0", "false", "no", "off", "n", "f", ""})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse an environment flag such as ``true``, ``1`` or ``off``"""
+    normalized = value.strip().lower()
+    if normalized in _TRUE_STRINGS:
+        return True
+    if normalized in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+def _caster_for(annotation: Any) -> Callable[[str], Any]:
+    """Function that converts an environment string to ``annotation``"""
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if annotation is bool:
+        return _parse_bool
+    if annotation in (list, dict) or get_origin(annotation) in (list, dict):
+        return json.loads
+    return annotation
+
+
+_dotenv_loaded = False
+
+
+def _load_dotenv_once():
+    """Load .env into the environment the first time settings are built"""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _dotenv_loaded = True
+
+
+@lru_cache(maxsize=4)
+def _read_yaml_config(config_path: Path) -> Optional[Dict[str, Any]]:
+    """Parse a YAML config file once per process; PyYAML is imported only if it exists"""
+    if not config_path.exists():
+        return None
+    import yaml
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+class Env:
+    """Declares a setting read from the environment variable ``var``"""
+    
+    __slots__ = ("var", "default")
+    
+    def __init__(self, var: str, default: Any = _REQUIRED):
+        self.var = var
+        self.default = default
+
+
+class _EnvSettingsMeta(type):
+    """Moves ``Env`` declarations out of the class body and slots the declared fields"""
+    
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        specs = {}
+        for base in reversed(bases):
+            specs.update(getattr(base, "_env_specs", {}))
+        for key, value in list(namespace.items()):
+            if isinstance(value, Env):
+                specs[key] = namespace.pop(key)
+        namespace["_env_specs"] = specs
+        
+        if "__slots__" not in namespace:
+            annotations = namespace.get("__annotations__", {})
+            namespace["__slots__"] = tuple(key for key in annotations if not key.startswith("_"))
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class EnvSettings(metaclass=_EnvSettingsMeta):
+    """
+    Configuration loaded from environment variables
+    
+    Subclasses declare ``name: type = Env("VAR", default)`` fields, or a
+    nested ``EnvSettings`` subclass as a section. The field table is built
+    once per class, so loading is a single pass over it. Values are taken
+    from keyword arguments, then the environment, then the default.
+    Declared fields are stored in ``__slots__``.
+    """
+    
+    __slots__ = ("_version", "_read_only")
+    
+    # (name, env var, caster, default) per field
+    _fields: Tuple[Tuple[str, str, Callable[[str], Any], Any], ...] = ()
+    # (name, section class) per nested section
+    _sections: Tuple[Tuple[str, type], ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        sections = []
+        for name, annotation in get_type_hints(cls).items():
+            if name.startswith("_"):
+                continue
+            spec = cls._env_specs.get(name)
+            if spec is not None:
+                fields.append((name, spec.var, _caster_for(annotation), spec.default))
+            elif isinstance(annotation, type) and issubclass(annotation, EnvSettings):
+                sections.append((name, annotation))
+        cls._fields = tuple(fields)
+        cls._sections = tuple(sections)
+        cls._shared_entry = None
+    
+    def __init__(self, **values):
+        object.__setattr__(self, "_version", 0)
+        object.__setattr__(self, "_read_only", False)
+        
+        environ = os.environ
+        for name, var, caster, default in self._fields:
+            if name in values:
+                value = values.pop(name)
+            else:
+                value = environ.get(var)
+                if value is None:
+                    if default is _REQUIRED:
+                        raise ValueError(f"{type(self).__name__}.{name} is required (set {var})")
+                    value = list(default) if isinstance(default, list) else default
+                    setattr(self, name, value)
+                    continue
+            if isinstance(value, str) and caster is not str:
+                try:
+                    value = caster(value)
+                except ValueError as e:
+                    raise ValueError(f"Invalid value for {type(self).__name__}.{name} ({var}): {e}") from None
+            setattr(self, name, value)
+        
+        for name, section_class in self._sections:
+            value = values.pop(name, None)
+            if isinstance(value, dict):
+                value = section_class(**value)
+            setattr(self, name, value if value is not None else section_class.shared())
+        
+        if values:
+            raise TypeError(f"Unknown {type(self).__name__} settings: {sorted(values)}")
+    
+    @classmethod
+    def shared(cls):
+        """
+        Read-only instance for the current environment
+        
+        The instance is reused for as long as the variables it reads are
+        unchanged, so repeated Settings() calls don't re-parse every section.
+        """
+        environ = os.environ
+        key = tuple(environ.get(var) for _, var, _, _ in cls._fields)
+        entry = cls._shared_entry
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        
+        instance = cls()
+        object.__setattr__(instance, "_read_only", True)
+        cls._shared_entry = (key, instance)
+        return instance
+    
+    def clone(self, **overrides):
+        """Modifiable copy, with ``overrides`` applied"""
+        values = {name: getattr(self, name) for name, _, _, _ in self._fields}
+        values.update((name, getattr(self, name).clone()) for name, _ in self._sections)
+        values.update(overrides)
+        return type(self)(**values)
+    
+    def dict(self, **kwargs) -> Dict[str, Any]:
+        """Convert settings to a plain dictionary"""
+        data = {}
+        for name, _, _, _ in self._fields:
+            value = getattr(self, name)
+            data[name] = list(value) if isinstance(value, list) else value
+        for name, _ in self._sections:
+            data[name] = getattr(self, name).dict()
+        return data
+    
+    def __setattr__(self, name: str, value: Any):
+        if self._read_only:
+            raise AttributeError(f"Shared {type(self).__name__} is read-only; use clone() to modify it")
+        super().__setattr__(name, value)
+        # Bumped on every assignment so derived data can be cached
+        super().__setattr__("_version", self._version + 1)
+    
+    @property
+    def state_version(self) -> Tuple[int, ...]:
+        """Changes whenever these settings or any nested section are assigned to"""
+        return (self._version,) + tuple(
+            version for name, _ in self._sections for version in getattr(self, name).state_version
+        )
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name, _, _, _ in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class LLMConfig(EnvSettings):
     """LLM provider configuration"""
     
     # Primary providers (user-provided keys)
-    openai_api_key: Optional[str] = Field(None, env="OPENAI_API_KEY")
-    claude_api_key: Optional[str] = Field(None, env="CLAUDE_API_KEY")
+    openai_api_key: Optional[str] = Env("OPENAI_API_KEY", None)
+    claude_api_key: Optional[str] = Env("CLAUDE_API_KEY", None)
     
     # Fallback provider
-    hf_api_key: Optional[str] = Field(None, env="HF_API_KEY")
+    hf_api_key: Optional[str] = Env("HF_API_KEY", None)
     
     # Local TinyLlama configuration
-    tinyllama_model_path: str = Field("./models/tinyllama-1.1b-onnx", env="TINYLLAMA_MODEL_PATH")
-    tinyllama_max_memory: str = Field("1.5GB", env="TINYLLAMA_MAX_MEMORY")
-    tinyllama_threads: int = Field(4, env="TINYLLAMA_THREADS")
-    tinyllama_quantization: str = Field("int8", env="TINYLLAMA_QUANTIZATION")
-    tinyllama_batch_size: int = Field(1, env="TINYLLAMA_BATCH_SIZE")
+    tinyllama_model_path: str = Env("TINYLLAMA_MODEL_PATH", "./models/tinyllama-1.1b-onnx")
+    tinyllama_max_memory: str = Env("TINYLLAMA_MAX_MEMORY", "1.5GB")
+    tinyllama_threads: int = Env("TINYLLAMA_THREADS", 4)
+    tinyllama_quantization: str = Env("TINYLLAMA_QUANTIZATION", "int8")
+    tinyllama_batch_size: int = Env("TINYLLAMA_BATCH_SIZE", 1)
     
     # Configuration
-    primary_provider: str = Field("tinyllama", env="PRIMARY_LLM_PROVIDER")
-    fallback_provider: str = Field("openai", env="FALLBACK_LLM_PROVIDER")
-    timeout: int = Field(30, env="LLM_TIMEOUT")
-    retry_attempts: int = Field(3, env="LLM_RETRY_ATTEMPTS")
-    rate_limiting: bool = Field(True, env="LLM_RATE_LIMITING")
+    primary_provider: str = Env("PRIMARY_LLM_PROVIDER", "tinyllama")
+    fallback_provider: str = Env("FALLBACK_LLM_PROVIDER", "openai")
+    timeout: int = Env("LLM_TIMEOUT", 30)
+    retry_attempts: int = Env("LLM_RETRY_ATTEMPTS", 3)
+    rate_limiting: bool = Env("LLM_RATE_LIMITING", True)
     
     # Request routing configuration
-    local_complexity_threshold: float = Field(0.3, env="LOCAL_COMPLEXITY_THRESHOLD")
-    local_token_limit: int = Field(1000, env="LOCAL_TOKEN_LIMIT")
-    enable_hybrid_routing: bool = Field(True, env="ENABLE_HYBRID_ROUTING")
+    local_complexity_threshold: float = Env("LOCAL_COMPLEXITY_THRESHOLD", 0.3)
+    local_token_limit: int = Env("LOCAL_TOKEN_LIMIT", 1000)
+    enable_hybrid_routing: bool = Env("ENABLE_HYBRID_ROUTING", True)
     
     # Model specifications
-    openai_model: str = Field("gpt-4", env="OPENAI_MODEL")
-    claude_model: str = Field("claude-3-sonnet-20240229", env="CLAUDE_MODEL")
-    hf_model: str = Field("microsoft/DialoGPT-large", env="HF_MODEL")
+    openai_model: str = Env("OPENAI_MODEL", "gpt-4")
+    claude_model: str = Env("CLAUDE_MODEL", "claude-3-sonnet-20240229")
+    hf_model: str = Env("HF_MODEL", "microsoft/DialoGPT-large")
     
     # Token limits
-    max_tokens: int = Field(4000, env="LLM_MAX_TOKENS")
-    temperature: float = Field(0.1, env="LLM_TEMPERATURE")
+    max_tokens: int = Env("LLM_MAX_TOKENS", 4000)
+    temperature: float = Env("LLM_TEMPERATURE", 0.1)
+    
+    # Strategy cache
+    strategy_cache_enabled: bool = Env("STRATEGY_CACHE_ENABLED", True)
+    strategy_cache_dir: Optional[str] = Env("STRATEGY_CACHE_DIR", "./.cache/strategies")
+    strategy_cache_similarity: float = Env("STRATEGY_CACHE_SIMILARITY", 0.92)
+    
+    # Skip the LLM for trivially structured pages
+    heuristic_strategy_enabled: bool = Env("HEURISTIC_STRATEGY_ENABLED", True)
+    
+    # Prompt HTML reduction (tag/class/id skeleton instead of raw markup)
+    html_skeleton_enabled: bool = Env("LLM_HTML_SKELETON", True)
+    html_skeleton_max_chars: int = Env("LLM_HTML_SKELETON_MAX_CHARS", 8000)
+    
+    # Request batching (0 disables the dispatcher)
+    batch_window_ms: int = Env("LLM_BATCH_WINDOW_MS", 50)
+    batch_max_size: int = Env("LLM_BATCH_MAX_SIZE", 16)
 
 
-class StorageConfig(BaseSettings):
+class StorageConfig(EnvSettings):
     """Storage configuration"""
     
     # MongoDB Atlas
-    mongodb_uri: str = Field(..., env="MONGODB_URI")
-    database_name: str = Field("iwsa_data", env="MONGODB_DATABASE")
-    collection_name: str = Field("scraped_data", env="MONGODB_COLLECTION")
+    mongodb_uri: str = Env("MONGODB_URI")
+    database_name: str = Env("MONGODB_DATABASE", "iwsa_data")
+    collection_name: str = Env("MONGODB_COLLECTION", "scraped_data")
     
     # Google Sheets
-    google_credentials: Optional[str] = Field(None, env="GOOGLE_CREDENTIALS")
-    sheets_scope: list = Field(
-        default=["https://spreadsheets.google.com/feeds", 
-                "https://www.googleapis.com/auth/drive"],
-        env="SHEETS_SCOPE"
+    google_credentials: Optional[str] = Env("GOOGLE_CREDENTIALS", None)
+    sheets_scope: list = Env(
+        "SHEETS_SCOPE",
+        ["https://spreadsheets.google.com/feeds",
+         "https://www.googleapis.com/auth/drive"]
     )
 
 
-class ScrapingConfig(BaseSettings):
+class ScrapingConfig(EnvSettings):
     """Scraping engine configuration"""
     
     # Browser settings
-    max_concurrent_browsers: int = Field(3, env="MAX_CONCURRENT_BROWSERS")
-    default_timeout: int = Field(30, env="DEFAULT_TIMEOUT")
-    headless: bool = Field(True, env="BROWSER_HEADLESS")
+    max_concurrent_browsers: int = Env("MAX_CONCURRENT_BROWSERS", 3)
+    default_timeout: int = Env("DEFAULT_TIMEOUT", 30)
+    headless: bool = Env("BROWSER_HEADLESS", True)
     
     # Performance limits
-    memory_limit: str = Field("512MB", env="MEMORY_LIMIT")
-    cpu_limit: int = Field(2, env="CPU_LIMIT")
-    max_pages_per_session: int = Field(1000, env="MAX_PAGES_PER_SESSION")
+    memory_limit: str = Env("MEMORY_LIMIT", "512MB")
+    cpu_limit: int = Env("CPU_LIMIT", 2)
+    max_pages_per_session: int = Env("MAX_PAGES_PER_SESSION", 1000)
     
     # Rate limiting
-    rate_limit_delay: float = Field(2.0, env="RATE_LIMIT_DELAY")
-    min_delay: float = Field(1.0, env="MIN_DELAY")
-    max_delay: float = Field(10.0, env="MAX_DELAY")
+    rate_limit_delay: float = Env("RATE_LIMIT_DELAY", 2.0)
+    min_delay: float = Env("MIN_DELAY", 1.0)
+    max_delay: float = Env("MAX_DELAY", 10.0)
     
     # Anti-detection
-    user_agent_rotation: bool = Field(True, env="USER_AGENT_ROTATION")
-    ip_rotation: bool = Field(True, env="IP_ROTATION")
-    fingerprint_randomization: bool = Field(True, env="FINGERPRINT_RANDOMIZATION")
+    user_agent_rotation: bool = Env("USER_AGENT_ROTATION", True)
+    ip_rotation: bool = Env("IP_ROTATION", True)
+    fingerprint_randomization: bool = Env("FINGERPRINT_RANDOMIZATION", True)
     
     # Proxy configuration
-    proxy_pool_url: Optional[str] = Field(None, env="PROXY_POOL_URL")
-    proxy_rotation_interval: int = Field(10, env="PROXY_ROTATION_INTERVAL")
+    proxy_pool_url: Optional[str] = Env("PROXY_POOL_URL", None)
+    proxy_rotation_interval: int = Env("PROXY_ROTATION_INTERVAL", 10)
+    
+    # Prompt intent cache (0 entries disables it)
+    intent_cache_size: int = Env("INTENT_CACHE_SIZE", 512)
+    intent_cache_ttl: float = Env("INTENT_CACHE_TTL", 300.0)
 
 
-class MonitoringConfig(BaseSettings):
+class MonitoringConfig(EnvSettings):
     """Monitoring and logging configuration"""
     
-    enable_monitoring: bool = Field(True, env="ENABLE_MONITORING")
-    log_level: str = Field("INFO", env="LOG_LEVEL")
-    metrics_enabled: bool = Field(True, env="METRICS_ENABLED")
+    enable_monitoring: bool = Env("ENABLE_MONITORING", True)
+    log_level: str = Env("LOG_LEVEL", "INFO")
+    metrics_enabled: bool = Env("METRICS_ENABLED", True)
     
     # Uptime monitoring
-    uptime_robot_key: Optional[str] = Field(None, env="UPTIME_ROBOT_KEY")
+    uptime_robot_key: Optional[str] = Env("UPTIME_ROBOT_KEY", None)
     
     # Performance thresholds
-    max_memory_usage: float = Field(0.8, env="MAX_MEMORY_USAGE")
-    max_cpu_usage: float = Field(0.8, env="MAX_CPU_USAGE")
-    max_error_rate: float = Field(0.01, env="MAX_ERROR_RATE")
+    max_memory_usage: float = Env("MAX_MEMORY_USAGE", 0.8)
+    max_cpu_usage: float = Env("MAX_CPU_USAGE", 0.8)
+    max_error_rate: float = Env("MAX_ERROR_RATE", 0.01)
 
 
-class Settings(BaseSettings):
+class Settings(EnvSettings):
     """Main settings class combining all configurations"""
     
+    # cached_property and the cached dict() output need an instance dict
+    __slots__ = ("__dict__",)
+    
     # Environment
-    environment: str = Field("development", env="ENVIRONMENT")
-    debug: bool = Field(False, env="DEBUG")
+    environment: str = Env("ENVIRONMENT", "development")
+    debug: bool = Env("DEBUG", False)
     
     # Component configurations
-    llm: LLMConfig = Field(default_factory=LLMConfig)
-    storage: StorageConfig = Field(default_factory=StorageConfig)
-    scraping: ScrapingConfig = Field(default_factory=ScrapingConfig)
-    monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
+    llm: LLMConfig
+    storage: StorageConfig
+    scraping: ScrapingConfig
+    monitoring: MonitoringConfig
     
-    class Config:
-        env_file = ".env"
-        env_nested_delimiter = "__"
-        case_sensitive = False
+    # Whether each provider is usable with the current configuration
+    _PROVIDER_CHECKS = {
+        "tinyllama": lambda settings: settings._local_model_available,
+        "openai": lambda settings: bool(settings.llm.openai_api_key),
+        "claude": lambda settings: bool(settings.llm.claude_api_key),
+        "huggingface": lambda settings: bool(settings.llm.hf_api_key),
+    }
+    _PRIMARY_PROVIDERS = ("tinyllama", "openai", "claude")
+    _FALLBACK_PROVIDERS = ("huggingface", "tinyllama")
     
     def __init__(self, **kwargs):
         # Load environment variables
-        load_dotenv()
+        _load_dotenv_once()
         super().__init__(**kwargs)
+        self.validate_environment(self.environment)
         
         # Load additional configuration from YAML if exists
         self._load_yaml_config()
+        
+        # Providers in the order get_active_llm_provider tries them: the primary
+        # (when it is one of the primary-capable providers), then the fallbacks
+        primary = self.llm.primary_provider
+        order = ((primary,) if primary in self._PRIMARY_PROVIDERS else ()) + self._FALLBACK_PROVIDERS
+        self._provider_chain = tuple((provider, self._PROVIDER_CHECKS[provider]) for provider in order)
     
     def _load_yaml_config(self):
         """Load additional configuration from YAML file"""
-        config_path = Path("config.yaml")
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                yaml_config = yaml.safe_load(f)
-                self._merge_yaml_config(yaml_config)
+        yaml_config = _read_yaml_config(Path("config.yaml"))
+        if yaml_config:
+            self._merge_yaml_config(yaml_config)
     
     def _merge_yaml_config(self, yaml_config: Dict[str, Any]):
         """Merge YAML configuration with existing settings"""
@@ -157,17 +390,21 @@ class Settings(BaseSettings):
                 else:
                     setattr(self, key, value)
     
-    @validator('environment')
-    def validate_environment(cls, v):
+    @staticmethod
+    def validate_environment(v):
         """Validate environment setting"""
         valid_envs = ['development', 'staging', 'production']
         if v not in valid_envs:
             raise ValueError(f'Environment must be one of: {valid_envs}')
         return v
     
-    def get_scraping_profile(self, profile_name: str = "balanced") -> Dict[str, Any]:
-        """Get scraping profile configuration"""
-        from .profiles import ScrapingProfiles
+    def get_scraping_profile(self, profile_name: str = "balanced") -> Mapping[str, Any]:
+        """
+        Get scraping profile configuration
+        
+        Returns the shared read-only profile; use
+        ScrapingProfiles.get_mutable_profile() for a copy to modify.
+        """
         return ScrapingProfiles.get_profile(profile_name)
     
     def is_production(self) -> bool:
@@ -176,33 +413,47 @@ class Settings(BaseSettings):
     
     def has_llm_provider(self) -> bool:
         """Check if at least one LLM provider is configured"""
-        return bool(self.llm.openai_api_key or 
-                   self.llm.claude_api_key or 
-                   self.llm.hf_api_key or
-                   self._has_local_model())
-    
-    def _has_local_model(self) -> bool:
-        """Check if local TinyLlama model is available"""
-        import os
+        # API keys are plain attribute reads; only check the filesystem without one
+        llm = self.llm
+        if llm.openai_api_key or llm.claude_api_key or llm.hf_api_key:
+            return True
+        return self._local_model_available
+    
+    @cached_property
+    def _local_model_available(self) -> bool:
+        """Whether the local TinyLlama model exists, checked once per instance"""
         return os.path.exists(self.llm.tinyllama_model_path)
     
+    def refresh_local_model_cache(self):
+        """Re-check the local model path on next use, e.g. after downloading it"""
+        self.__dict__.pop('_local_model_available', None)
+    
     def get_active_llm_provider(self) -> str:
         """Get the currently active LLM provider"""
-        if self.llm.primary_provider == "tinyllama" and self._has_local_model():
-            return "tinyllama"
-        elif self.llm.primary_provider == "openai" and self.llm.openai_api_key:
-            return "openai"
-        elif self.llm.primary_provider == "claude" and self.llm.claude_api_key:
-            return "claude"
-        elif self.llm.hf_api_key:
-            return "huggingface"
-        elif self._has_local_model():
-            return "tinyllama"
-        else:
-            raise ValueError("No LLM provider configured with valid API key or local model")
+        for provider, is_configured in self._provider_chain:
+            if is_configured(self):
+                return provider
+        raise ValueError("No LLM provider configured with valid API key or local model")
     
     def dict(self, **kwargs) -> Dict[str, Any]:
-        """Convert settings to dictionary, excluding sensitive data"""
+        """
+        Convert settings to dictionary, excluding sensitive data
+        
+        The masked dictionary is built once and reused until a setting is
+        assigned; each call returns fresh top-level and section dicts.
+        """
+        version = self.state_version
+        if self.__dict__.get('_masked_version') != version:
+            self.__dict__['_masked_cache'] = self._masked_dict(**kwargs)
+            self.__dict__['_masked_version'] = version
+        
+        return {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in self.__dict__['_masked_cache'].items()
+        }
+    
+    def _masked_dict(self, **kwargs) -> Dict[str, Any]:
+        """Serialize settings with credentials masked"""
         data = super().dict(**kwargs)
         
         # Mask sensitive information
@@ -217,4 +468,9 @@ class Settings(BaseSettings):
             if 'google_credentials' in data['storage'] and data['storage']['google_credentials']:
                 data['storage']['google_credentials'] = "***MASKED***"
         
-        return data
\ No newline at end of file
+        return data
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance, loading it on first use"""
+    return Settings()
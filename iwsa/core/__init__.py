@@ -1,7 +1,7 @@
 """Core IWSA components"""
 
-from .engine import ScrapingEngine
+from .engine import ScrapingEngine, get_engine
 from .prompt_processor import PromptProcessor
 from .reconnaissance import ReconnaissanceEngine
 
-__all__ = ["ScrapingEngine", "PromptProcessor", "ReconnaissanceEngine"]
\ No newline at end of file
+__all__ = ["ScrapingEngine", "get_engine", "PromptProcessor", "ReconnaissanceEngine"]
\ No newline at end of file
@@ -3,21 +3,32 @@ Main scraping engine that orchestrates all IWSA components
 """
 
 import asyncio
+import copy
+import hashlib
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from urllib.parse import urlparse
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from functools import lru_cache
+from itertools import chain
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
 
 from .prompt_processor import PromptProcessor, ExtractedIntent, ValidationResult
 from .reconnaissance import ReconnaissanceEngine, SiteMetadata
 from ..llm.hub import LLMHub
+from ..llm.strategy_generator import ScrapingStrategy, StrategyRequest
 from ..scraper.dynamic_scraper import DynamicScraper, ExtractionResult
 from ..data.pipeline import DataPipeline, PipelineResult
-from ..config import Settings
+from ..config import Settings, get_settings
 from ..utils.logger import ComponentLogger
-from ..utils.helpers import generate_id, measure_time
+from ..utils.helpers import generate_id, measure_time, truncate_text, with_slots
 
 
+# Number of dicts active requests are spread over; must be a power of two
+REQUEST_SHARDS = 16
+
+
+@with_slots
 @dataclass
 class ScrapingRequest:
     """Complete scraping request with all parameters"""
@@ -26,14 +37,11 @@ class ScrapingRequest:
     intent: ExtractedIntent
     validation_result: ValidationResult
     scraping_profile: str = "balanced"
-    export_formats: List[str] = None
-    
-    def __post_init__(self):
-        if self.export_formats is None:
-            self.export_formats = ["sheets"]
+    export_formats: List[str] = field(default_factory=lambda: ["sheets"])
 
 
-@dataclass 
+@with_slots
+@dataclass
 class ScrapingResponse:
     """Complete response from scraping operation"""
     success: bool
@@ -41,7 +49,7 @@ class ScrapingResponse:
     total_records: int = 0
     pages_processed: int = 0
     export_url: Optional[str] = None
-    file_paths: List[str] = None
+    file_paths: List[str] = field(default_factory=list)
     processing_time: float = 0.0
     error: Optional[str] = None
     
@@ -49,10 +57,56 @@ class ScrapingResponse:
     extraction_result: Optional[ExtractionResult] = None
     pipeline_result: Optional[PipelineResult] = None
     site_metadata: Optional[SiteMetadata] = None
+
+
+@dataclass
+class ScrapingEvent:
+    """Progress event from one stage of a scraping request"""
+    stage: str
+    payload: Any = None
+
+
+class RequestRegistry(MutableMapping):
+    """
+    Active requests by id, spread over ``REQUEST_SHARDS`` small dicts
+    
+    Inserts, lookups and deletes touch only the shard the id hashes to, so
+    they contend on a single small dict rather than one shared by every
+    request in flight.
+    """
+    
+    def __init__(self):
+        self._shards: List[Dict[str, "ScrapingRequest"]] = [{} for _ in range(REQUEST_SHARDS)]
+    
+    def _shard(self, request_id: str) -> Dict[str, "ScrapingRequest"]:
+        return self._shards[hash(request_id) & (REQUEST_SHARDS - 1)]
+    
+    def __getitem__(self, request_id: str) -> "ScrapingRequest":
+        return self._shard(request_id)[request_id]
+    
+    def __setitem__(self, request_id: str, request: "ScrapingRequest") -> None:
+        self._shard(request_id)[request_id] = request
+    
+    def __delitem__(self, request_id: str) -> None:
+        del self._shard(request_id)[request_id]
+    
+    def __contains__(self, request_id: object) -> bool:
+        return request_id in self._shard(request_id)
+    
+    def __iter__(self) -> Iterator[str]:
+        return chain.from_iterable(self._shards)
     
-    def __post_init__(self):
-        if self.file_paths is None:
-            self.file_paths = []
+    def __len__(self) -> int:
+        return sum(map(len, self._shards))
+    
+    def get(self, request_id: str, default=None):
+        return self._shard(request_id).get(request_id, default)
+    
+    def pop(self, request_id: str, *default):
+        return self._shard(request_id).pop(request_id, *default)
+    
+    def items(self):
+        return chain.from_iterable(shard.items() for shard in self._shards)
 
 
 class ScrapingEngine:
@@ -70,7 +124,14 @@ class ScrapingEngine:
         self.llm_hub = LLMHub(settings)
         
         # Active requests tracking
-        self.active_requests: Dict[str, ScrapingRequest] = {}
+        self.active_requests = RequestRegistry()
+        
+        # Data pipeline, connected on first use and kept until aclose()
+        self._pipeline: Optional[DataPipeline] = None
+        self._pipeline_lock = asyncio.Lock()
+        
+        # Prompt hash -> (monotonic time stored, intent, validation)
+        self._intent_cache: "OrderedDict[bytes, Tuple[float, ExtractedIntent, ValidationResult]]" = OrderedDict()
         
         self.logger.info("Scraping engine initialized")
     
@@ -85,12 +146,30 @@ class ScrapingEngine:
         Returns:
             ScrapingResponse with complete results
         """
+        response = None
+        async for event in self.stream_request(prompt):
+            if event.stage == "complete":
+                response = event.payload
+        return response
+    
+    async def stream_request(self, prompt: str) -> AsyncIterator[ScrapingEvent]:
+        """
+        Process a scraping request, yielding an event as each stage finishes
+        
+        Each stage that succeeds yields its result: ``intent``, ``validation``,
+        ``reconnaissance``, ``strategy``, ``extraction`` and one ``export`` per
+        export result. The last event is always ``complete``, carrying the
+        ScrapingResponse, including when a stage fails.
+        
+        Args:
+            prompt: Natural language scraping request
+        """
         request_id = generate_id("req")
         start_time = time.time()
         
         self.logger.info("Processing scraping request", 
                         request_id=request_id,
-                        prompt=prompt[:100] + "..." if len(prompt) > 100 else prompt)
+                        prompt=truncate_text(prompt))
         
         response = ScrapingResponse(
             success=False,
@@ -98,124 +177,280 @@ class ScrapingEngine:
         )
         
         try:
-            # Step 1: Process user prompt
-            intent = await self.prompt_processor.process_prompt(prompt)
+            async for event in self._stages(prompt, response, start_time):
+                yield event
             
-            if not intent.target_urls:
-                response.error = "No valid URLs found in prompt"
-                return response
-            
-            # Step 2: Validate parameters
-            validation_result = await self.prompt_processor.validate_parameters(intent)
-            
-            if not validation_result.valid:
-                response.error = f"Parameter validation failed: {'; '.join(validation_result.issues)}"
-                return response
-            
-            # Create scraping request
-            scraping_request = ScrapingRequest(
-                request_id=request_id,
-                prompt=prompt,
-                intent=intent,
-                validation_result=validation_result,
-                scraping_profile=self._determine_scraping_profile(intent),
-                export_formats=[intent.output_format]
-            )
-            
-            self.active_requests[request_id] = scraping_request
-            
-            # Step 3: Perform reconnaissance on target URLs
-            site_metadata_list = []
-            for url in intent.target_urls:
-                site_metadata = await self.reconnaissance.analyze_site(url)
-                site_metadata_list.append(site_metadata)
-            
-            # Use the first site's metadata for now (could be enhanced for multi-site)
-            primary_site_metadata = site_metadata_list[0]
-            response.site_metadata = primary_site_metadata
-            
-            # Step 4: Generate scraping strategy using simplified LLM system
-            strategy = await self.llm_hub.generate_scraping_strategy(
-                html_content=primary_site_metadata.sample_html or "",
-                url=primary_site_metadata.url,
+        except Exception as e:
+            response.error = f"Request processing failed: {str(e)}"
+            response.processing_time = time.time() - start_time
+            self.logger.error("Scraping request failed", 
+                            request_id=request_id,
+                            error=str(e),
+                            exc_info=True)
+        
+        finally:
+            # Clean up active request
+            self.active_requests.pop(request_id, None)
+        
+        yield ScrapingEvent("complete", response)
+    
+    async def _stages(self,
+                      prompt: str,
+                      response: ScrapingResponse,
+                      start_time: float) -> AsyncIterator[ScrapingEvent]:
+        """Run the request stages, filling in ``response``; stops early on failure"""
+        request_id = response.request_id
+        
+        # Steps 1-2: Process user prompt and validate parameters
+        intent, validation_result = await self._resolve_prompt(prompt)
+        
+        if not intent.target_urls:
+            response.error = "No valid URLs found in prompt"
+            return
+        yield ScrapingEvent("intent", intent)
+        
+        if not validation_result.valid:
+            response.error = f"Parameter validation failed: {'; '.join(validation_result.issues)}"
+            return
+        yield ScrapingEvent("validation", validation_result)
+        
+        # Create scraping request
+        scraping_request = ScrapingRequest(
+            request_id=request_id,
+            prompt=prompt,
+            intent=intent,
+            validation_result=validation_result,
+            scraping_profile=self._determine_scraping_profile(intent),
+            export_formats=[intent.output_format]
+        )
+        
+        self.active_requests[request_id] = scraping_request
+        
+        # Step 3: Perform reconnaissance on target URLs
+        site_metadata_list, site_errors = await self._analyze_sites(intent.target_urls)
+        
+        if not site_metadata_list:
+            response.error = "; ".join(site_errors)
+            return
+        
+        # Sites that failed reconnaissance are reported as partial errors
+        if site_errors:
+            response.error = "; ".join(site_errors)
+        
+        # The first site describes the request in exports
+        primary_site_metadata = site_metadata_list[0]
+        response.site_metadata = primary_site_metadata
+        yield ScrapingEvent("reconnaissance", site_metadata_list)
+        
+        # Step 4: Generate one scraping strategy per site in a single batched LLM call
+        strategies = await self.llm_hub.generate_scraping_strategies([
+            StrategyRequest(
+                html_content=site_metadata.sample_html or "",
+                url=site_metadata.url,
                 user_intent=intent.intent_description,
                 extraction_fields=intent.data_fields
             )
-            
-            if not strategy.success:
-                response.error = f"Strategy generation failed: {strategy.reasoning}"
-                return response
-            
+            for site_metadata in site_metadata_list
+        ])
+        
+        targets = []
+        for site_metadata, strategy in zip(site_metadata_list, strategies):
+            if strategy.success:
+                targets.append((site_metadata, strategy))
+            else:
+                self.logger.warning("Strategy generation failed for site",
+                                  url=site_metadata.url,
+                                  reason=strategy.reasoning)
+        
+        if not targets:
+            reasons = "; ".join(
+                f"{site_metadata.url}: {strategy.reasoning}"
+                for site_metadata, strategy in zip(site_metadata_list, strategies)
+            )
+            response.error = f"Strategy generation failed: {reasons}"
+            return
+        
+        for site_metadata, strategy in targets:
             self.logger.info("Scraping strategy generated successfully",
+                           url=site_metadata.url,
                            provider=strategy.provider_used,
+                           cached=strategy.cached,
                            confidence=strategy.confidence_score,
                            selectors_count=len(strategy.selectors),
                            cost=strategy.cost)
-            
-            # Step 5: Execute scraping with dynamic scraper using generated strategy
-            async with DynamicScraper(self.settings, self.llm_hub) as scraper:
-                extraction_result = await scraper.scrape_with_strategy(
-                    site_metadata=primary_site_metadata,
+        yield ScrapingEvent("strategy", [strategy for _, strategy in targets])
+        
+        # Step 5: Execute scraping with dynamic scrapers using generated strategies
+        extraction_result = await self._scrape_sites(
+            targets,
+            user_requirements=self._build_user_requirements(intent),
+            scraping_profile=scraping_request.scraping_profile
+        )
+        
+        response.extraction_result = extraction_result
+        response.pages_processed = extraction_result.pages_processed
+        response.total_records = extraction_result.total_items
+        
+        if not extraction_result.success:
+            response.error = f"Data extraction failed: {'; '.join(extraction_result.errors)}"
+            return
+        yield ScrapingEvent("extraction", extraction_result)
+        
+        # Step 6: Process and export data
+        pipeline = await self._get_pipeline()
+        pipeline_result = await pipeline.process_and_export(
+            data=extraction_result.data,
+            export_formats=scraping_request.export_formats,
+            metadata=self._build_export_metadata(intent, primary_site_metadata)
+        )
+        
+        response.pipeline_result = pipeline_result
+        
+        if not pipeline_result.success:
+            response.error = f"Data processing/export failed: {'; '.join(pipeline_result.errors)}"
+            return
+        
+        # Set response details
+        response.success = True
+        response.processing_time = time.time() - start_time
+        
+        # Extract export URLs and file paths
+        for export_result in pipeline_result.export_results:
+            if export_result.success:
+                if export_result.export_url:
+                    response.export_url = export_result.export_url
+                if export_result.file_path:
+                    response.file_paths.append(export_result.file_path)
+            yield ScrapingEvent("export", export_result)
+        
+        self.logger.info("Scraping request completed successfully",
+                       request_id=request_id,
+                       records=response.total_records,
+                       pages=response.pages_processed,
+                       time=response.processing_time,
+                       exports=len(pipeline_result.export_results))
+    
+    async def _get_pipeline(self) -> DataPipeline:
+        """Connected data pipeline shared by every request, opened on first use"""
+        if self._pipeline is None:
+            async with self._pipeline_lock:
+                if self._pipeline is None:
+                    pipeline = DataPipeline(self.settings)
+                    await pipeline.__aenter__()
+                    self._pipeline = pipeline
+        return self._pipeline
+    
+    async def aclose(self):
+        """Close the data pipeline's storage connection, if it was opened"""
+        pipeline, self._pipeline = self._pipeline, None
+        if pipeline is not None:
+            await pipeline.__aexit__(None, None, None)
+    
+    async def _resolve_prompt(self, prompt: str) -> Tuple[ExtractedIntent, Optional[ValidationResult]]:
+        """
+        Parse and validate a prompt, reusing the result for a repeated prompt
+        
+        Valid results are kept in an LRU of ``scraping.intent_cache_size``
+        entries for ``scraping.intent_cache_ttl`` seconds. Validation is None
+        when the prompt names no URLs.
+        """
+        config = self.settings.scraping
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        
+        entry = self._intent_cache.get(key)
+        if entry is not None:
+            stored_at, intent, validation_result = entry
+            if time.monotonic() - stored_at < config.intent_cache_ttl:
+                self._intent_cache.move_to_end(key)
+                self.logger.debug("Reusing cached prompt intent")
+                return copy.deepcopy(intent), copy.deepcopy(validation_result)
+            del self._intent_cache[key]
+        
+        intent = await self.prompt_processor.process_prompt(prompt)
+        if not intent.target_urls:
+            return intent, None
+        
+        validation_result = await self.prompt_processor.validate_parameters(intent)
+        
+        if validation_result.valid and config.intent_cache_size > 0:
+            self._intent_cache[key] = (time.monotonic(), copy.deepcopy(intent), copy.deepcopy(validation_result))
+            while len(self._intent_cache) > config.intent_cache_size:
+                self._intent_cache.popitem(last=False)
+        
+        return intent, validation_result
+    
+    async def _analyze_sites(self, urls: List[str]) -> Tuple[List[SiteMetadata], List[str]]:
+        """
+        Run reconnaissance on all URLs concurrently
+        
+        Each analysis launches a browser, so at most
+        ``scraping.max_concurrent_browsers`` run at once.
+        
+        Returns:
+            Metadata for the sites that succeeded, in the order of ``urls``,
+            and a ``"<url>: <error>"`` entry for each site that failed
+        """
+        semaphore = asyncio.Semaphore(self.settings.scraping.max_concurrent_browsers)
+        
+        async def analyze(url: str) -> SiteMetadata:
+            async with semaphore:
+                return await self.reconnaissance.analyze_site(url)
+        
+        results = await asyncio.gather(*(analyze(url) for url in urls), return_exceptions=True)
+        
+        site_metadata_list = []
+        errors = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                self.logger.warning("Site reconnaissance failed", url=url, error=str(result))
+                errors.append(f"{url}: {result}")
+            else:
+                site_metadata_list.append(result)
+        return site_metadata_list, errors
+    
+    async def _scrape_sites(self,
+                            targets: List[Tuple[SiteMetadata, ScrapingStrategy]],
+                            user_requirements: Dict[str, Any],
+                            scraping_profile: str) -> ExtractionResult:
+        """
+        Scrape every site with its strategy concurrently and merge the results
+        
+        At most ``scraping.max_concurrent_browsers`` sites are scraped at
+        once. Each site gets its own DynamicScraper, which keeps the current
+        strategy and counters on the instance. The merged result succeeds
+        when any site did.
+        """
+        semaphore = asyncio.Semaphore(self.settings.scraping.max_concurrent_browsers)
+        
+        async def scrape(site_metadata: SiteMetadata, strategy: ScrapingStrategy) -> ExtractionResult:
+            async with semaphore, DynamicScraper(self.settings, self.llm_hub) as scraper:
+                return await scraper.scrape_with_strategy(
+                    site_metadata=site_metadata,
                     strategy=strategy,
-                    user_requirements=self._build_user_requirements(intent),
-                    scraping_profile=scraping_request.scraping_profile
-                )
-                
-                response.extraction_result = extraction_result
-                response.pages_processed = extraction_result.pages_processed
-                response.total_records = extraction_result.total_items
-            
-            if not extraction_result.success:
-                response.error = f"Data extraction failed: {'; '.join(extraction_result.errors)}"
-                return response
-            
-            # Step 6: Process and export data
-            async with DataPipeline(self.settings) as pipeline:
-                pipeline_result = await pipeline.process_and_export(
-                    data=extraction_result.data,
-                    export_formats=scraping_request.export_formats,
-                    metadata=self._build_export_metadata(intent, primary_site_metadata)
+                    user_requirements=user_requirements,
+                    scraping_profile=scraping_profile
                 )
-                
-                response.pipeline_result = pipeline_result
-            
-            if not pipeline_result.success:
-                response.error = f"Data processing/export failed: {'; '.join(pipeline_result.errors)}"
-                return response
-            
-            # Set response details
-            response.success = True
-            response.processing_time = time.time() - start_time
-            
-            # Extract export URLs and file paths
-            for export_result in pipeline_result.export_results:
-                if export_result.success:
-                    if export_result.export_url:
-                        response.export_url = export_result.export_url
-                    if export_result.file_path:
-                        response.file_paths.append(export_result.file_path)
-            
-            self.logger.info("Scraping request completed successfully",
-                           request_id=request_id,
-                           records=response.total_records,
-                           pages=response.pages_processed,
-                           time=response.processing_time,
-                           exports=len(pipeline_result.export_results))
-            
-        except Exception as e:
-            response.error = f"Request processing failed: {str(e)}"
-            response.processing_time = time.time() - start_time
-            self.logger.error("Scraping request failed", 
-                            request_id=request_id,
-                            error=str(e),
-                            exc_info=True)
         
-        finally:
-            # Clean up active request
-            if request_id in self.active_requests:
-                del self.active_requests[request_id]
+        results = await asyncio.gather(*(scrape(*target) for target in targets), return_exceptions=True)
+        if len(results) == 1 and not isinstance(results[0], BaseException):
+            return results[0]
         
-        return response
+        merged = ExtractionResult(success=False)
+        for (site_metadata, _), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                merged.add_error(f"{site_metadata.url}: {result}")
+                continue
+            
+            merged.success = merged.success or result.success
+            merged.add_data(result.data)
+            merged.pages_processed += result.pages_processed
+            for error in result.errors:
+                merged.add_error(f"{site_metadata.url}: {error}")
+        return merged
     
     def _determine_scraping_profile(self, intent: ExtractedIntent) -> str:
         """Determine appropriate scraping profile based on intent"""
@@ -259,7 +494,8 @@ class ScrapingEngine:
     
     def _build_export_metadata(self, intent: ExtractedIntent, site_metadata: SiteMetadata) -> Dict[str, Any]:
         """Build metadata for export operations"""
-        domain = urlparse(site_metadata.url).netloc
+        domain = site_metadata.domain
+        now = time.time()
         
         return {
             "source_url": site_metadata.url,
@@ -267,18 +503,18 @@ class ScrapingEngine:
             "scraping_type": intent.scraping_type,
             "data_fields": intent.data_fields,
             "filters_applied": intent.filters,
-            "extraction_timestamp": time.time(),
+            "extraction_timestamp": now,
             "iwsa_version": "1.0.0",
-            "spreadsheet_name": f"IWSA_{domain}_{int(time.time())}",
-            "worksheet_name": f"{intent.scraping_type.title()} Data"
+            "spreadsheet_name": f"IWSA_{domain}_{int(now)}",
+            "worksheet_name": f"{intent.scraping_type_title} Data"
         }
     
     async def get_request_status(self, request_id: str) -> Optional[Dict[str, Any]]:
         """Get status of active scraping request"""
-        if request_id not in self.active_requests:
+        request = self.active_requests.get(request_id)
+        if request is None:
             return None
         
-        request = self.active_requests[request_id]
         return {
             "request_id": request_id,
             "status": "processing",
@@ -291,8 +527,7 @@ class ScrapingEngine:
     
     async def cancel_request(self, request_id: str) -> bool:
         """Cancel active scraping request"""
-        if request_id in self.active_requests:
-            del self.active_requests[request_id]
+        if self.active_requests.pop(request_id, None) is not None:
             self.logger.info("Scraping request cancelled", request_id=request_id)
             return True
         return False
@@ -308,30 +543,25 @@ class ScrapingEngine:
         
         issues = []
         
-        try:
-            # Check LLM Hub health
-            llm_health = await self.llm_hub.health_check()
-            health_status["components"]["llm_hub"] = llm_health
-            
-            if llm_health["overall_health"] != "healthy":
-                issues.append("LLM Hub issues detected")
-        
-        except Exception as e:
-            health_status["components"]["llm_hub"] = {"status": "error", "error": str(e)}
-            issues.append(f"LLM Hub error: {str(e)}")
-        
-        try:
-            # Check data pipeline health (requires initialization)
-            async with DataPipeline(self.settings) as pipeline:
-                pipeline_health = await pipeline.validate_pipeline_health()
-                health_status["components"]["data_pipeline"] = pipeline_health
-                
-                if pipeline_health["overall_health"] != "healthy":
-                    issues.append("Data Pipeline issues detected")
+        # LLM Hub and data pipeline checks are independent I/O; run them together
+        llm_health, pipeline_health = await asyncio.gather(
+            self.llm_hub.health_check(),
+            self._check_pipeline_health(),
+            return_exceptions=True
+        )
         
-        except Exception as e:
-            health_status["components"]["data_pipeline"] = {"status": "error", "error": str(e)}
-            issues.append(f"Data Pipeline error: {str(e)}")
+        for component, name, result in (("llm_hub", "LLM Hub", llm_health),
+                                        ("data_pipeline", "Data Pipeline", pipeline_health)):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                health_status["components"][component] = {"status": "error", "error": str(result)}
+                issues.append(f"{name} error: {str(result)}")
+                continue
+            
+            health_status["components"][component] = result
+            if result.get("overall_health") != "healthy":
+                issues.append(f"{name} issues detected")
         
         # Check prompt processor
         try:
@@ -354,6 +584,11 @@ class ScrapingEngine:
         
         return health_status
     
+    async def _check_pipeline_health(self) -> Dict[str, Any]:
+        """Check data pipeline health (requires initialization)"""
+        pipeline = await self._get_pipeline()
+        return await pipeline.validate_pipeline_health()
+    
     async def get_system_stats(self) -> Dict[str, Any]:
         """Get comprehensive system statistics"""
         stats = {
@@ -372,8 +607,8 @@ class ScrapingEngine:
         
         try:
             # Get pipeline stats
-            async with DataPipeline(self.settings) as pipeline:
-                stats["data_pipeline"] = await pipeline.get_pipeline_stats()
+            pipeline = await self._get_pipeline()
+            stats["data_pipeline"] = await pipeline.get_pipeline_stats()
         except Exception as e:
             stats["data_pipeline"] = {"error": str(e)}
         
@@ -382,39 +617,18 @@ class ScrapingEngine:
     async def estimate_request_cost(self, prompt: str) -> Dict[str, Any]:
         """Estimate cost and resources for a scraping request"""
         try:
-            # Process prompt to get intent
-            intent = await self.prompt_processor.process_prompt(prompt)
+            # Process prompt to get intent and validate parameters
+            intent, validation_result = await self._resolve_prompt(prompt)
             
             if not intent.target_urls:
                 return {"error": "No valid URLs found"}
             
-            # Validate parameters
-            validation_result = await self.prompt_processor.validate_parameters(intent)
-            
-            # Estimate LLM costs
-            estimated_llm_cost = 0.0
-            
-            # HTML analysis cost (per URL)
-            for url in intent.target_urls:
-                html_analysis_cost = self.llm_hub.estimate_cost(
-                    "html_analysis", 
-                    {"html_content": "x" * 10000, "url": url, "user_intent": prompt}
-                )
-                estimated_llm_cost += html_analysis_cost
-            
-            # Strategy generation cost
-            strategy_cost = self.llm_hub.estimate_cost(
-                "strategy_generation",
-                {"site_structure": {}, "user_requirements": {}}
+            # Estimate LLM costs: every target page goes into one batched
+            # strategy call, priced on representative placeholder pages
+            estimated_llm_cost = self.llm_hub.estimate_unfetched_cost(
+                intent.intent_description,
+                pages=len(intent.target_urls)
             )
-            estimated_llm_cost += strategy_cost
-            
-            # Quality assessment cost
-            quality_cost = self.llm_hub.estimate_cost(
-                "quality_assessment",
-                {"extracted_data": [{}] * 10}
-            )
-            estimated_llm_cost += quality_cost
             
             return {
                 "estimated_cost_usd": estimated_llm_cost,
@@ -442,4 +656,10 @@ class ScrapingEngine:
                 "estimated_volume": request.intent.volume_estimate
             }
             for req_id, request in self.active_requests.items()
-        ]
\ No newline at end of file
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> ScrapingEngine:
+    """Get the process-wide scraping engine, built from the shared settings"""
+    return ScrapingEngine(get_settings())
@@ -7,6 +7,7 @@ import json
 import asyncio
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
+from functools import cached_property
 from urllib.parse import urlparse, urljoin
 from pydantic import BaseModel, Field, validator
 import aiohttp
@@ -44,6 +45,11 @@ class ExtractedIntent:
     geographic_filter: Optional[str] = None
     language: str = "en"
     
+    @cached_property
+    def scraping_type_title(self) -> str:
+        """Display form of ``scraping_type``, computed once it is first read"""
+        return self.scraping_type.title()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
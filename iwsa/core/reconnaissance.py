@@ -89,6 +89,13 @@ class SiteMetadata:
     language: str = "en"
     geo_restricted: bool = False
     
+    # Host part of ``url``, parsed once for exports and logging
+    domain: str = ""
+    
+    def __post_init__(self):
+        if not self.domain:
+            self.domain = urlparse(self.url).netloc
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
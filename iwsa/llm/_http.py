@@ -0,0 +1,64 @@
+"""
+Shared HTTP session for LLM providers
+One pooled aiohttp session per event loop, so provider calls reuse TCP/TLS connections
+"""
+
+import asyncio
+
+import aiohttp
+
+
+# Connection pool limits for the shared session
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 50
+KEEPALIVE_TIMEOUT = 60.0
+CONNECT_TIMEOUT = 5.0
+
+# event loop -> (session, closer); aiohttp sessions cannot cross event loops
+_sessions = {}
+
+
+async def _close_with_loop(loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession):
+    """
+    Async generator that closes ``session`` when the loop shuts down
+    
+    Once started, the loop tracks it as a live async generator and
+    ``shutdown_asyncgens()`` (run by ``asyncio.run``) finalizes it,
+    which closes the session before the loop goes away.
+    """
+    try:
+        yield
+    finally:
+        if _sessions.get(loop, (None,))[0] is session:
+            del _sessions[loop]
+        await session.close()
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get the pooled session for the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    
+    entry = _sessions.get(loop)
+    if entry is not None and not entry[0].closed:
+        return entry[0]
+    
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT
+        ),
+        timeout=aiohttp.ClientTimeout(total=60, connect=CONNECT_TIMEOUT)
+    )
+    closer = _close_with_loop(loop, session)
+    await closer.__anext__()
+    
+    _sessions[loop] = (session, closer)
+    return session
+
+
+async def close_shared_session():
+    """Close the running loop's shared session, if one was created"""
+    entry = _sessions.get(asyncio.get_running_loop())
+    if entry is not None:
+        await entry[1].aclose()
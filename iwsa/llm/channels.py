@@ -9,6 +9,7 @@ from dataclasses import dataclass
 
 from .providers import LLMRequest, LLMResponse
 from ..utils.logger import ComponentLogger
+from ..utils.helpers import json_loads
 
 
 @dataclass
@@ -51,10 +52,10 @@ class BaseChannel(ABC):
             
             if start_idx != -1 and end_idx > start_idx:
                 json_str = content[start_idx:end_idx]
-                return json.loads(json_str)
+                return json_loads(json_str)
             
             # If no JSON found, try parsing entire content
-            return json.loads(content)
+            return json_loads(content)
             
         except json.JSONDecodeError:
             self.logger.warning("Failed to extract JSON from response", content=content[:200])
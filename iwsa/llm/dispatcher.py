@@ -0,0 +1,104 @@
+"""
+Fleet Dispatcher - coalesce concurrent strategy requests into one provider call
+Requests arriving within a short window share a single numbered prompt
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from .strategy_generator import LLMStrategyGenerator, ScrapingStrategy, StrategyRequest
+from ..utils.logger import ComponentLogger
+
+
+class FleetDispatcher:
+    """
+    Pools concurrent ``generate_scraping_strategy`` callers
+    
+    Each submitted request waits at most ``window_ms`` for company. The
+    pending queue is flushed when the window elapses or ``max_batch``
+    requests have queued up, whichever comes first, and the whole batch is
+    answered by one provider round-trip. A lone request goes through the
+    regular single-strategy path.
+    """
+    
+    def __init__(self,
+                 strategy_generator: LLMStrategyGenerator,
+                 window_ms: int = 50,
+                 max_batch: int = 16):
+        self.strategy_generator = strategy_generator
+        self.window = window_ms / 1000.0
+        self.max_batch = max(1, max_batch)
+        self.logger = ComponentLogger("fleet_dispatcher")
+        
+        self._pending: Deque[Tuple[StrategyRequest, asyncio.Future]] = deque()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+    
+    async def submit(self,
+                     html_content: str,
+                     url: str,
+                     user_intent: str,
+                     extraction_fields: List[str] = None,
+                     latency_budget_ms: Optional[int] = None) -> ScrapingStrategy:
+        """
+        Queue a strategy request and wait for its result
+        
+        Args:
+            html_content: HTML content to analyze
+            url: Source URL
+            user_intent: What the user wants to extract
+            extraction_fields: Specific fields to extract
+            latency_budget_ms: Callers that cannot wait out the batching
+                window flush the queue immediately
+        
+        Returns:
+            Complete scraping strategy
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request = StrategyRequest(html_content, url, user_intent, extraction_fields)
+        self._pending.append((request, future))
+        
+        in_a_hurry = latency_budget_ms is not None and latency_budget_ms / 1000.0 <= self.window
+        if len(self._pending) >= self.max_batch or in_a_hurry:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Hand every pending request to background batch tasks"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        while self._pending:
+            batch = [self._pending.popleft() for _ in range(min(self.max_batch, len(self._pending)))]
+            task = asyncio.ensure_future(self._run_batch(batch))
+            # Keep a reference so the task is not garbage collected mid-flight
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, batch: List[Tuple[StrategyRequest, asyncio.Future]]):
+        """Generate strategies for one batch and resolve its futures"""
+        requests = [request for request, _ in batch]
+        
+        if len(requests) > 1:
+            self.logger.debug("Dispatching batched strategy request", batch_size=len(requests))
+        
+        try:
+            strategies = await self.strategy_generator.generate_scraping_strategies(requests)
+        except Exception as e:
+            self.logger.error("Batched strategy generation failed",
+                            batch_size=len(requests),
+                            error=str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), strategy in zip(batch, strategies):
+            if not future.done():
+                future.set_result(strategy)
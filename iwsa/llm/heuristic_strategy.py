@@ -0,0 +1,142 @@
+"""
+Heuristic Strategy - direct selectors for trivially structured pages
+Small pages where every requested field has one obvious element skip the LLM
+"""
+
+import re
+from collections import Counter
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+from .html_skeleton import SKIPPED_TAGS, VOID_TAGS
+from .strategy_generator import ScrapingStrategy
+
+
+# Pages larger or more varied than this are left to the LLM
+MAX_ELEMENTS = 40
+MAX_CLASSES = 5
+
+# Class-name fragments that identify a field
+FIELD_ALIASES = {
+    "title": ("title", "name", "heading"),
+    "price": ("price", "cost", "amount"),
+    "link": ("link", "url"),
+    "image": ("image", "img", "photo", "thumbnail"),
+    "description": ("description", "desc", "summary"),
+}
+
+# Semantic tags that stand in for a field when no class matches
+FIELD_TAGS = {
+    "title": "h1",
+    "link": "a",
+    "image": "img",
+}
+
+_WORDS = re.compile(r"[a-z]+")
+
+
+class _ElementParser(HTMLParser):
+    """Collects (tag, classes) for every structural element"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.elements: List[Tuple[str, Tuple[str, ...]]] = []
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            if tag not in VOID_TAGS:
+                self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        
+        classes = tuple((dict(attrs).get("class") or "").split())
+        self.elements.append((tag, classes))
+    
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and tag not in VOID_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+
+
+def _requested_fields(user_intent: str, extraction_fields: Optional[List[str]]) -> List[str]:
+    """Explicit fields, or the known field names mentioned in the intent"""
+    if extraction_fields:
+        return list(extraction_fields)
+    words = set(_WORDS.findall(user_intent.lower()))
+    return [field for field in FIELD_ALIASES if field in words]
+
+
+def _field_selector(field: str,
+                    class_counts: Counter,
+                    tag_counts: Counter) -> Optional[str]:
+    """Selector for the single element that holds ``field``, if unambiguous"""
+    normalized = field.lower().replace("_", "-")
+    aliases = FIELD_ALIASES.get(normalized, (normalized,))
+    
+    matches = {cls for cls in class_counts if any(alias in cls.lower() for alias in aliases)}
+    if len(matches) == 1:
+        cls = matches.pop()
+        return f".{cls}" if class_counts[cls] == 1 else None
+    if matches:
+        return None
+    
+    tag = FIELD_TAGS.get(normalized)
+    if tag and tag_counts[tag] == 1:
+        return tag
+    return None
+
+
+def try_trivial_strategy(html_content: str,
+                         user_intent: str,
+                         extraction_fields: Optional[List[str]] = None) -> Optional[ScrapingStrategy]:
+    """
+    Build a strategy without the LLM when the page is trivially structured
+    
+    A page qualifies when it is small (``MAX_ELEMENTS``), uses at most
+    ``MAX_CLASSES`` distinct classes, and every requested field maps to a
+    class or semantic tag that occurs exactly once.
+    
+    Args:
+        html_content: HTML content to analyze
+        user_intent: What the user wants to extract (fields are read from it
+            when ``extraction_fields`` is not given)
+        extraction_fields: Specific fields to extract
+    
+    Returns:
+        A heuristic strategy, or None when the LLM is needed
+    """
+    fields = _requested_fields(user_intent, extraction_fields)
+    if not fields:
+        return None
+    
+    parser = _ElementParser()
+    parser.feed(html_content)
+    parser.close()
+    
+    elements = parser.elements
+    if not elements or len(elements) > MAX_ELEMENTS:
+        return None
+    
+    class_counts = Counter(cls for _, classes in elements for cls in classes)
+    if len(class_counts) > MAX_CLASSES:
+        return None
+    tag_counts = Counter(tag for tag, _ in elements)
+    
+    mapping: Dict[str, str] = {}
+    for field in fields:
+        selector = _field_selector(field, class_counts, tag_counts)
+        if selector is None:
+            return None
+        mapping[field] = selector
+    
+    return ScrapingStrategy(
+        success=True,
+        selectors=list(mapping.values()),
+        extraction_logic="; ".join(f"{field}: text of {selector}" for field, selector in mapping.items()),
+        pagination_strategy={"type": "none", "selectors": [], "logic": "single page"},
+        confidence_score=0.8,
+        reasoning="Trivially structured page: each requested field maps to exactly one element",
+        provider_used="heuristic",
+        cost=0.0
+    )
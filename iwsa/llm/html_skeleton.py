@@ -0,0 +1,168 @@
+"""
+HTML Skeleton - reduce a page to the markup an LLM needs to write selectors
+Drops scripts, styles, text, non-selector attributes and repeated siblings before prompting
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+
+# Tags that carry no page structure worth keeping
+SKIPPED_TAGS = {"script", "style", "svg", "noscript", "iframe", "meta", "link"}
+
+# Elements that never have a closing tag
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+              "link", "meta", "param", "source", "track", "wbr"}
+
+# Attributes worth keeping for selector generation, besides class and id
+_KEPT_ATTRIBUTES = ("role", "name", "href")
+
+# Placeholder for a run of text content
+TEXT_PLACEHOLDER = "•"
+
+# Copies of an identical sibling subtree kept before the rest are counted
+REPEATS_KEPT = 2
+
+_DIGITS = re.compile(r"\d+")
+
+
+def _href_pattern(href: str) -> str:
+    """Keep the shape of a link (scheme-less path, numbers folded) without its query"""
+    path = urlsplit(href).path
+    return _DIGITS.sub("0", path) if path else ""
+
+
+class _CompactParser(HTMLParser):
+    """
+    Serializes the element tree as ``<tag.class#id[attr=value]>`` tokens
+    
+    Each open element collects its serialized children as ``[part, count]``
+    runs, so consecutive identical siblings (list items, cards, table rows)
+    are counted instead of repeated.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # Open elements as (tag, token, child runs); the first entry is the document
+        self._stack: List[Tuple[str, str, List[list]]] = [("", "", [])]
+        self._skip_depth = 0
+        self._pending_text = False
+    
+    def _append(self, part: str):
+        children = self._stack[-1][2]
+        if children and children[-1][0] == part:
+            children[-1][1] += 1
+        else:
+            children.append([part, 1])
+    
+    def _flush_text(self):
+        if self._pending_text:
+            self._append(TEXT_PLACEHOLDER)
+            self._pending_text = False
+    
+    def _close_element(self):
+        tag, token, children = self._stack.pop()
+        self._append(f"<{token}>{_render(children)}</{tag}>")
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            if tag not in VOID_TAGS:
+                self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        
+        self._flush_text()
+        
+        token = tag
+        attributes = dict(attrs)
+        if attributes.get("id"):
+            token += f"#{attributes['id']}"
+        if attributes.get("class"):
+            token += "".join(f".{cls}" for cls in attributes["class"].split())
+        for name in _KEPT_ATTRIBUTES:
+            value = attributes.get(name)
+            if name == "href" and value:
+                value = _href_pattern(value)
+            if value:
+                token += f"[{name}={value}]"
+        
+        if tag in VOID_TAGS:
+            self._append(f"<{token}>")
+        else:
+            self._stack.append((tag, token, []))
+    
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing <svg/> and friends open nothing that needs skipping
+        if tag not in SKIPPED_TAGS:
+            self.handle_starttag(tag, attrs)
+            if tag not in VOID_TAGS and not self._skip_depth:
+                self._close_element()
+    
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            if tag not in VOID_TAGS:
+                self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if self._skip_depth or tag in VOID_TAGS:
+            return
+        # Stray end tags close nothing
+        if not any(open_tag == tag for open_tag, _, _ in self._stack[1:]):
+            return
+        
+        self._flush_text()
+        # Elements left unclosed inside this one end with it
+        while self._stack[-1][0] != tag:
+            self._close_element()
+        self._close_element()
+    
+    def handle_data(self, data):
+        if not self._skip_depth and data.strip():
+            self._pending_text = True
+    
+    def result(self) -> str:
+        """Serialize the document, closing any elements still open"""
+        self._flush_text()
+        while len(self._stack) > 1:
+            self._close_element()
+        return _render(self._stack[0][2])
+
+
+def _render(children: List[list]) -> str:
+    """Join child runs, keeping ``REPEATS_KEPT`` copies of each repeated sibling"""
+    parts = []
+    for part, count in children:
+        parts.append(part * min(count, REPEATS_KEPT))
+        if count > REPEATS_KEPT:
+            parts.append(f"[+{count - REPEATS_KEPT} more]")
+    return "".join(parts)
+
+
+def skeletonize(html_content: str, max_chars: int = 8000) -> str:
+    """
+    Reduce HTML to a compact tag/class/id skeleton for LLM prompts
+    
+    Text runs collapse to a single placeholder, comments, scripts, styles,
+    SVG and ``data-*``/inline-style attributes are dropped, and only the
+    attributes useful for selectors (class, id, role, name and the link
+    path pattern) are kept. Runs of identical sibling subtrees keep
+    ``REPEATS_KEPT`` copies followed by a ``[+N more]`` count, so long
+    listings don't use up ``max_chars`` before the rest of the page.
+    
+    Args:
+        html_content: Raw HTML
+        max_chars: Maximum length of the returned skeleton
+    
+    Returns:
+        Compact skeleton such as ``<div.job-card><h3.title>•</h3></div>``
+    """
+    parser = _CompactParser()
+    parser.feed(html_content)
+    parser.close()
+    
+    skeleton = parser.result()
+    if len(skeleton) > max_chars:
+        skeleton = skeleton[:max_chars] + "... [truncated]"
+    return skeleton
@@ -3,14 +3,35 @@ LLM Hub - Simplified single-purpose LLM system
 Purpose: HTML analysis → scraping strategy generation
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import copy
+import hashlib
+import sys
+from typing import AsyncIterator, Dict, List, Optional, Any
 from dataclasses import dataclass
 
-from .strategy_generator import LLMStrategyGenerator, ScrapingStrategy
+from .strategy_generator import LLMStrategyGenerator, PartialStrategy, ScrapingStrategy, StrategyRequest
+from .strategy_cache import StrategyCache
+from .dispatcher import FleetDispatcher
+from .html_skeleton import skeletonize
+from .heuristic_strategy import try_trivial_strategy
 from ..config import Settings
 from ..utils.logger import ComponentLogger
 
 
+# Page assumed for each site when pricing a request before anything is fetched:
+# PAGE_CHARS of markup, as a raw listing or as its prompt skeleton
+ESTIMATE_PAGE_CHARS = 10000
+_ESTIMATE_RAW_ROW = (
+    '<div class="result-card"><h3 class="title"><a href="/listing/123">Listing title</a></h3>'
+    '<span class="price">$1,234</span><p class="summary">Short description of the listing</p></div>'
+)
+_ESTIMATE_SKELETON_ROW = (
+    '<div.result-card><h3.title><a[href=/listing/0]>•</a></h3>'
+    '<span.price>•</span><p.summary>•</p></div>'
+)
+
+
 class LLMHub:
     """
     Simplified LLM Hub - Single purpose: HTML → scraping strategy
@@ -24,13 +45,34 @@ class LLMHub:
         # Single-purpose strategy generator
         self.strategy_generator = LLMStrategyGenerator(settings)
         
+        # Structure-keyed cache so recurring page templates skip the LLM
+        self.strategy_cache = None
+        if settings.llm.strategy_cache_enabled:
+            self.strategy_cache = StrategyCache(
+                cache_dir=settings.llm.strategy_cache_dir,
+                similarity_threshold=settings.llm.strategy_cache_similarity
+            )
+        
+        # Concurrent requests within the batching window share one provider call
+        self.dispatcher = None
+        if settings.llm.batch_window_ms > 0:
+            self.dispatcher = FleetDispatcher(
+                self.strategy_generator,
+                window_ms=settings.llm.batch_window_ms,
+                max_batch=settings.llm.batch_max_size
+            )
+        
+        # Request key -> task running the LLM call for it
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
         self.logger.info("LLM Hub initialized with single-purpose strategy generator")
     
     async def generate_scraping_strategy(self,
                                         html_content: str,
                                         url: str,
                                         user_intent: str,
-                                        extraction_fields: List[str] = None) -> ScrapingStrategy:
+                                        extraction_fields: List[str] = None,
+                                        latency_budget_ms: Optional[int] = None) -> ScrapingStrategy:
         """
         Single LLM purpose: Analyze HTML and generate complete scraping strategy
         Uses multiple providers for reliability: TinyLlama → OpenAI → Claude → HuggingFace
@@ -40,16 +82,233 @@ class LLMHub:
             url: Source URL
             user_intent: What the user wants to extract
             extraction_fields: Specific fields to extract
+            latency_budget_ms: Skip the batching window when it is tighter than this
             
         Returns:
             Complete scraping strategy with selectors, pagination, filters, etc.
         """
-        return await self.strategy_generator.generate_scraping_strategy(
-            html_content=html_content,
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        extraction_fields = self._intern_fields(extraction_fields)
+        
+        strategy = self._strategy_without_llm(html_content, url, user_intent, extraction_fields)
+        if strategy is not None:
+            strategy.response_time = loop.time() - start_time
+            return strategy
+        
+        prompt_html = self._prompt_html(html_content)
+        
+        # Identical requests already in flight share that call's result. The
+        # call runs in its own task so it survives any one caller being cancelled
+        key = self._inflight_key(prompt_html, user_intent, extraction_fields)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.logger.debug("Joining in-flight strategy request", url=url)
+        else:
+            task = asyncio.ensure_future(self._generate_with_llm(
+                html_content, prompt_html, url, user_intent, extraction_fields, latency_budget_ms
+            ))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        
+        # Every caller gets its own copy of the shared strategy
+        return copy.deepcopy(await asyncio.shield(task))
+    
+    async def _generate_with_llm(self,
+                                 html_content: str,
+                                 prompt_html: str,
+                                 url: str,
+                                 user_intent: str,
+                                 extraction_fields: Optional[List[str]],
+                                 latency_budget_ms: Optional[int]) -> ScrapingStrategy:
+        """Generate a strategy through the dispatcher or the generator, caching success"""
+        if self.dispatcher is not None:
+            strategy = await self.dispatcher.submit(
+                html_content=prompt_html,
+                url=url,
+                user_intent=user_intent,
+                extraction_fields=extraction_fields,
+                latency_budget_ms=latency_budget_ms
+            )
+        else:
+            strategy = await self.strategy_generator.generate_scraping_strategy(
+                html_content=prompt_html,
+                url=url,
+                user_intent=user_intent,
+                extraction_fields=extraction_fields
+            )
+        
+        if self.strategy_cache is not None and strategy.success:
+            self.strategy_cache.set(html_content, user_intent, extraction_fields, strategy)
+        
+        return strategy
+    
+    def _finish_inflight(self, key: str, task: asyncio.Task):
+        """Forget a finished in-flight call"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark retrieved so a failure every caller abandoned doesn't log a warning
+        if not task.cancelled():
+            task.exception()
+    
+    async def generate_scraping_strategies(self, requests: List[StrategyRequest]) -> List[ScrapingStrategy]:
+        """
+        Generate strategies for several pages with one provider round-trip
+        
+        Requests the cache or heuristic can answer are resolved first; the
+        rest go to the provider together as a single batched prompt.
+        
+        Args:
+            requests: Strategy requests, typically one per target URL
+            
+        Returns:
+            One strategy per request, in order
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        strategies: List[Optional[ScrapingStrategy]] = []
+        pending: List[int] = []
+        fields = [self._intern_fields(request.extraction_fields) for request in requests]
+        for i, request in enumerate(requests):
+            strategy = self._strategy_without_llm(request.html_content,
+                                                  request.url,
+                                                  request.user_intent,
+                                                  fields[i])
+            if strategy is not None:
+                strategy.response_time = loop.time() - start_time
+            else:
+                pending.append(i)
+            strategies.append(strategy)
+        
+        if pending:
+            generated = await self.strategy_generator.generate_scraping_strategies([
+                StrategyRequest(
+                    html_content=self._prompt_html(requests[i].html_content),
+                    url=requests[i].url,
+                    user_intent=requests[i].user_intent,
+                    extraction_fields=fields[i]
+                )
+                for i in pending
+            ])
+            for i, strategy in zip(pending, generated):
+                strategies[i] = strategy
+                request = requests[i]
+                if self.strategy_cache is not None and strategy.success:
+                    self.strategy_cache.set(request.html_content, request.user_intent,
+                                            fields[i], strategy)
+        
+        return strategies
+    
+    async def generate_scraping_strategy_stream(self,
+                                                html_content: str,
+                                                url: str,
+                                                user_intent: str,
+                                                extraction_fields: List[str] = None) -> AsyncIterator[PartialStrategy]:
+        """
+        Streaming variant of generate_scraping_strategy
+        
+        Yields the CSS selectors as soon as the provider has produced them,
+        then a final complete PartialStrategy carrying the full strategy.
+        Selectors from a provider that then fails are withdrawn by a
+        ``retracted`` item. Cached and heuristic strategies arrive as a
+        single complete item.
+        Streamed requests bypass the batching dispatcher.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        extraction_fields = self._intern_fields(extraction_fields)
+        
+        strategy = self._strategy_without_llm(html_content, url, user_intent, extraction_fields)
+        if strategy is not None:
+            strategy.response_time = loop.time() - start_time
+            yield PartialStrategy(
+                selectors=strategy.selectors,
+                provider_used=strategy.provider_used,
+                complete=True,
+                strategy=strategy
+            )
+            return
+        
+        async for partial in self.strategy_generator.generate_scraping_strategy_stream(
+            html_content=self._prompt_html(html_content),
             url=url,
             user_intent=user_intent,
             extraction_fields=extraction_fields
-        )
+        ):
+            if partial.complete and self.strategy_cache is not None and partial.strategy.success:
+                self.strategy_cache.set(html_content, user_intent, extraction_fields, partial.strategy)
+            yield partial
+    
+    @staticmethod
+    def _intern_fields(extraction_fields: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        Intern field names once on entry
+        
+        Fields parsed from prompts are fresh strings; interning them lets the
+        cache key, prompt and heuristic lookups compare by identity.
+        """
+        if not extraction_fields:
+            return extraction_fields
+        return [sys.intern(field) for field in extraction_fields]
+    
+    @staticmethod
+    def _inflight_key(prompt_html: str,
+                      user_intent: str,
+                      extraction_fields: Optional[List[str]]) -> str:
+        """Hash of everything that goes into the prompt"""
+        request = "\0".join([prompt_html, user_intent, *(extraction_fields or ())])
+        return hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+    
+    def _strategy_without_llm(self,
+                              html_content: str,
+                              url: str,
+                              user_intent: str,
+                              extraction_fields: Optional[List[str]]) -> Optional[ScrapingStrategy]:
+        """Resolve a request from the cache, the trivial-page heuristic, or open breakers"""
+        if self.strategy_cache is not None:
+            cached = self.strategy_cache.get(html_content, user_intent, extraction_fields)
+            if cached is not None:
+                self.logger.info("Reusing cached scraping strategy",
+                               url=url,
+                               original_provider=cached.provider_used)
+                cached.provider_used = "cache"
+                cached.cost = 0.0
+                cached.cached = True
+                return cached
+        
+        # Trivially structured pages get direct selectors without an LLM call
+        if self.settings.llm.heuristic_strategy_enabled:
+            heuristic = try_trivial_strategy(html_content, user_intent, extraction_fields)
+            if heuristic is not None:
+                self.logger.info("Using heuristic strategy for trivial page",
+                               url=url,
+                               selectors=heuristic.selectors)
+                return heuristic
+        
+        # Every provider is behind an open circuit breaker: fail now rather
+        # than queueing the request only to skip each provider in turn
+        if not self.strategy_generator.available_providers():
+            self.logger.warning("All provider circuit breakers open, failing fast", url=url)
+            return ScrapingStrategy(
+                success=False,
+                reasoning="All LLM provider circuit breakers are open"
+            )
+        
+        return None
+    
+    def _prompt_html(self, html_content: str) -> str:
+        """Reduce HTML to its skeleton for prompting, when enabled"""
+        if not self.settings.llm.html_skeleton_enabled:
+            return html_content
+        
+        skeleton = skeletonize(html_content, max_chars=self.settings.llm.html_skeleton_max_chars)
+        self.logger.debug("HTML reduced to skeleton for prompt",
+                         html_length=len(html_content),
+                         skeleton_length=len(skeleton))
+        return skeleton
     
     def get_provider_status(self) -> Dict[str, Any]:
         """Get status of all providers from strategy generator"""
@@ -57,7 +316,27 @@ class LLMHub:
     
     def estimate_cost(self, html_content: str, user_intent: str) -> float:
         """Estimate cost for strategy generation"""
-        return self.strategy_generator.estimate_cost(html_content, user_intent)
+        return self.strategy_generator.estimate_cost(self._prompt_html(html_content), user_intent)
+    
+    def estimate_unfetched_cost(self, user_intent: str, pages: int = 1) -> float:
+        """
+        Estimate strategy cost for ``pages`` sites that have not been fetched yet
+        
+        Each site is priced as a representative page of prompt markup, and the
+        pages are batched into one call as generate_scraping_strategies sends them.
+        """
+        if self.settings.llm.html_skeleton_enabled:
+            row = _ESTIMATE_SKELETON_ROW
+            page_chars = min(ESTIMATE_PAGE_CHARS, self.settings.llm.html_skeleton_max_chars)
+        else:
+            row = _ESTIMATE_RAW_ROW
+            page_chars = ESTIMATE_PAGE_CHARS
+        
+        # Already prompt-shaped, so it bypasses skeletonization (which would
+        # collapse the repeated rows)
+        page = (row * (page_chars // len(row) + 1))[:page_chars]
+        requests = [StrategyRequest(page, "", user_intent) for _ in range(pages)]
+        return self.strategy_generator.estimate_batch_cost(requests)
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on strategy generator"""
@@ -4,15 +4,16 @@ LLM Provider implementations for different AI services
 
 import asyncio
 import json
-import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 import aiohttp
 
+from ._http import get_shared_session
+from ._tokcount import count_tokens
 from ..config import Settings
 from ..utils.logger import ComponentLogger
-from ..utils.helpers import retry_with_backoff, RateLimiter
+from ..utils.helpers import retry_with_backoff, RateLimiter, json_loads
 
 
 @dataclass
@@ -38,6 +39,14 @@ class LLMRequest:
     metadata: Dict[str, Any] = None
 
 
+async def _iter_sse_data(response: aiohttp.ClientResponse) -> AsyncIterator[str]:
+    """Yield the payload of each ``data:`` line of a server-sent event stream"""
+    async for raw_line in response.content:
+        line = raw_line.decode("utf-8").strip()
+        if line.startswith("data:"):
+            yield line[5:].strip()
+
+
 class BaseLLMProvider(ABC):
     """Base class for LLM providers"""
     
@@ -67,6 +76,26 @@ class BaseLLMProvider(ABC):
     def estimate_cost(self, request: LLMRequest) -> float:
         """Estimate cost for the request"""
         pass
+    
+    async def stream_response(self, request: LLMRequest) -> AsyncIterator[str]:
+        """
+        Yield response text as it is generated
+        
+        Providers without a streaming API yield the whole response at once.
+        Failures raise instead of returning an unsuccessful LLMResponse.
+        """
+        response = await self.generate_response(request)
+        if not response.success:
+            raise RuntimeError(response.error or f"{self.provider_name} request failed")
+        yield response.content
+    
+    @staticmethod
+    def estimate_input_tokens(request: LLMRequest) -> int:
+        """Approximate prompt tokens (system prompt plus all messages)"""
+        prompt = "\n".join(msg.get("content", "") for msg in request.messages)
+        if request.system_prompt:
+            prompt = request.system_prompt + "\n" + prompt
+        return count_tokens(prompt)
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -101,82 +130,67 @@ class OpenAIProvider(BaseLLMProvider):
                 error="OpenAI API key not configured"
             )
         
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         # Respect rate limits
         await self.rate_limiter.acquire()
         
-        # Prepare messages
-        messages = request.messages.copy()
-        if request.system_prompt:
-            messages.insert(0, {"role": "system", "content": request.system_prompt})
-        
-        # Prepare request payload
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": request.max_tokens,
-            "temperature": request.temperature,
-            "stream": False
-        }
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        payload = self._build_payload(request)
+        headers = self._headers()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
+            session = await get_shared_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                
+                response_time = loop.time() - start_time
+                
+                if response.status == 200:
+                    data = await response.json()
                     
-                    response_time = time.time() - start_time
+                    content = data["choices"][0]["message"]["content"]
+                    tokens_used = data["usage"]["total_tokens"]
+                    cost = self._calculate_cost(tokens_used)
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        content = data["choices"][0]["message"]["content"]
-                        tokens_used = data["usage"]["total_tokens"]
-                        cost = self._calculate_cost(tokens_used)
-                        
-                        self.logger.info("OpenAI response generated",
-                                       tokens_used=tokens_used,
-                                       cost=cost,
-                                       response_time=response_time)
-                        
-                        return LLMResponse(
-                            content=content,
-                            tokens_used=tokens_used,
-                            cost=cost,
-                            provider=self.provider_name,
-                            model=self.model,
-                            response_time=response_time,
-                            success=True
-                        )
+                    self.logger.info("OpenAI response generated",
+                                   tokens_used=tokens_used,
+                                   cost=cost,
+                                   response_time=response_time)
                     
-                    else:
-                        error_data = await response.json()
-                        error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status}")
-                        
-                        self.logger.error("OpenAI API error",
-                                        status=response.status,
-                                        error=error_msg)
-                        
-                        return LLMResponse(
-                            content="",
-                            tokens_used=0,
-                            provider=self.provider_name,
-                            response_time=response_time,
-                            success=False,
-                            error=error_msg
-                        )
+                    return LLMResponse(
+                        content=content,
+                        tokens_used=tokens_used,
+                        cost=cost,
+                        provider=self.provider_name,
+                        model=self.model,
+                        response_time=response_time,
+                        success=True
+                    )
+                
+                else:
+                    error_data = await response.json()
+                    error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status}")
+                    
+                    self.logger.error("OpenAI API error",
+                                    status=response.status,
+                                    error=error_msg)
+                    
+                    return LLMResponse(
+                        content="",
+                        tokens_used=0,
+                        provider=self.provider_name,
+                        response_time=response_time,
+                        success=False,
+                        error=error_msg
+                    )
         
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = loop.time() - start_time
             error_msg = str(e)
             
             self.logger.error("OpenAI request failed",
@@ -192,14 +206,55 @@ class OpenAIProvider(BaseLLMProvider):
                 error=error_msg
             )
     
-    def estimate_cost(self, request: LLMRequest) -> float:
-        """Estimate cost based on token count"""
-        # Rough token estimation (4 chars per token)
-        total_chars = sum(len(msg.get("content", "")) for msg in request.messages)
+    async def stream_response(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Stream completion text from the OpenAI chat completions SSE endpoint"""
+        if not self.is_available:
+            raise RuntimeError("OpenAI API key not configured")
+        
+        # Respect rate limits
+        await self.rate_limiter.acquire()
+        
+        session = await get_shared_session()
+        async with session.post(
+            f"{self.base_url}/chat/completions",
+            json=self._build_payload(request, stream=True),
+            headers=self._headers(),
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            if response.status != 200:
+                raise RuntimeError(f"OpenAI API error: HTTP {response.status}")
+            
+            async for data in _iter_sse_data(response):
+                if data == "[DONE]":
+                    break
+                delta = json_loads(data)["choices"][0]["delta"].get("content")
+                if delta:
+                    yield delta
+    
+    def _build_payload(self, request: LLMRequest, stream: bool = False) -> Dict[str, Any]:
+        """Build the chat completions payload"""
+        # Prepare messages
+        messages = request.messages.copy()
         if request.system_prompt:
-            total_chars += len(request.system_prompt)
+            messages.insert(0, {"role": "system", "content": request.system_prompt})
         
-        estimated_input_tokens = total_chars // 4
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "stream": stream
+        }
+    
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def estimate_cost(self, request: LLMRequest) -> float:
+        """Estimate cost based on token count"""
+        estimated_input_tokens = self.estimate_input_tokens(request)
         estimated_output_tokens = request.max_tokens
         
         return self._calculate_cost(estimated_input_tokens + estimated_output_tokens)
@@ -245,84 +300,67 @@ class ClaudeProvider(BaseLLMProvider):
                 error="Claude API key not configured"
             )
         
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         # Respect rate limits
         await self.rate_limiter.acquire()
         
-        # Convert messages to Claude format
-        messages = self._convert_messages_to_claude_format(request)
-        
-        # Prepare request payload
-        payload = {
-            "model": self.model,
-            "max_tokens": request.max_tokens,
-            "temperature": request.temperature,
-            "messages": messages
-        }
-        
-        # Add system prompt if provided
-        if request.system_prompt:
-            payload["system"] = request.system_prompt
-        
-        headers = {
-            "x-api-key": self.api_key,
-            "Content-Type": "application/json",
-            "anthropic-version": "2023-06-01"
-        }
+        payload = self._build_payload(request)
+        headers = self._headers()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/messages",
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
+            session = await get_shared_session()
+            async with session.post(
+                f"{self.base_url}/messages",
+                json=payload,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                
+                response_time = loop.time() - start_time
+                
+                if response.status == 200:
+                    data = await response.json()
                     
-                    response_time = time.time() - start_time
+                    content = data["content"][0]["text"]
+                    tokens_used = data["usage"]["input_tokens"] + data["usage"]["output_tokens"]
+                    cost = self._calculate_cost(tokens_used)
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        content = data["content"][0]["text"]
-                        tokens_used = data["usage"]["input_tokens"] + data["usage"]["output_tokens"]
-                        cost = self._calculate_cost(tokens_used)
-                        
-                        self.logger.info("Claude response generated",
-                                       tokens_used=tokens_used,
-                                       cost=cost,
-                                       response_time=response_time)
-                        
-                        return LLMResponse(
-                            content=content,
-                            tokens_used=tokens_used,
-                            cost=cost,
-                            provider=self.provider_name,
-                            model=self.model,
-                            response_time=response_time,
-                            success=True
-                        )
+                    self.logger.info("Claude response generated",
+                                   tokens_used=tokens_used,
+                                   cost=cost,
+                                   response_time=response_time)
                     
-                    else:
-                        error_data = await response.json()
-                        error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status}")
-                        
-                        self.logger.error("Claude API error",
-                                        status=response.status,
-                                        error=error_msg)
-                        
-                        return LLMResponse(
-                            content="",
-                            tokens_used=0,
-                            provider=self.provider_name,
-                            response_time=response_time,
-                            success=False,
-                            error=error_msg
-                        )
+                    return LLMResponse(
+                        content=content,
+                        tokens_used=tokens_used,
+                        cost=cost,
+                        provider=self.provider_name,
+                        model=self.model,
+                        response_time=response_time,
+                        success=True
+                    )
+                
+                else:
+                    error_data = await response.json()
+                    error_msg = error_data.get("error", {}).get("message", f"HTTP {response.status}")
+                    
+                    self.logger.error("Claude API error",
+                                    status=response.status,
+                                    error=error_msg)
+                    
+                    return LLMResponse(
+                        content="",
+                        tokens_used=0,
+                        provider=self.provider_name,
+                        response_time=response_time,
+                        success=False,
+                        error=error_msg
+                    )
         
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = loop.time() - start_time
             error_msg = str(e)
             
             self.logger.error("Claude request failed",
@@ -338,6 +376,58 @@ class ClaudeProvider(BaseLLMProvider):
                 error=error_msg
             )
     
+    async def stream_response(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Stream message text from the Claude messages SSE endpoint"""
+        if not self.is_available:
+            raise RuntimeError("Claude API key not configured")
+        
+        # Respect rate limits
+        await self.rate_limiter.acquire()
+        
+        session = await get_shared_session()
+        async with session.post(
+            f"{self.base_url}/messages",
+            json=self._build_payload(request, stream=True),
+            headers=self._headers(),
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Claude API error: HTTP {response.status}")
+            
+            async for data in _iter_sse_data(response):
+                event = json_loads(data)
+                if event.get("type") == "content_block_delta":
+                    text = event.get("delta", {}).get("text")
+                    if text:
+                        yield text
+                elif event.get("type") == "message_stop":
+                    break
+    
+    def _build_payload(self, request: LLMRequest, stream: bool = False) -> Dict[str, Any]:
+        """Build the messages API payload"""
+        # Convert messages to Claude format
+        payload = {
+            "model": self.model,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "messages": self._convert_messages_to_claude_format(request)
+        }
+        
+        # Add system prompt if provided
+        if request.system_prompt:
+            payload["system"] = request.system_prompt
+        if stream:
+            payload["stream"] = True
+        
+        return payload
+    
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "x-api-key": self.api_key,
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
+    
     def _convert_messages_to_claude_format(self, request: LLMRequest) -> List[Dict[str, str]]:
         """Convert messages to Claude's expected format"""
         messages = []
@@ -356,11 +446,7 @@ class ClaudeProvider(BaseLLMProvider):
     
     def estimate_cost(self, request: LLMRequest) -> float:
         """Estimate cost based on token count"""
-        total_chars = sum(len(msg.get("content", "")) for msg in request.messages)
-        if request.system_prompt:
-            total_chars += len(request.system_prompt)
-        
-        estimated_input_tokens = total_chars // 4
+        estimated_input_tokens = self.estimate_input_tokens(request)
         estimated_output_tokens = request.max_tokens
         
         return self._calculate_cost(estimated_input_tokens + estimated_output_tokens)
@@ -478,7 +564,8 @@ class TinyLlamaProvider(BaseLLMProvider):
                 error="TinyLlama model not available"
             )
         
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         try:
             # Prepare input text
@@ -493,7 +580,7 @@ class TinyLlamaProvider(BaseLLMProvider):
             # Decode output
             content = self._detokenize(output_tokens)
             
-            response_time = time.time() - start_time
+            response_time = loop.time() - start_time
             
             # Estimate token usage
             tokens_used = len(input_tokens) + len(output_tokens)
@@ -513,7 +600,7 @@ class TinyLlamaProvider(BaseLLMProvider):
             )
             
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = loop.time() - start_time
             error_msg = str(e)
             
             self.logger.error("TinyLlama inference failed",
@@ -693,7 +780,8 @@ class HuggingFaceProvider(BaseLLMProvider):
     @retry_with_backoff(max_attempts=3, retry_exceptions=(aiohttp.ClientError, asyncio.TimeoutError))
     async def generate_response(self, request: LLMRequest) -> LLMResponse:
         """Generate response using Hugging Face Inference API"""
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         # Respect rate limits
         await self.rate_limiter.acquire()
@@ -718,61 +806,61 @@ class HuggingFaceProvider(BaseLLMProvider):
             headers["Authorization"] = f"Bearer {self.api_key}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/{self.model}",
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
+            session = await get_shared_session()
+            async with session.post(
+                f"{self.base_url}/{self.model}",
+                json=payload,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                
+                response_time = loop.time() - start_time
+                
+                if response.status == 200:
+                    data = await response.json()
                     
-                    response_time = time.time() - start_time
+                    if isinstance(data, list) and len(data) > 0:
+                        content = data[0].get("generated_text", "")
+                    else:
+                        content = str(data)
                     
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if isinstance(data, list) and len(data) > 0:
-                            content = data[0].get("generated_text", "")
-                        else:
-                            content = str(data)
-                        
-                        # Estimate tokens (rough)
-                        tokens_used = len(content) // 4
-                        
-                        self.logger.info("HuggingFace response generated",
-                                       tokens_used=tokens_used,
-                                       response_time=response_time)
-                        
-                        return LLMResponse(
-                            content=content,
-                            tokens_used=tokens_used,
-                            cost=0.0,  # Free tier
-                            provider=self.provider_name,
-                            model=self.model,
-                            response_time=response_time,
-                            success=True
-                        )
+                    # Estimate tokens (rough)
+                    tokens_used = len(content) // 4
                     
-                    else:
-                        error_msg = f"HTTP {response.status}"
-                        if response.status == 503:
-                            error_msg = "Model loading, please try again later"
-                        
-                        self.logger.error("HuggingFace API error",
-                                        status=response.status,
-                                        error=error_msg)
-                        
-                        return LLMResponse(
-                            content="",
-                            tokens_used=0,
-                            provider=self.provider_name,
-                            response_time=response_time,
-                            success=False,
-                            error=error_msg
-                        )
+                    self.logger.info("HuggingFace response generated",
+                                   tokens_used=tokens_used,
+                                   response_time=response_time)
+                    
+                    return LLMResponse(
+                        content=content,
+                        tokens_used=tokens_used,
+                        cost=0.0,  # Free tier
+                        provider=self.provider_name,
+                        model=self.model,
+                        response_time=response_time,
+                        success=True
+                    )
+                
+                else:
+                    error_msg = f"HTTP {response.status}"
+                    if response.status == 503:
+                        error_msg = "Model loading, please try again later"
+                    
+                    self.logger.error("HuggingFace API error",
+                                    status=response.status,
+                                    error=error_msg)
+                    
+                    return LLMResponse(
+                        content="",
+                        tokens_used=0,
+                        provider=self.provider_name,
+                        response_time=response_time,
+                        success=False,
+                        error=error_msg
+                    )
         
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = loop.time() - start_time
             error_msg = str(e)
             
             self.logger.error("HuggingFace request failed",
@@ -0,0 +1,276 @@
+"""
+Strategy Cache - reuse scraping strategies across structurally similar pages
+Two tiers: exact structure hash → nearest known structure (cosine similarity)
+"""
+
+import copy
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import asdict
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .html_skeleton import SKIPPED_TAGS
+from .strategy_generator import ScrapingStrategy
+from ..utils.logger import ComponentLogger
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+
+# Dimension of the hashed structure vectors used for similarity lookups
+_VECTOR_DIM = 512
+
+_DIGITS = re.compile(r"\d+")
+
+# Key prefix for page-content aliases, kept apart from structure entries
+_CONTENT_PREFIX = "content:"
+
+
+class _SkeletonParser(HTMLParser):
+    """Collects the tag/class/id skeleton of a document, ignoring text"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.tokens: List[str] = []
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        
+        token = tag
+        for name, value in attrs:
+            if not value:
+                continue
+            # Numbers in ids/classes are usually per-item (job-123, card-7)
+            value = _DIGITS.sub("0", value)
+            if name == "class":
+                token += "".join(f".{cls}" for cls in sorted(value.split()))
+            elif name == "id":
+                token += f"#{value}"
+        self.tokens.append(token)
+    
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+
+
+def structure_tokens(html_content: str) -> List[str]:
+    """Reduce HTML to its sequence of ``tag.class#id`` tokens"""
+    parser = _SkeletonParser()
+    parser.feed(html_content)
+    parser.close()
+    return parser.tokens
+
+
+def _structure_vector(tokens: List[str]) -> np.ndarray:
+    """Hash token unigrams and bigrams into a unit-length vector"""
+    vector = np.zeros(_VECTOR_DIM, dtype=np.float32)
+    features = tokens + [f"{a}>{b}" for a, b in zip(tokens, tokens[1:])]
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+        vector[int.from_bytes(digest, "little") % _VECTOR_DIM] += 1.0
+    
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class StrategyCache:
+    """
+    Cache of generated scraping strategies keyed on page structure
+    
+    Strategies depend on the DOM layout rather than the text on the page, so
+    keys are built from the tag/class/id skeleton plus the request (intent and
+    fields). A miss on the exact structure hash falls back to the most similar
+    cached structure for the same request when cosine similarity clears
+    ``similarity_threshold``.
+    
+    A page seen before is also remembered by a hash of its exact content,
+    which resolves repeat visits without parsing the HTML again.
+    
+    Entries persist in ``cache_dir`` when diskcache is installed; otherwise
+    the cache lives in memory for the lifetime of the process.
+    """
+    
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 similarity_threshold: float = 0.92,
+                 max_entries: int = 1024):
+        self.logger = ComponentLogger("strategy_cache")
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        
+        self._disk = None
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Content key -> entry key, for pages whose exact HTML was seen before
+        self._content: "OrderedDict[str, str]" = OrderedDict()
+        
+        # Similarity index: request key -> (structure keys, stacked vectors)
+        self._index: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        
+        if cache_dir and DISKCACHE_AVAILABLE:
+            self._disk = diskcache.Cache(cache_dir, size_limit=256 * 1024 * 1024)
+            self._load_index()
+        elif cache_dir:
+            self.logger.info("diskcache not installed, strategy cache is in-memory only",
+                             install_info="pip install diskcache")
+    
+    @staticmethod
+    def _request_key(user_intent: str, extraction_fields: Optional[List[str]]) -> str:
+        fields = ",".join(sorted(extraction_fields or []))
+        request = f"{' '.join(user_intent.lower().split())}|{fields}"
+        return hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _structure_key(tokens: List[str]) -> str:
+        return hashlib.blake2b(" ".join(tokens).encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _content_key(html_content: str, request_key: str) -> str:
+        digest = hashlib.blake2b(html_content.encode(), digest_size=16).hexdigest()
+        return f"{_CONTENT_PREFIX}{request_key}:{digest}"
+    
+    def get(self,
+            html_content: str,
+            user_intent: str,
+            extraction_fields: Optional[List[str]] = None) -> Optional[ScrapingStrategy]:
+        """Return a cached strategy for this page structure and request, if any"""
+        request_key = self._request_key(user_intent, extraction_fields)
+        content_key = self._content_key(html_content, request_key)
+        
+        entry_key = self._lookup_content(content_key)
+        entry = self._lookup(entry_key) if entry_key is not None else None
+        if entry is not None:
+            self.logger.debug("Strategy cache hit (same content)", structure_key=entry["structure_key"])
+            return ScrapingStrategy(**copy.deepcopy(entry["strategy"]))
+        
+        tokens = structure_tokens(html_content)
+        structure_key = self._structure_key(tokens)
+        
+        entry = self._lookup(f"{request_key}:{structure_key}")
+        if entry is not None:
+            self.logger.debug("Strategy cache hit (exact)", structure_key=structure_key)
+            self._store_content(content_key, f"{request_key}:{structure_key}")
+            return ScrapingStrategy(**copy.deepcopy(entry["strategy"]))
+        
+        keys, vectors = self._index.get(request_key, ([], None))
+        if not keys:
+            return None
+        
+        similarities = vectors @ _structure_vector(tokens)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        
+        entry = self._lookup(f"{request_key}:{keys[best]}")
+        if entry is None:
+            return None
+        
+        self.logger.debug("Strategy cache hit (similar structure)",
+                          structure_key=keys[best],
+                          similarity=float(similarities[best]))
+        self._store_content(content_key, f"{request_key}:{keys[best]}")
+        return ScrapingStrategy(**copy.deepcopy(entry["strategy"]))
+    
+    def set(self,
+            html_content: str,
+            user_intent: str,
+            extraction_fields: Optional[List[str]],
+            strategy: ScrapingStrategy):
+        """Store a successful strategy for this page structure and request"""
+        if not strategy.success:
+            return
+        
+        tokens = structure_tokens(html_content)
+        request_key = self._request_key(user_intent, extraction_fields)
+        structure_key = self._structure_key(tokens)
+        vector = _structure_vector(tokens)
+        
+        entry = {
+            "request_key": request_key,
+            "structure_key": structure_key,
+            "vector": vector,
+            "strategy": asdict(strategy)
+        }
+        self._store(f"{request_key}:{structure_key}", entry)
+        self._add_to_index(request_key, structure_key, vector)
+        self._store_content(self._content_key(html_content, request_key), f"{request_key}:{structure_key}")
+    
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        if self._disk is not None:
+            return self._disk.get(key)
+        
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        return entry
+    
+    def _store(self, key: str, entry: Dict[str, Any]):
+        if self._disk is not None:
+            self._disk.set(key, entry)
+            return
+        
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            _, evicted = self._memory.popitem(last=False)
+            self._remove_from_index(evicted["request_key"], evicted["structure_key"])
+    
+    def _lookup_content(self, content_key: str) -> Optional[str]:
+        if self._disk is not None:
+            return self._disk.get(content_key)
+        
+        entry_key = self._content.get(content_key)
+        if entry_key is not None:
+            self._content.move_to_end(content_key)
+        return entry_key
+    
+    def _store_content(self, content_key: str, entry_key: str):
+        if self._disk is not None:
+            self._disk.set(content_key, entry_key)
+            return
+        
+        self._content[content_key] = entry_key
+        self._content.move_to_end(content_key)
+        while len(self._content) > self.max_entries:
+            self._content.popitem(last=False)
+    
+    def _add_to_index(self, request_key: str, structure_key: str, vector: np.ndarray):
+        keys, vectors = self._index.get(request_key, ([], None))
+        if structure_key in keys:
+            return
+        
+        vectors = vector[None, :] if vectors is None else np.vstack([vectors, vector])
+        self._index[request_key] = (keys + [structure_key], vectors)
+    
+    def _remove_from_index(self, request_key: str, structure_key: str):
+        keys, vectors = self._index.get(request_key, ([], None))
+        if structure_key not in keys:
+            return
+        
+        position = keys.index(structure_key)
+        keys = keys[:position] + keys[position + 1:]
+        if keys:
+            self._index[request_key] = (keys, np.delete(vectors, position, axis=0))
+        else:
+            del self._index[request_key]
+    
+    def _load_index(self):
+        """Rebuild the in-memory similarity index from persisted entries"""
+        for key in self._disk.iterkeys():
+            if key.startswith(_CONTENT_PREFIX):
+                continue
+            entry = self._disk.get(key)
+            if entry:
+                self._add_to_index(entry["request_key"], entry["structure_key"], entry["vector"])
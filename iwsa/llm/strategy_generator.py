@@ -6,14 +6,49 @@ Multiple Providers: TinyLlama (primary) → OpenAI/Claude/HuggingFace (fallback)
 
 import asyncio
 import time
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Callable, Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 import json
 
 from .providers import TinyLlamaProvider, OpenAIProvider, ClaudeProvider, HuggingFaceProvider, LLMRequest, LLMResponse
 from ..config import Settings
 from ..utils.logger import ComponentLogger
-from ..utils.helpers import CircuitBreaker
+from ..utils.helpers import CircuitBreaker, json_loads
+
+
+STRATEGY_SYSTEM_PROMPT = """You are an expert web scraping strategist. Analyze the HTML and generate a complete scraping strategy.
+
+Return your response as a JSON object with this exact structure:
+{
+    "selectors": ["css_selector1", "css_selector2"],
+    "extraction_logic": "detailed explanation of extraction approach",
+    "pagination_strategy": {
+        "type": "numbered|infinite_scroll|load_more|none",
+        "selectors": ["pagination_selectors"],
+        "logic": "pagination handling approach"
+    },
+    "filters": [
+        {
+            "name": "filter_name",
+            "selector": "filter_selector",
+            "type": "dropdown|input|checkbox",
+            "default_value": "default"
+        }
+    ],
+    "error_handling": ["strategy1", "strategy2"],
+    "confidence_score": 0.85,
+    "reasoning": "detailed explanation of analysis and choices"
+}
+
+Focus on:
+1. Robust, reliable selectors
+2. Complete extraction strategy
+3. Pagination and filtering
+4. Error handling approaches
+5. Confidence in the strategy
+
+The HTML may be given as a compact skeleton: elements are written as
+<tag#id.class[attribute=value]> with text content shown as •."""
 
 
 @dataclass
@@ -30,6 +65,7 @@ class ScrapingStrategy:
     provider_used: str = ""
     response_time: float = 0.0
     cost: float = 0.0
+    cached: bool = False
     
     def __post_init__(self):
         if self.selectors is None:
@@ -42,6 +78,77 @@ class ScrapingStrategy:
             self.error_handling = []
 
 
+@dataclass
+class StrategyRequest:
+    """A single HTML → strategy request, as queued for batched generation"""
+    html_content: str
+    url: str
+    user_intent: str
+    extraction_fields: Optional[List[str]] = None
+
+
+@dataclass
+class PartialStrategy:
+    """
+    Incremental view of a strategy streamed from a provider
+    
+    ``selectors`` is filled as soon as the response's selector list has
+    closed; the last item of a stream has ``complete`` set and carries the
+    fully parsed ``strategy``.
+    
+    Selectors streamed before ``complete`` are provisional. If their
+    provider then fails, an item with ``retracted`` set and that
+    ``provider_used`` follows; discard the earlier selectors before the
+    next provider's items arrive.
+    """
+    selectors: List[str] = None
+    provider_used: str = ""
+    complete: bool = False
+    strategy: Optional[ScrapingStrategy] = None
+    retracted: bool = False
+    
+    def __post_init__(self):
+        if self.selectors is None:
+            self.selectors = []
+
+
+def _closed_selectors(content: str) -> Optional[List[str]]:
+    """Return the top-level ``selectors`` array once it is complete in ``content``"""
+    key_idx = content.find('"selectors"')
+    if key_idx == -1:
+        return None
+    start_idx = content.find('[', key_idx)
+    if start_idx == -1:
+        return None
+    
+    # Find the matching bracket, ignoring brackets inside strings
+    depth = 0
+    in_string = False
+    escaped = False
+    for idx in range(start_idx, len(content)):
+        char = content[idx]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+            if depth == 0:
+                try:
+                    selectors = json_loads(content[start_idx:idx + 1])
+                except ValueError:
+                    return None
+                return selectors if isinstance(selectors, list) else None
+    return None
+
+
 class LLMStrategyGenerator:
     """
     Single-purpose LLM system: HTML analysis → scraping strategy generation
@@ -133,7 +240,8 @@ class LLMStrategyGenerator:
         Returns:
             Complete scraping strategy
         """
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         
         self.logger.info("Generating scraping strategy",
                         url=url,
@@ -143,59 +251,230 @@ class LLMStrategyGenerator:
         # Prepare unified prompt
         request = self._prepare_strategy_request(html_content, url, user_intent, extraction_fields)
         
-        # Try providers in priority order (local first)
+        strategy = await self._generate_with_fallback(request, self._parse_strategy_response)
+        
+        if strategy is not None:
+            strategy.response_time = loop.time() - start_time
+            
+            self.logger.info("Strategy generated successfully",
+                           provider=strategy.provider_used,
+                           confidence=strategy.confidence_score,
+                           selectors_count=len(strategy.selectors),
+                           response_time=strategy.response_time,
+                           cost=strategy.cost)
+            
+            return strategy
+        
+        # All providers failed
+        return ScrapingStrategy(
+            success=False,
+            reasoning="All LLM providers failed to generate strategy",
+            response_time=loop.time() - start_time
+        )
+    
+    async def generate_scraping_strategies(self, requests: List[StrategyRequest]) -> List[ScrapingStrategy]:
+        """
+        Generate strategies for several pages with a single provider round-trip
+        
+        The requests are sent as one numbered prompt and the provider answers
+        with a JSON array. Any request the batched answer does not cover
+        (missing or invalid entry, or the whole batch failing) is retried on
+        its own.
+        
+        Args:
+            requests: Strategy requests to generate together
+            
+        Returns:
+            One strategy per request, in order
+        """
+        if len(requests) == 1:
+            return [await self.generate_scraping_strategy(**requests[0].__dict__)]
+        
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        self.logger.info("Generating batched scraping strategies",
+                        batch_size=len(requests),
+                        html_length=sum(len(r.html_content) for r in requests))
+        
+        batch_request = self._prepare_batch_request(requests)
+        strategies = await self._generate_with_fallback(
+            batch_request,
+            lambda response, provider_name: self._parse_batch_response(response, provider_name, len(requests))
+        )
+        if strategies is None:
+            strategies = [None] * len(requests)
+        
+        for strategy in strategies:
+            if strategy is not None and strategy.success:
+                strategy.response_time = loop.time() - start_time
+        
+        # Retry whatever the batch did not resolve, individually
+        missing = [i for i, strategy in enumerate(strategies) if strategy is None or not strategy.success]
+        if missing:
+            self.logger.warning("Batched response incomplete, generating remaining strategies individually",
+                              batch_size=len(requests),
+                              missing=len(missing))
+            retried = await asyncio.gather(*(
+                self.generate_scraping_strategy(**requests[i].__dict__) for i in missing
+            ))
+            for i, strategy in zip(missing, retried):
+                strategies[i] = strategy
+        
+        return strategies
+    
+    async def generate_scraping_strategy_stream(self,
+                                                html_content: str,
+                                                url: str,
+                                                user_intent: str,
+                                                extraction_fields: List[str] = None) -> AsyncIterator[PartialStrategy]:
+        """
+        Stream strategy generation, yielding selectors before the rest is parsed
+        
+        Yields a PartialStrategy with the CSS selectors as soon as the
+        provider's selector list is complete, so scraping can start while
+        pagination, filters and reasoning are still being generated. If that
+        provider then fails, a ``retracted`` item withdraws its selectors
+        before the next provider is tried. The final item is complete and
+        carries the parsed strategy (or a failed one if every provider
+        failed).
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        request = self._prepare_strategy_request(html_content, url, user_intent, extraction_fields)
+        
         for provider_name in self.provider_priority:
             provider = self.providers[provider_name]
             circuit_breaker = self.circuit_breakers[provider_name]
             
+            if not circuit_breaker.allow_request():
+                self.logger.warning("Provider circuit breaker open, trying next",
+                                  provider=provider_name,
+                                  state=circuit_breaker.state)
+                continue
+            
+            chunks = []
+            selectors_sent = False
             try:
-                # Check circuit breaker
-                if circuit_breaker.state == "OPEN":
-                    self.logger.warning("Provider circuit breaker open, trying next",
-                                      provider=provider_name)
-                    continue
-                
-                # Execute with circuit breaker protection
-                response = await circuit_breaker.call(provider.generate_response, request)
-                
-                if response.success:
-                    # Parse strategy from response
-                    strategy = self._parse_strategy_response(response, provider_name)
-                    
-                    if strategy.success:
-                        strategy.response_time = time.time() - start_time
-                        
-                        self.logger.info("Strategy generated successfully",
-                                       provider=provider_name,
-                                       confidence=strategy.confidence_score,
-                                       selectors_count=len(strategy.selectors),
-                                       response_time=strategy.response_time,
-                                       cost=strategy.cost)
-                        
-                        return strategy
-                    else:
-                        self.logger.warning("Strategy parsing failed, trying next provider",
-                                          provider=provider_name,
-                                          reasoning=strategy.reasoning)
-                        continue
-                else:
-                    self.logger.warning("Provider request failed, trying next",
-                                      provider=provider_name,
-                                      error=response.error)
-                    continue
+                async for chunk in provider.stream_response(request):
+                    chunks.append(chunk)
+                    if not selectors_sent:
+                        selectors = _closed_selectors("".join(chunks))
+                        if selectors is not None:
+                            selectors_sent = True
+                            yield PartialStrategy(selectors=selectors, provider_used=provider_name)
+            except Exception as e:
+                circuit_breaker.record_failure()
+                self.logger.error("Provider streaming error, trying next",
+                                provider=provider_name,
+                                error=str(e))
+                if selectors_sent:
+                    yield PartialStrategy(provider_used=provider_name, retracted=True)
+                continue
+            except BaseException:
+                circuit_breaker.release_probe()
+                raise
+            
+            circuit_breaker.record_success()
+            
+            # Usage is not reported on streams, so cost is the provider's estimate
+            response = LLMResponse(
+                content="".join(chunks),
+                tokens_used=0,
+                cost=provider.estimate_cost(request),
+                provider=provider_name
+            )
+            strategy = self._parse_strategy_response(response, provider_name)
+            if not strategy.success:
+                self.logger.warning("Strategy parsing failed, trying next provider",
+                                  provider=provider_name,
+                                  reasoning=strategy.reasoning)
+                if selectors_sent:
+                    yield PartialStrategy(provider_used=provider_name, retracted=True)
+                continue
+            
+            strategy.response_time = loop.time() - start_time
+            yield PartialStrategy(
+                selectors=strategy.selectors,
+                provider_used=provider_name,
+                complete=True,
+                strategy=strategy
+            )
+            return
+        
+        yield PartialStrategy(
+            complete=True,
+            strategy=ScrapingStrategy(
+                success=False,
+                reasoning="All LLM providers failed to generate strategy",
+                response_time=loop.time() - start_time
+            )
+        )
+    
+    async def _generate_with_fallback(self,
+                                      request: LLMRequest,
+                                      parse_response: Callable[[LLMResponse, str], Union[ScrapingStrategy, List[ScrapingStrategy]]]):
+        """
+        Try providers in priority order (local first) until one response parses
+        
+        ``parse_response`` returns a failed ScrapingStrategy when a response
+        cannot be used, which moves on to the next provider.
+        
+        Returns:
+            The parsed result, or None if every provider failed
+        """
+        for provider_name in self.provider_priority:
+            provider = self.providers[provider_name]
+            circuit_breaker = self.circuit_breakers[provider_name]
             
+            # Open breakers fail fast, before any network dispatch; while
+            # HALF_OPEN only a single probe request is let through
+            if not circuit_breaker.allow_request():
+                self.logger.warning("Provider circuit breaker open, trying next",
+                                  provider=provider_name,
+                                  state=circuit_breaker.state)
+                continue
+            
+            try:
+                response = await provider.generate_response(request)
             except Exception as e:
+                circuit_breaker.record_failure()
                 self.logger.error("Provider execution error, trying next",
                                 provider=provider_name,
                                 error=str(e))
                 continue
+            except BaseException:
+                circuit_breaker.release_probe()
+                raise
+            
+            if not response.success:
+                circuit_breaker.record_failure()
+                self.logger.warning("Provider request failed, trying next",
+                                  provider=provider_name,
+                                  error=response.error)
+                continue
+            
+            circuit_breaker.record_success()
+            
+            # Parse strategy from response
+            try:
+                result = parse_response(response, provider_name)
+            except Exception as e:
+                self.logger.error("Strategy parsing error, trying next",
+                                provider=provider_name,
+                                error=str(e))
+                continue
+            
+            if isinstance(result, ScrapingStrategy) and not result.success:
+                self.logger.warning("Strategy parsing failed, trying next provider",
+                                  provider=provider_name,
+                                  reasoning=result.reasoning)
+                continue
+            
+            return result
         
-        # All providers failed
-        return ScrapingStrategy(
-            success=False,
-            reasoning="All LLM providers failed to generate strategy",
-            response_time=time.time() - start_time
-        )
+        return None
     
     def _prepare_strategy_request(self,
                                 html_content: str,
@@ -204,61 +483,64 @@ class LLMStrategyGenerator:
                                 extraction_fields: List[str] = None) -> LLMRequest:
         """Prepare unified strategy generation request"""
         
-        # Truncate HTML if too long
-        if len(html_content) > 50000:
-            html_content = html_content[:50000] + "... [truncated]"
+        user_message = self._format_strategy_message(html_content, url, user_intent, extraction_fields, 50000)
+        user_message += "\n\nGenerate a comprehensive scraping strategy that handles all aspects of data extraction from this page."
         
-        system_prompt = """You are an expert web scraping strategist. Analyze the HTML and generate a complete scraping strategy.
-
-Return your response as a JSON object with this exact structure:
-{
-    "selectors": ["css_selector1", "css_selector2"],
-    "extraction_logic": "detailed explanation of extraction approach",
-    "pagination_strategy": {
-        "type": "numbered|infinite_scroll|load_more|none",
-        "selectors": ["pagination_selectors"],
-        "logic": "pagination handling approach"
-    },
-    "filters": [
-        {
-            "name": "filter_name",
-            "selector": "filter_selector",
-            "type": "dropdown|input|checkbox",
-            "default_value": "default"
-        }
-    ],
-    "error_handling": ["strategy1", "strategy2"],
-    "confidence_score": 0.85,
-    "reasoning": "detailed explanation of analysis and choices"
-}
+        return LLMRequest(
+            messages=[{"role": "user", "content": user_message}],
+            system_prompt=STRATEGY_SYSTEM_PROMPT,
+            max_tokens=2000,
+            temperature=0.1
+        )
+    
+    def _prepare_batch_request(self, requests: List[StrategyRequest]) -> LLMRequest:
+        """Prepare one request covering several numbered strategy requests"""
+        # Keep the combined prompt within the single-request HTML budget
+        html_limit = max(50000 // len(requests), 5000)
+        
+        sections = [
+            f"### REQUEST {number}\n" + self._format_strategy_message(
+                item.html_content, item.url, item.user_intent, item.extraction_fields, html_limit
+            )
+            for number, item in enumerate(requests, 1)
+        ]
+        user_message = "\n\n".join(sections)
+        user_message += f"\n\nGenerate a comprehensive scraping strategy for each of the {len(requests)} requests above."
+        
+        system_prompt = STRATEGY_SYSTEM_PROMPT + f"""
 
-Focus on:
-1. Robust, reliable selectors
-2. Complete extraction strategy
-3. Pagination and filtering
-4. Error handling approaches
-5. Confidence in the strategy"""
+You will receive {len(requests)} numbered requests (### REQUEST 1 ... ### REQUEST {len(requests)}).
+Return a JSON array containing exactly one strategy object per request, in request order."""
+        
+        return LLMRequest(
+            messages=[{"role": "user", "content": user_message}],
+            system_prompt=system_prompt,
+            max_tokens=min(2000 * len(requests), 8000),
+            temperature=0.1
+        )
+    
+    @staticmethod
+    def _format_strategy_message(html_content: str,
+                                 url: str,
+                                 user_intent: str,
+                                 extraction_fields: Optional[List[str]],
+                                 html_limit: int) -> str:
+        """Format the page description shared by single and batched prompts"""
+        # Truncate HTML if too long
+        if len(html_content) > html_limit:
+            html_content = html_content[:html_limit] + "... [truncated]"
         
         fields_text = ""
         if extraction_fields:
             fields_text = f"\nSpecific fields to extract: {', '.join(extraction_fields)}"
         
-        user_message = f"""Analyze this HTML content and generate a complete scraping strategy:
+        return f"""Analyze this HTML content and generate a complete scraping strategy:
 
 URL: {url}
 User Intent: {user_intent}{fields_text}
 
 HTML Content:
-{html_content}
-
-Generate a comprehensive scraping strategy that handles all aspects of data extraction from this page."""
-        
-        return LLMRequest(
-            messages=[{"role": "user", "content": user_message}],
-            system_prompt=system_prompt,
-            max_tokens=2000,
-            temperature=0.1
-        )
+{html_content}"""
     
     def _parse_strategy_response(self, response: LLMResponse, provider_name: str) -> ScrapingStrategy:
         """Parse LLM response into scraping strategy"""
@@ -277,30 +559,62 @@ Generate a comprehensive scraping strategy that handles all aspects of data extr
                 )
             
             json_str = content[start_idx:end_idx]
-            strategy_data = json.loads(json_str)
+            strategy_data = json_loads(json_str)
             
-            # Validate required fields
-            required_fields = ["selectors", "extraction_logic", "confidence_score"]
-            for field in required_fields:
-                if field not in strategy_data:
-                    return ScrapingStrategy(
-                        success=False,
-                        reasoning=f"Missing required field: {field}"
-                    )
-            
-            # Create strategy object
+            return self._strategy_from_data(strategy_data, provider_name, response.cost or 0.0)
+        
+        except json.JSONDecodeError as e:
             return ScrapingStrategy(
-                success=True,
-                selectors=strategy_data.get("selectors", []),
-                extraction_logic=strategy_data.get("extraction_logic", ""),
-                pagination_strategy=strategy_data.get("pagination_strategy", {}),
-                filters=strategy_data.get("filters", []),
-                error_handling=strategy_data.get("error_handling", []),
-                confidence_score=strategy_data.get("confidence_score", 0.0),
-                reasoning=strategy_data.get("reasoning", ""),
-                provider_used=provider_name,
-                cost=response.cost or 0.0
+                success=False,
+                reasoning=f"JSON parsing error: {str(e)}"
             )
+        except Exception as e:
+            return ScrapingStrategy(
+                success=False,
+                reasoning=f"Strategy parsing error: {str(e)}"
+            )
+    
+    def _parse_batch_response(self,
+                              response: LLMResponse,
+                              provider_name: str,
+                              count: int) -> Union[ScrapingStrategy, List[Optional[ScrapingStrategy]]]:
+        """
+        Parse a batched LLM response into one strategy per request
+        
+        Entries that are missing or invalid come back as None or failed
+        strategies so the caller can retry just those requests.
+        """
+        try:
+            content = response.content.strip()
+            
+            start_idx = content.find('[')
+            end_idx = content.rfind(']') + 1
+            
+            if start_idx == -1 or end_idx <= start_idx:
+                return ScrapingStrategy(
+                    success=False,
+                    reasoning="No JSON array found in batched response"
+                )
+            
+            strategies_data = json_loads(content[start_idx:end_idx])
+            if not isinstance(strategies_data, list):
+                return ScrapingStrategy(
+                    success=False,
+                    reasoning="Batched response is not a JSON array"
+                )
+            
+            # Split the single call's cost across the strategies it produced
+            cost = (response.cost or 0.0) / count
+            
+            strategies = []
+            for index in range(count):
+                strategy_data = strategies_data[index] if index < len(strategies_data) else None
+                if isinstance(strategy_data, dict):
+                    strategies.append(self._strategy_from_data(strategy_data, provider_name, cost))
+                else:
+                    strategies.append(None)
+            
+            return strategies
         
         except json.JSONDecodeError as e:
             return ScrapingStrategy(
@@ -313,6 +627,36 @@ Generate a comprehensive scraping strategy that handles all aspects of data extr
                 reasoning=f"Strategy parsing error: {str(e)}"
             )
     
+    @staticmethod
+    def _strategy_from_data(strategy_data: Dict[str, Any], provider_name: str, cost: float) -> ScrapingStrategy:
+        """Validate a decoded strategy object and build the strategy from it"""
+        # Validate required fields
+        required_fields = ["selectors", "extraction_logic", "confidence_score"]
+        for field in required_fields:
+            if field not in strategy_data:
+                return ScrapingStrategy(
+                    success=False,
+                    reasoning=f"Missing required field: {field}"
+                )
+        
+        # Create strategy object
+        return ScrapingStrategy(
+            success=True,
+            selectors=strategy_data.get("selectors", []),
+            extraction_logic=strategy_data.get("extraction_logic", ""),
+            pagination_strategy=strategy_data.get("pagination_strategy", {}),
+            filters=strategy_data.get("filters", []),
+            error_handling=strategy_data.get("error_handling", []),
+            confidence_score=strategy_data.get("confidence_score", 0.0),
+            reasoning=strategy_data.get("reasoning", ""),
+            provider_used=provider_name,
+            cost=cost
+        )
+    
+    def available_providers(self) -> List[str]:
+        """Providers, in priority order, whose circuit breaker would accept a request"""
+        return [name for name in self.provider_priority if self.circuit_breakers[name].can_attempt()]
+    
     def get_provider_status(self) -> Dict[str, Any]:
         """Get status of all providers"""
         status = {}
@@ -339,6 +683,16 @@ Generate a comprehensive scraping strategy that handles all aspects of data extr
             return primary_provider.estimate_cost(dummy_request)
         return 0.0
     
+    def estimate_batch_cost(self, requests: List[StrategyRequest]) -> float:
+        """Estimate cost of generate_scraping_strategies for these requests"""
+        if not self.provider_priority or not requests:
+            return 0.0
+        if len(requests) == 1:
+            return self.estimate_cost(requests[0].html_content, requests[0].user_intent)
+        
+        primary_provider = self.providers[self.provider_priority[0]]
+        return primary_provider.estimate_cost(self._prepare_batch_request(requests))
+    
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on all providers"""
         self.logger.info("Performing strategy generator health check")
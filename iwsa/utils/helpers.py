@@ -2,14 +2,28 @@
 Helper utilities for IWSA
 """
 
+import json
 import time
 import uuid
 import asyncio
+import dataclasses
 import functools
-from typing import Any, Callable, Optional, Dict, List
+from typing import Any, Callable, Optional, Dict, List, Union
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import structlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
 
@@ -159,16 +173,51 @@ class CircuitBreaker:
         self.expected_exception = expected_exception
         
         self.failure_count = 0
-        self.last_failure_time = None
+        self.last_failure_time = None  # time.monotonic() of the last failure
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        
+        # Only one trial call is let through while HALF_OPEN
+        self._probe_in_flight = False
+    
+    @property
+    def reopen_at(self) -> Optional[float]:
+        """Monotonic time at which an OPEN breaker lets a probe through"""
+        if self.last_failure_time is None:
+            return None
+        return self.last_failure_time + self.recovery_timeout
+    
+    def can_attempt(self) -> bool:
+        """Check, without side effects, whether a call would be let through"""
+        if self.state == "OPEN":
+            return time.monotonic() >= self.reopen_at
+        if self.state == "HALF_OPEN":
+            return not self._probe_in_flight
+        return True
+    
+    def allow_request(self) -> bool:
+        """
+        Decide whether a call may proceed
+        
+        An OPEN breaker turns HALF_OPEN once the recovery timeout has passed
+        and admits a single probe; everyone else is refused until the probe
+        reports back via record_success/record_failure.
+        """
+        if self.state == "OPEN":
+            if time.monotonic() < self.reopen_at:
+                return False
+            self.state = "HALF_OPEN"
+        
+        if self.state == "HALF_OPEN":
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+        
+        return True
     
     def call(self, func: Callable, *args, **kwargs):
         """Execute function with circuit breaker protection"""
-        if self.state == "OPEN":
-            if time.time() - self.last_failure_time > self.recovery_timeout:
-                self.state = "HALF_OPEN"
-            else:
-                raise Exception("Circuit breaker is OPEN")
+        if not self.allow_request():
+            raise Exception("Circuit breaker is OPEN")
         
         try:
             result = func(*args, **kwargs)
@@ -178,18 +227,89 @@ class CircuitBreaker:
             self._on_failure()
             raise e
     
+    def record_success(self):
+        """Report a successful call made after allow_request()"""
+        self._on_success()
+    
+    def record_failure(self):
+        """Report a failed call made after allow_request()"""
+        self._on_failure()
+    
+    def release_probe(self):
+        """Give up a HALF_OPEN probe without recording an outcome"""
+        self._probe_in_flight = False
+    
     def _on_success(self):
         """Handle successful call"""
         self.failure_count = 0
         self.state = "CLOSED"
+        self._probe_in_flight = False
     
     def _on_failure(self):
         """Handle failed call"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         
-        if self.failure_count >= self.failure_threshold:
+        # A failed probe re-opens immediately
+        if self.state == "HALF_OPEN" or self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
+        self._probe_in_flight = False
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON, using orjson when it is installed
+    
+    Decode errors are json.JSONDecodeError either way (orjson's error type
+    subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(data: Any) -> str:
+    """Serialize JSON with a two-space indent, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def install_uvloop() -> bool:
+    """
+    Make asyncio.run() use uvloop's event loop when it is installed
+    
+    Returns:
+        True if uvloop is now the event loop policy
+    """
+    if not UVLOOP_AVAILABLE:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def with_slots(cls: type) -> type:
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields
+    
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10. Apply
+    it above ``@dataclass``; instances then have no ``__dict__``.
+    
+    Args:
+        cls: Class already processed by ``@dataclass``
+        
+    Returns:
+        New class with the same fields, methods and defaults
+    """
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+    # Defaults live in the generated __init__; class attributes would clash with the slots
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
 
 
 def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
@@ -293,6 +413,22 @@ def sanitize_filename(filename: str) -> str:
     return sanitized or 'untitled'
 
 
+def truncate_text(text: str, limit: int = 100) -> str:
+    """
+    Shorten text for log lines, marking the cut with an ellipsis
+    
+    Args:
+        text: Text to shorten
+        limit: Maximum characters kept from ``text``
+        
+    Returns:
+        ``text`` itself when it fits, otherwise its first ``limit`` characters and "..."
+    """
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
 def format_bytes(bytes_value: int) -> str:
     """
     Format bytes value in human readable format
@@ -14,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from iwsa.core.engine import ScrapingEngine
 from iwsa.config.settings import Settings
 from iwsa.utils.logger import setup_logging
+from iwsa.utils.helpers import truncate_text
 
 
 async def main():
@@ -42,11 +43,14 @@ async def main():
         engine = ScrapingEngine(settings)
         
         # Process the scraping request
-        logger.info(f"Processing prompt: {prompt[:100]}...")
+        logger.info(f"Processing prompt: {truncate_text(prompt)}")
         print(f"🤖 Processing: {prompt}")
         print("📊 Analyzing website structure...")
         
-        result = await engine.process_request(prompt)
+        try:
+            result = await engine.process_request(prompt)
+        finally:
+            await engine.aclose()
         
         if result.success:
             logger.info(f"Scraping completed successfully. Extracted {result.total_records} records")
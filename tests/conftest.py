@@ -8,10 +8,13 @@ from unittest.mock import MagicMock
 from typing import Dict, Any
 
 from iwsa.config import Settings
+from iwsa.core.engine import ScrapingEngine
 from iwsa.core.prompt_processor import PromptProcessor
 from iwsa.core.reconnaissance import ReconnaissanceEngine
 from iwsa.llm.hub import LLMHub
+from iwsa.llm.strategy_generator import LLMStrategyGenerator
 from iwsa.data.pipeline import DataPipeline
+from iwsa.utils.helpers import CircuitBreaker
 
 
 @pytest.fixture(scope="session")
@@ -39,6 +42,59 @@ def test_settings():
     return Settings()
 
 
+@pytest.fixture
+def unit_settings(monkeypatch):
+    """Settings with no providers, strategy cache, heuristics or request batching"""
+    monkeypatch.setenv('ENVIRONMENT', 'development')
+    monkeypatch.setenv('MONGODB_URI', 'mongodb://localhost:27017')
+    
+    return Settings(llm={
+        'openai_api_key': None,
+        'claude_api_key': None,
+        'hf_api_key': None,
+        'strategy_cache_enabled': False,
+        'heuristic_strategy_enabled': False,
+        'html_skeleton_enabled': False,
+        'batch_window_ms': 0
+    })
+
+
+@pytest.fixture
+def make_generator(unit_settings):
+    """Build an LLMStrategyGenerator that uses only the given providers"""
+    def make(**providers):
+        generator = LLMStrategyGenerator(unit_settings)
+        generator.providers = providers
+        generator.circuit_breakers = {name: CircuitBreaker() for name in providers}
+        generator.provider_priority = list(providers)
+        return generator
+    
+    return make
+
+
+@pytest.fixture
+def make_hub(unit_settings):
+    """Build an LLMHub around a stub strategy generator"""
+    def make(strategy_generator, strategy_cache=None):
+        hub = LLMHub(unit_settings)
+        hub.strategy_generator = strategy_generator
+        hub.strategy_cache = strategy_cache
+        return hub
+    
+    return make
+
+
+@pytest.fixture
+def make_engine(unit_settings):
+    """Build a ScrapingEngine with a stub reconnaissance engine and scraping overrides"""
+    def make(reconnaissance, **scraping):
+        engine = ScrapingEngine(unit_settings.clone(scraping=unit_settings.scraping.clone(**scraping)))
+        engine.reconnaissance = reconnaissance
+        return engine
+    
+    return make
+
+
 @pytest.fixture
 def mock_llm_response():
     """Mock LLM response data"""
@@ -106,7 +106,7 @@ class TestFullPipeline:
         
         with patch('iwsa.core.engine.LLMHub') as mock_hub_class:
             mock_llm_hub = MagicMock()
-            mock_llm_hub.estimate_cost.return_value = 0.05
+            mock_llm_hub.estimate_unfetched_cost.return_value = 0.05
             mock_hub_class.return_value = mock_llm_hub
             
             engine = ScrapingEngine(test_settings)
@@ -0,0 +1,63 @@
+"""
+Unit tests for the circuit breaker
+"""
+
+import time
+
+from iwsa.utils.helpers import CircuitBreaker
+
+
+def open_breaker(recovery_timeout: float = 60.0) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=recovery_timeout)
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    return breaker
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker"""
+    
+    def test_opens_after_threshold(self):
+        """Test that the breaker refuses requests once failures reach the threshold"""
+        breaker = open_breaker()
+        
+        assert breaker.state == "OPEN"
+        assert not breaker.can_attempt()
+        assert not breaker.allow_request()
+    
+    def test_half_open_admits_single_probe(self):
+        """Test that only one caller probes a recovering provider"""
+        breaker = open_breaker()
+        breaker.last_failure_time = time.monotonic() - 61
+        
+        assert breaker.can_attempt()
+        assert breaker.allow_request()
+        assert breaker.state == "HALF_OPEN"
+        assert not breaker.allow_request()
+        
+        breaker.record_success()
+        
+        assert breaker.state == "CLOSED"
+        assert breaker.allow_request()
+    
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe re-opens the breaker immediately"""
+        breaker = open_breaker()
+        breaker.last_failure_time = time.monotonic() - 61
+        
+        assert breaker.allow_request()
+        breaker.record_failure()
+        
+        assert breaker.state == "OPEN"
+        assert not breaker.allow_request()
+    
+    def test_released_probe_frees_slot(self):
+        """Test that an abandoned probe lets the next caller try"""
+        breaker = open_breaker()
+        breaker.last_failure_time = time.monotonic() - 61
+        
+        assert breaker.allow_request()
+        breaker.release_probe()
+        
+        assert breaker.allow_request()
@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 from iwsa.config import Settings, ScrapingProfiles
 from iwsa.config.settings import LLMConfig, StorageConfig, ScrapingConfig
+from iwsa.config.profiles import FLAG_MOUSE, FLAG_PAGEVIEW, FLAG_SCROLL, ProfileType
 
 
 class TestSettings:
@@ -111,6 +112,36 @@ class TestSettings:
             assert settings_dict['llm']['openai_api_key'] == '***MASKED***'
             assert settings_dict['storage']['mongodb_uri'] == '***MASKED***'
     
+    def test_settings_dict_tracks_changes(self):
+        """Test that the cached dict output reflects later assignments"""
+        with patch.dict(os.environ, {
+            'MONGODB_URI': 'mongodb://localhost:27017',
+            'ENVIRONMENT': 'development'
+        }):
+            settings = Settings()
+            assert settings.dict()['llm']['timeout'] == 30
+            
+            settings.llm = settings.llm.clone(timeout=45)
+            assert settings.dict()['llm']['timeout'] == 45
+            
+            settings.dict()['llm']['timeout'] = 1
+            assert settings.dict()['llm']['timeout'] == 45
+    
+    def test_sections_are_shared(self):
+        """Test that settings built from one environment share read-only sections"""
+        with patch.dict(os.environ, {
+            'MONGODB_URI': 'mongodb://localhost:27017',
+            'ENVIRONMENT': 'development'
+        }):
+            first, second = Settings(), Settings()
+            assert first.llm is second.llm
+            
+            with pytest.raises(AttributeError):
+                first.llm.timeout = 45
+            
+            with patch.dict(os.environ, {'LLM_TIMEOUT': '45'}):
+                assert Settings().llm.timeout == 45
+    
     def test_is_production(self):
         """Test production environment detection"""
         with patch.dict(os.environ, {'ENVIRONMENT': 'production'}):
@@ -134,6 +165,29 @@ class TestScrapingProfiles:
         assert "retry_attempts" in profile
         assert "anti_detection" in profile
     
+    def test_get_profile_by_type(self):
+        """Test that profiles resolve from enum members and any name casing"""
+        stealth = ScrapingProfiles.get_profile(ProfileType.STEALTH)
+        
+        assert ScrapingProfiles.get_profile("stealth") is stealth
+        assert ScrapingProfiles.get_profile("Stealth") is stealth
+    
+    def test_get_request_headers(self):
+        """Test that header pairs mirror the profile's header mapping"""
+        headers = ScrapingProfiles.get_request_headers("balanced")
+        
+        assert headers == tuple(ScrapingProfiles.get_profile("balanced")["request_headers"].items())
+        assert ScrapingProfiles.get_request_headers(ProfileType.BALANCED) is headers
+    
+    def test_get_behavior_flags(self):
+        """Test that behavior flags match the profile's behavioral patterns"""
+        balanced = ScrapingProfiles.get_behavior_flags("balanced")
+        stealth = ScrapingProfiles.get_behavior_flags("stealth")
+        
+        assert balanced & FLAG_SCROLL and not balanced & FLAG_MOUSE
+        assert stealth & FLAG_MOUSE and stealth & FLAG_PAGEVIEW
+        assert ScrapingProfiles.get_behavior_flags("aggressive") == 0
+    
     def test_get_all_profiles(self):
         """Test getting all profiles"""
         profiles = ScrapingProfiles.get_all_profiles()
@@ -160,6 +214,31 @@ class TestScrapingProfiles:
         assert custom_profile["retry_attempts"] == 10
         assert custom_profile["name"] == "Balanced"  # Inherited from base
     
+    def test_profiles_are_read_only(self):
+        """Test that shared profiles cannot be modified in place"""
+        profile = ScrapingProfiles.get_profile("balanced")
+        
+        with pytest.raises(TypeError):
+            profile["rate_limit"] = 0.1
+        with pytest.raises(TypeError):
+            profile["request_headers"]["Accept"] = "*/*"
+    
+    def test_custom_profile_does_not_leak(self):
+        """Test that nested overrides leave the base profile untouched"""
+        custom_profile = ScrapingProfiles.create_custom_profile(
+            "balanced",
+            {"request_headers": {"Accept": "*/*"}}
+        )
+        base_profile = ScrapingProfiles.get_profile("balanced")
+        
+        assert custom_profile["request_headers"]["Accept"] == "*/*"
+        assert custom_profile["request_headers"]["Connection"] == "keep-alive"
+        assert base_profile["request_headers"]["Accept"] != "*/*"
+        
+        mutable_profile = ScrapingProfiles.get_mutable_profile("balanced")
+        mutable_profile["behavioral_patterns"]["mouse_movements"] = True
+        assert base_profile["behavioral_patterns"]["mouse_movements"] is False
+    
     def test_get_profile_for_site_type(self):
         """Test site type profile recommendations"""
         test_cases = [
@@ -173,6 +252,8 @@ class TestScrapingProfiles:
         for site_type, expected_profile in test_cases:
             recommended = ScrapingProfiles.get_profile_for_site_type(site_type)
             assert recommended == expected_profile
+            profile = ScrapingProfiles.get_profile_dict_for_site_type(site_type)
+            assert profile is ScrapingProfiles.get_profile(expected_profile)
     
     def test_validate_profile(self):
         """Test profile validation"""
@@ -0,0 +1,106 @@
+"""
+Unit tests for batched strategy dispatch
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from iwsa.llm.dispatcher import FleetDispatcher
+from iwsa.llm.providers import LLMResponse
+from iwsa.llm.strategy_generator import ScrapingStrategy
+
+
+class FakeGenerator:
+    """Records how requests were grouped into batches"""
+    
+    def __init__(self):
+        self.batches = []
+    
+    async def generate_scraping_strategies(self, requests):
+        self.batches.append([request.url for request in requests])
+        return [
+            ScrapingStrategy(success=True, selectors=[request.url], provider_used="fake")
+            for request in requests
+        ]
+
+
+def strategy_json(selector: str) -> dict:
+    return {"selectors": [selector], "extraction_logic": "logic", "confidence_score": 0.9}
+
+
+class TestFleetDispatcher:
+    """Test cases for FleetDispatcher"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """Test that requests within the window are generated together"""
+        generator = FakeGenerator()
+        dispatcher = FleetDispatcher(generator, window_ms=20)
+        
+        strategies = await asyncio.gather(*(
+            dispatcher.submit("<html></html>", f"https://example.com/{i}", "jobs") for i in range(5)
+        ))
+        
+        assert len(generator.batches) == 1
+        assert [s.selectors[0] for s in strategies] == [f"https://example.com/{i}" for i in range(5)]
+    
+    @pytest.mark.asyncio
+    async def test_max_batch_splits_batches(self):
+        """Test that a full queue is flushed without waiting for the window"""
+        generator = FakeGenerator()
+        dispatcher = FleetDispatcher(generator, window_ms=10000, max_batch=2)
+        
+        await asyncio.wait_for(asyncio.gather(*(
+            dispatcher.submit("<html></html>", f"https://example.com/{i}", "jobs") for i in range(4)
+        )), timeout=1.0)
+        
+        assert [len(batch) for batch in generator.batches] == [2, 2]
+    
+    @pytest.mark.asyncio
+    async def test_tight_latency_budget_skips_window(self):
+        """Test that a caller with a small latency budget is not held back"""
+        generator = FakeGenerator()
+        dispatcher = FleetDispatcher(generator, window_ms=10000)
+        
+        strategy = await asyncio.wait_for(
+            dispatcher.submit("<html></html>", "https://example.com", "jobs", latency_budget_ms=5),
+            timeout=1.0
+        )
+        
+        assert strategy.success
+
+
+class TestBatchResponseParsing:
+    """Test cases for parsing batched provider responses"""
+    
+    def test_parses_one_strategy_per_request(self, make_generator):
+        """Test that each array entry maps to its request and shares the cost"""
+        content = "Here you go:\n" + json.dumps([strategy_json(".a"), strategy_json(".b")])
+        response = LLMResponse(content=content, tokens_used=0, success=True, cost=0.02)
+        
+        strategies = make_generator()._parse_batch_response(response, "openai", 2)
+        
+        assert [s.selectors for s in strategies] == [[".a"], [".b"]]
+        assert all(s.cost == pytest.approx(0.01) for s in strategies)
+    
+    def test_missing_entries_are_left_for_retry(self, make_generator):
+        """Test that a short or invalid array marks the uncovered requests"""
+        content = json.dumps([strategy_json(".a"), {"selectors": []}])
+        response = LLMResponse(content=content, tokens_used=0, success=True)
+        
+        strategies = make_generator()._parse_batch_response(response, "openai", 3)
+        
+        assert strategies[0].success
+        assert not strategies[1].success
+        assert strategies[2] is None
+    
+    def test_non_array_response_fails(self, make_generator):
+        """Test that a response without a JSON array is rejected"""
+        response = LLMResponse(content="no strategies here", tokens_used=0, success=True)
+        
+        result = make_generator()._parse_batch_response(response, "openai", 2)
+        
+        assert isinstance(result, ScrapingStrategy)
+        assert not result.success
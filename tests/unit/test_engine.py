@@ -0,0 +1,381 @@
+"""
+Unit tests for the scraping engine
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from iwsa.core.engine import REQUEST_SHARDS, RequestRegistry, ScrapingResponse
+from iwsa.core.prompt_processor import ExtractedIntent, ValidationResult
+from iwsa.core.reconnaissance import SiteMetadata
+from iwsa.llm.strategy_generator import ScrapingStrategy
+from iwsa.scraper.dynamic_scraper import ExtractionResult
+
+
+class FakeReconnaissance:
+    """Tracks how many analyses overlap"""
+    
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.running = 0
+        self.peak = 0
+    
+    async def analyze_site(self, url):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if url in self.failing:
+            raise RuntimeError("unreachable")
+        return SiteMetadata(url=url)
+
+
+class FakePromptProcessor:
+    """Returns a fixed intent"""
+    
+    def __init__(self, target_urls):
+        self.target_urls = target_urls
+        self.calls = 0
+    
+    async def process_prompt(self, prompt):
+        self.calls += 1
+        return ExtractedIntent(target_urls=list(self.target_urls))
+    
+    async def validate_parameters(self, intent):
+        return ValidationResult(valid=True)
+
+
+class TestAnalyzeSites:
+    """Test cases for ScrapingEngine._analyze_sites"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, make_engine):
+        """Test that analyses overlap up to the browser limit"""
+        reconnaissance = FakeReconnaissance()
+        engine = make_engine(reconnaissance, max_concurrent_browsers=2)
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        
+        results, errors = await engine._analyze_sites(urls)
+        
+        assert [metadata.url for metadata in results] == urls
+        assert errors == []
+        assert reconnaissance.peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_failed_sites_are_dropped(self, make_engine):
+        """Test that one failing site does not fail the others"""
+        engine = make_engine(FakeReconnaissance(failing={"https://a.example"}))
+        
+        results, errors = await engine._analyze_sites(["https://a.example", "https://b.example"])
+        
+        assert [metadata.url for metadata in results] == ["https://b.example"]
+        assert errors == ["https://a.example: unreachable"]
+
+
+class TestStreamRequest:
+    """Test cases for ScrapingEngine.stream_request"""
+    
+    @pytest.mark.asyncio
+    async def test_failed_request_ends_with_complete(self, make_engine):
+        """Test that a request without URLs yields only the final response"""
+        engine = make_engine(FakeReconnaissance())
+        engine.prompt_processor = FakePromptProcessor(target_urls=[])
+        
+        events = [event async for event in engine.stream_request("scrape nothing")]
+        
+        assert [event.stage for event in events] == ["complete"]
+        assert isinstance(events[0].payload, ScrapingResponse)
+        assert events[0].payload.error == "No valid URLs found in prompt"
+    
+    @pytest.mark.asyncio
+    async def test_process_request_returns_final_response(self, make_engine):
+        """Test that process_request returns the complete event's response"""
+        engine = make_engine(FakeReconnaissance())
+        engine.prompt_processor = FakePromptProcessor(target_urls=[])
+        
+        response = await engine.process_request("scrape nothing")
+        
+        assert response.success is False
+        assert engine.active_requests == {}
+    
+    @pytest.mark.asyncio
+    async def test_reconnaissance_failure_is_reported(self, make_engine):
+        """Test that a single failing site's error reaches the response"""
+        engine = make_engine(FakeReconnaissance(failing={"https://a.example"}))
+        engine.prompt_processor = FakePromptProcessor(target_urls=["https://a.example"])
+        
+        response = await engine.process_request("scrape a.example")
+        
+        assert response.success is False
+        assert response.error == "https://a.example: unreachable"
+    
+    @pytest.mark.asyncio
+    async def test_every_strategy_failure_is_reported(self, make_engine, monkeypatch):
+        """Test that each site's strategy failure reason reaches the response"""
+        # Fields the strategy request reads that the models do not declare
+        monkeypatch.setattr(ExtractedIntent, "intent_description", "items", raising=False)
+        monkeypatch.setattr(SiteMetadata, "sample_html", "", raising=False)
+        engine = make_engine(FakeReconnaissance())
+        engine.prompt_processor = FakePromptProcessor(target_urls=["https://a.example", "https://b.example"])
+        
+        async def generate_scraping_strategies(requests):
+            return [ScrapingStrategy(success=False, reasoning=f"no items on {request.url}") for request in requests]
+        
+        engine.llm_hub = SimpleNamespace(generate_scraping_strategies=generate_scraping_strategies)
+        
+        response = await engine.process_request("scrape both")
+        
+        assert response.error == (
+            "Strategy generation failed: https://a.example: no items on https://a.example; "
+            "https://b.example: no items on https://b.example"
+        )
+
+
+class TestResolvePrompt:
+    """Test cases for the prompt intent cache"""
+    
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_is_cached(self, make_engine):
+        """Test that a repeated prompt skips prompt processing"""
+        engine = make_engine(FakeReconnaissance())
+        engine.prompt_processor = FakePromptProcessor(target_urls=["https://example.com"])
+        
+        first, _ = await engine._resolve_prompt("scrape example")
+        second, validation = await engine._resolve_prompt("scrape example")
+        
+        assert engine.prompt_processor.calls == 1
+        assert second == first and second is not first
+        assert validation.valid
+    
+    @pytest.mark.asyncio
+    async def test_expired_and_evicted_entries_are_recomputed(self, make_engine):
+        """Test the TTL and the LRU size limit"""
+        engine = make_engine(FakeReconnaissance(), intent_cache_size=1, intent_cache_ttl=0.0)
+        engine.prompt_processor = FakePromptProcessor(target_urls=["https://example.com"])
+        
+        await engine._resolve_prompt("scrape example")
+        await engine._resolve_prompt("scrape example")
+        assert engine.prompt_processor.calls == 2
+        
+        engine.settings.scraping.intent_cache_ttl = 300.0
+        await engine._resolve_prompt("scrape a")
+        await engine._resolve_prompt("scrape b")
+        await engine._resolve_prompt("scrape a")
+        assert engine.prompt_processor.calls == 5
+        assert len(engine._intent_cache) == 1
+    
+    @pytest.mark.asyncio
+    async def test_prompt_without_urls_is_not_cached(self, make_engine):
+        """Test that prompts without URLs are not cached"""
+        engine = make_engine(FakeReconnaissance())
+        engine.prompt_processor = FakePromptProcessor(target_urls=[])
+        
+        intent, validation = await engine._resolve_prompt("scrape nothing")
+        
+        assert validation is None
+        assert len(engine._intent_cache) == 0
+
+
+class TestRequestRegistry:
+    """Test cases for the sharded active request registry"""
+    
+    def test_behaves_like_a_dict(self):
+        """Test inserts, lookups and deletes across shards"""
+        registry = RequestRegistry()
+        ids = [f"req_{i}" for i in range(REQUEST_SHARDS * 4)]
+        for request_id in ids:
+            registry[request_id] = request_id.upper()
+        
+        assert len(registry) == len(ids)
+        assert sorted(registry) == sorted(ids)
+        assert registry["req_3"] == "REQ_3"
+        assert registry.get("missing") is None
+        
+        assert registry.pop("req_3") == "REQ_3"
+        del registry["req_4"]
+        assert "req_3" not in registry and "req_4" not in registry
+        assert dict(registry.items()) == {i: i.upper() for i in ids if i not in ("req_3", "req_4")}
+    
+    def test_requests_are_spread_over_shards(self):
+        """Test that ids land in more than one shard"""
+        registry = RequestRegistry()
+        for i in range(REQUEST_SHARDS * 4):
+            registry[f"req_{i}"] = i
+        
+        assert sum(1 for shard in registry._shards if shard) > 1
+
+
+class FakeScraper:
+    """Returns one item per site, failing for URLs in ``failing``"""
+    
+    failing = set()
+    
+    def __init__(self, settings, llm_hub):
+        self.sites = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+    
+    async def scrape_with_strategy(self, site_metadata, strategy, user_requirements, scraping_profile):
+        self.sites.append(site_metadata.url)
+        await asyncio.sleep(0.01)
+        if site_metadata.url in self.failing:
+            raise RuntimeError("blocked")
+        return ExtractionResult(success=True, data=[{"url": site_metadata.url}], total_items=1, pages_processed=1)
+
+
+class TestScrapeSites:
+    """Test cases for ScrapingEngine._scrape_sites"""
+    
+    @pytest.mark.asyncio
+    async def test_results_are_merged(self, make_engine, monkeypatch):
+        """Test that every site's data ends up in one result"""
+        monkeypatch.setattr("iwsa.core.engine.DynamicScraper", FakeScraper)
+        engine = make_engine(FakeReconnaissance())
+        strategy = ScrapingStrategy(success=True)
+        targets = [(SiteMetadata(url=url), strategy) for url in ("https://a.example", "https://b.example")]
+        
+        result = await engine._scrape_sites(targets, {}, "balanced")
+        
+        assert result.success
+        assert result.data == [{"url": "https://a.example"}, {"url": "https://b.example"}]
+        assert result.total_items == 2 and result.pages_processed == 2
+    
+    @pytest.mark.asyncio
+    async def test_failed_site_is_reported(self, make_engine, monkeypatch):
+        """Test that a failing site becomes an error without failing the rest"""
+        monkeypatch.setattr("iwsa.core.engine.DynamicScraper", FakeScraper)
+        monkeypatch.setattr(FakeScraper, "failing", {"https://a.example"})
+        engine = make_engine(FakeReconnaissance())
+        strategy = ScrapingStrategy(success=True)
+        targets = [(SiteMetadata(url=url), strategy) for url in ("https://a.example", "https://b.example")]
+        
+        result = await engine._scrape_sites(targets, {}, "balanced")
+        
+        assert result.success
+        assert result.total_items == 1
+        assert result.errors == ["https://a.example: blocked"]
+    
+    @pytest.mark.asyncio
+    async def test_each_site_gets_its_own_scraper(self, make_engine, monkeypatch):
+        """Test that concurrent sites never share a scraper's per-site state"""
+        scrapers = []
+        
+        def make_scraper(settings, llm_hub):
+            scrapers.append(FakeScraper(settings, llm_hub))
+            return scrapers[-1]
+        
+        monkeypatch.setattr("iwsa.core.engine.DynamicScraper", make_scraper)
+        engine = make_engine(FakeReconnaissance())
+        strategy = ScrapingStrategy(success=True)
+        urls = ["https://a.example", "https://b.example", "https://c.example"]
+        
+        await engine._scrape_sites([(SiteMetadata(url=url), strategy) for url in urls], {}, "balanced")
+        
+        assert sorted(scraper.sites for scraper in scrapers) == [[url] for url in urls]
+
+
+class TestBuildExportMetadata:
+    """Test cases for ScrapingEngine._build_export_metadata"""
+    
+    def test_uses_site_domain_and_one_timestamp(self, make_engine):
+        """Test that names and timestamps share the same domain and time"""
+        engine = make_engine(FakeReconnaissance())
+        intent = ExtractedIntent(scraping_type="job_listings", data_fields=["title"])
+        site_metadata = SiteMetadata(url="https://jobs.example.com/search?q=python")
+        
+        metadata = engine._build_export_metadata(intent, site_metadata)
+        
+        assert site_metadata.domain == "jobs.example.com"
+        assert metadata["source_domain"] == "jobs.example.com"
+        assert metadata["spreadsheet_name"] == f"IWSA_jobs.example.com_{int(metadata['extraction_timestamp'])}"
+        assert metadata["worksheet_name"] == "Job_Listings Data"
+
+
+class TestHealthCheck:
+    """Test cases for ScrapingEngine.health_check"""
+    
+    @pytest.mark.asyncio
+    async def test_probes_run_concurrently(self, make_engine):
+        """Test that the LLM Hub and pipeline checks overlap"""
+        engine = make_engine(FakeReconnaissance())
+        running = []
+        
+        async def probe(result):
+            running.append(1)
+            await asyncio.sleep(0.01)
+            peak = len(running)
+            if isinstance(result, Exception):
+                raise result
+            return dict(result, peak=peak)
+        
+        engine.llm_hub = SimpleNamespace(health_check=lambda: probe({"overall_health": "healthy"}))
+        engine._check_pipeline_health = lambda: probe(RuntimeError("no database"))
+        
+        health = await engine.health_check()
+        
+        assert health["components"]["llm_hub"]["peak"] == 2
+        assert health["components"]["data_pipeline"] == {"status": "error", "error": "no database"}
+        assert health["issues"] == ["Data Pipeline error: no database"]
+        assert health["overall_health"] == "degraded"
+
+
+class FakePipeline:
+    """Counts connections opened and closed"""
+    
+    opened = 0
+    closed = 0
+    
+    def __init__(self, settings):
+        self.settings = settings
+    
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)
+        FakePipeline.opened += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        FakePipeline.closed += 1
+
+
+class TestPipelineLifecycle:
+    """Test cases for the engine's long-lived data pipeline"""
+    
+    @pytest.mark.asyncio
+    async def test_pipeline_is_opened_once_and_closed_by_aclose(self, monkeypatch, make_engine):
+        """Test that concurrent users share one connection until aclose"""
+        monkeypatch.setattr("iwsa.core.engine.DataPipeline", FakePipeline)
+        monkeypatch.setattr(FakePipeline, "opened", 0)
+        monkeypatch.setattr(FakePipeline, "closed", 0)
+        engine = make_engine(FakeReconnaissance())
+        
+        pipelines = await asyncio.gather(*(engine._get_pipeline() for _ in range(3)))
+        
+        assert FakePipeline.opened == 1
+        assert pipelines[0] is pipelines[1] is pipelines[2]
+        
+        await engine.aclose()
+        await engine.aclose()
+        
+        assert FakePipeline.closed == 1
+        assert engine._pipeline is None
+
+
+class TestRequestDataclasses:
+    """Test cases for the slotted request/response dataclasses"""
+    
+    def test_response_has_slots_and_fresh_defaults(self):
+        """Test that responses carry no __dict__ and don't share default lists"""
+        first = ScrapingResponse(success=True, request_id="a")
+        second = ScrapingResponse(success=True, request_id="b")
+        first.file_paths.append("out.csv")
+        
+        assert not hasattr(first, "__dict__")
+        assert second.file_paths == []
+        with pytest.raises(AttributeError):
+            first.unknown = 1
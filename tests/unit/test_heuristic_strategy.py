@@ -0,0 +1,43 @@
+"""
+Unit tests for the trivial-page heuristic strategy
+"""
+
+from iwsa.llm.heuristic_strategy import try_trivial_strategy
+
+
+PRODUCT_HTML = "<div class='product'><h1>Product Title</h1><span class='price'>$99</span></div>"
+
+
+class TestTrivialStrategy:
+    """Test cases for try_trivial_strategy"""
+    
+    def test_fields_from_intent(self):
+        """Test that a simple product page maps title and price directly"""
+        strategy = try_trivial_strategy(PRODUCT_HTML, "Extract product title and price")
+        
+        assert strategy is not None
+        assert strategy.selectors == ["h1", ".price"]
+        assert strategy.provider_used == "heuristic"
+        assert strategy.cost == 0.0
+    
+    def test_explicit_fields(self):
+        """Test that explicit extraction fields are matched against classes"""
+        html = "<div class='job'><h3 class='job-title'>Dev</h3><div class='salary'>$1</div></div>"
+        
+        strategy = try_trivial_strategy(html, "Extract jobs", ["title", "salary"])
+        
+        assert strategy.selectors == [".job-title", ".salary"]
+    
+    def test_unknown_intent_needs_llm(self):
+        """Test that an intent naming no known fields falls through"""
+        assert try_trivial_strategy(PRODUCT_HTML, "Extract product information") is None
+    
+    def test_repeated_items_need_llm(self):
+        """Test that listing pages with repeated elements are not trivial"""
+        html = "<ul>" + "<li class='item'><span class='price'>$1</span></li>" * 3 + "</ul>"
+        
+        assert try_trivial_strategy(html, "Extract price") is None
+    
+    def test_unmatched_field_needs_llm(self):
+        """Test that a field with no matching element falls through"""
+        assert try_trivial_strategy(PRODUCT_HTML, "Extract items", ["rating"]) is None
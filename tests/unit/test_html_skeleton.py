@@ -0,0 +1,55 @@
+"""
+Unit tests for prompt HTML skeletonization
+"""
+
+from iwsa.llm.html_skeleton import skeletonize
+
+
+class TestSkeletonize:
+    """Test cases for skeletonize"""
+    
+    def test_keeps_selector_attributes_only(self):
+        """Test that class/id/role survive while data-* and styles are dropped"""
+        html = "<div id='main' class='job-card featured' data-id='7' style='color:red' role='article'></div>"
+        
+        assert skeletonize(html) == "<div#main.job-card.featured[role=article]></div>"
+    
+    def test_drops_scripts_styles_and_text(self):
+        """Test that non-structural content collapses away"""
+        html = (
+            "<head><meta charset='utf-8'><style>.a {}</style></head>"
+            "<body><!-- note --><script>if (a < b) {}</script>"
+            "<h3 class='title'>Senior <b>Engineer</b></h3><svg><path/></svg></body>"
+        )
+        
+        assert skeletonize(html) == "<head></head><body><h3.title>•<b>•</b></h3></body>"
+    
+    def test_href_reduced_to_path_pattern(self):
+        """Test that links keep their path shape without ids or query"""
+        html = "<a href='https://example.com/jobs/123?ref=home'>Apply</a>"
+        
+        assert skeletonize(html) == "<a[href=/jobs/0]>•</a>"
+    
+    def test_truncates_to_max_chars(self):
+        """Test that long skeletons are cut to the requested size"""
+        html = "<ul>" + "".join(f"<li class='item-{i}'>x</li>" for i in range(100)) + "</ul>"
+        
+        skeleton = skeletonize(html, max_chars=50)
+        
+        assert skeleton.startswith("<ul><li.item-0>•</li>")
+        assert skeleton.endswith("... [truncated]")
+        assert len(skeleton) == 50 + len("... [truncated]")
+    
+    def test_collapses_repeated_siblings(self):
+        """Test that identical sibling subtrees keep two copies and a count"""
+        html = "<ul>" + "<li class='item'><a href='/jobs/1'>x</a></li>" * 10 + "</ul><p>end</p>"
+        
+        assert skeletonize(html) == (
+            "<ul><li.item><a[href=/jobs/0]>•</a></li><li.item><a[href=/jobs/0]>•</a></li>[+8 more]</ul><p>•</p>"
+        )
+    
+    def test_unclosed_elements_are_closed(self):
+        """Test that elements left open close with their parent or the document"""
+        html = "<ul><li>one<li>two</ul><div><span>x"
+        
+        assert skeletonize(html) == "<ul><li>•<li>•</li></li></ul><div><span>•</span></div>"
@@ -0,0 +1,31 @@
+"""
+Unit tests for the shared provider HTTP session
+"""
+
+import asyncio
+
+from iwsa.llm import _http
+
+
+class TestSharedSession:
+    """Test cases for get_shared_session"""
+    
+    def test_reused_within_loop_and_closed_with_it(self):
+        """Test that one loop shares a session that closes at loop shutdown"""
+        async def fetch_twice():
+            first = await _http.get_shared_session()
+            second = await _http.get_shared_session()
+            assert first is second
+            return first
+        
+        session = asyncio.run(fetch_twice())
+        
+        assert session.closed
+        assert not _http._sessions
+    
+    def test_new_session_per_loop(self):
+        """Test that separate event loops get separate sessions"""
+        first = asyncio.run(_http.get_shared_session())
+        second = asyncio.run(_http.get_shared_session())
+        
+        assert first is not second
@@ -0,0 +1,91 @@
+"""
+Unit tests for batched multi-page strategy generation in the LLM hub
+"""
+
+import pytest
+
+from iwsa.llm.strategy_cache import StrategyCache
+from iwsa.llm.strategy_generator import ScrapingStrategy, StrategyRequest
+
+
+class BatchGenerator:
+    """Records every batch it is asked for"""
+    
+    def __init__(self):
+        self.batches = []
+    
+    async def generate_scraping_strategies(self, requests):
+        self.batches.append([request.url for request in requests])
+        return [
+            ScrapingStrategy(success=True, selectors=[f".item-{i}"], provider_used="fake")
+            for i, _ in enumerate(requests)
+        ]
+    
+    def available_providers(self):
+        return ["fake"]
+    
+    def estimate_batch_cost(self, requests):
+        self.batches.append([len(request.html_content) for request in requests])
+        return 0.01 * len(requests)
+
+
+def request(url, html="<ul><li></li></ul>") -> StrategyRequest:
+    return StrategyRequest(html_content=html, url=url, user_intent="items", extraction_fields=["title"])
+
+
+class TestGenerateScrapingStrategies:
+    """Test cases for LLMHub.generate_scraping_strategies"""
+    
+    @pytest.mark.asyncio
+    async def test_all_pages_share_one_batch(self, make_hub):
+        """Test that every uncached page goes out in a single batch"""
+        generator = BatchGenerator()
+        hub = make_hub(generator)
+        urls = [f"https://example.com/{i}" for i in range(3)]
+        
+        strategies = await hub.generate_scraping_strategies([request(url) for url in urls])
+        
+        assert generator.batches == [urls]
+        assert [s.selectors for s in strategies] == [[".item-0"], [".item-1"], [".item-2"]]
+    
+    @pytest.mark.asyncio
+    async def test_cached_pages_are_left_out_of_the_batch(self, make_hub):
+        """Test that cache hits keep their position and skip the provider"""
+        generator = BatchGenerator()
+        cache = StrategyCache(cache_dir=None)
+        cached_html = "<table><tr><td></td></tr></table>"
+        cache.set(cached_html, "items", ["title"], ScrapingStrategy(success=True, selectors=["td"]))
+        hub = make_hub(generator, strategy_cache=cache)
+        
+        strategies = await hub.generate_scraping_strategies([
+            request("https://a.example"),
+            request("https://b.example", html=cached_html),
+        ])
+        
+        assert generator.batches == [["https://a.example"]]
+        assert strategies[1].selectors == ["td"] and strategies[1].cached
+    
+    @pytest.mark.asyncio
+    async def test_requests_are_not_modified(self, make_hub):
+        """Test that interning fields leaves the caller's requests untouched"""
+        hub = make_hub(BatchGenerator())
+        requests = [request("https://a.example")]
+        fields = requests[0].extraction_fields
+        
+        await hub.generate_scraping_strategies(requests)
+        
+        assert requests[0].extraction_fields is fields
+
+
+class TestEstimateUnfetchedCost:
+    """Test cases for LLMHub.estimate_unfetched_cost"""
+    
+    def test_prices_full_placeholder_pages_in_one_batch(self, make_hub):
+        """Test that every site is priced as a full page within one batch"""
+        generator = BatchGenerator()
+        hub = make_hub(generator)
+        
+        cost = hub.estimate_unfetched_cost("items", pages=3)
+        
+        assert cost == pytest.approx(0.03)
+        assert generator.batches == [[10000, 10000, 10000]]
@@ -0,0 +1,109 @@
+"""
+Unit tests for coalescing identical in-flight strategy requests
+"""
+
+import asyncio
+
+import pytest
+
+from iwsa.llm.strategy_generator import ScrapingStrategy
+
+
+class SlowGenerator:
+    """Counts calls and holds each one open briefly"""
+    
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.error = error
+    
+    async def generate_scraping_strategy(self, html_content, url, user_intent, extraction_fields=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.error is not None:
+            raise self.error
+        return ScrapingStrategy(success=True, selectors=[".item"], provider_used="fake")
+    
+    def available_providers(self):
+        return ["fake"]
+
+
+class TestInflightDedup:
+    """Test cases for LLMHub in-flight request coalescing"""
+    
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(self, make_hub):
+        """Test that concurrent identical requests make a single LLM call"""
+        generator = SlowGenerator()
+        hub = make_hub(generator)
+        
+        strategies = await asyncio.gather(*(
+            hub.generate_scraping_strategy("<ul></ul>", f"https://example.com/{i}", "items", ["title"])
+            for i in range(5)
+        ))
+        
+        assert generator.calls == 1
+        assert all(strategy.selectors == [".item"] for strategy in strategies)
+        assert hub._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_different_fields_are_not_shared(self, make_hub):
+        """Test that requests differing in fields are generated separately"""
+        generator = SlowGenerator()
+        hub = make_hub(generator)
+        
+        await asyncio.gather(
+            hub.generate_scraping_strategy("<ul></ul>", "https://example.com", "items", ["title"]),
+            hub.generate_scraping_strategy("<ul></ul>", "https://example.com", "items", ["price"])
+        )
+        
+        assert generator.calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self, make_hub):
+        """Test that a failed call is raised to the callers that joined it"""
+        hub = make_hub(SlowGenerator(error=RuntimeError("boom")))
+        
+        results = await asyncio.gather(*(
+            hub.generate_scraping_strategy("<ul></ul>", "https://example.com", "items")
+            for _ in range(3)
+        ), return_exceptions=True)
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert hub._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_first_caller_cancelled_while_others_joined(self, make_hub):
+        """Test that joined callers still get the result when the first caller is cancelled"""
+        generator = SlowGenerator()
+        hub = make_hub(generator)
+        
+        first = asyncio.ensure_future(
+            hub.generate_scraping_strategy("<ul></ul>", "https://example.com", "items", ["title"])
+        )
+        await asyncio.sleep(0)
+        joined = asyncio.ensure_future(
+            hub.generate_scraping_strategy("<ul></ul>", "https://example.com", "items", ["title"])
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+        
+        strategy = await joined
+        
+        assert first.cancelled()
+        assert strategy.selectors == [".item"]
+        assert generator.calls == 1
+        assert hub._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_callers_get_separate_copies(self, make_hub):
+        """Test that mutating one caller's strategy does not affect another's"""
+        hub = make_hub(SlowGenerator())
+        
+        first, second = await asyncio.gather(*(
+            hub.generate_scraping_strategy("<ul></ul>", "https://example.com", "items", ["title"])
+            for _ in range(2)
+        ))
+        first.selectors.append(".extra")
+        
+        assert first is not second
+        assert second.selectors == [".item"]
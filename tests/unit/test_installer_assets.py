@@ -0,0 +1,46 @@
+"""
+Unit tests for the installer asset generator script
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+
+SCRIPT = Path(__file__).resolve().parents[2] / "desktop-scraper" / "scripts" / "generate_installer_assets.py"
+
+
+def load_script(monkeypatch):
+    """Import the script fresh under its own name, which Numba's cache looks up"""
+    spec = importlib.util.spec_from_file_location(SCRIPT.stem, SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, SCRIPT.stem, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestWebPatternMask:
+    """Test cases for the spider web pattern rasterizer"""
+    
+    @pytest.mark.parametrize("width, height, alpha, scale", [
+        (660, 400, 30, 1.0),
+        (1320, 800, 30, 2.0),
+        (164, 314, 40, 0.3),
+        (493, 312, 20, 0.5),
+    ])
+    def test_numba_and_fallback_masks_match(self, monkeypatch, width, height, alpha, scale):
+        """Test that the JIT and pure-Python paths draw the same pattern"""
+        pytest.importorskip("numba")
+        jit_script = load_script(monkeypatch)
+        jit_mask = jit_script.InstallerAssetGenerator._web_pattern_mask(width, height, alpha, scale)
+        
+        # Loaded again with Numba hidden, so it takes the pure-Python path
+        monkeypatch.setitem(sys.modules, "numba", None)
+        plain_script = load_script(monkeypatch)
+        plain_mask = plain_script.InstallerAssetGenerator._web_pattern_mask(width, height, alpha, scale)
+        
+        assert jit_script.NUMBA_AVAILABLE and not plain_script.NUMBA_AVAILABLE
+        assert np.array_equal(np.asarray(jit_mask), np.asarray(plain_mask))
@@ -0,0 +1,118 @@
+"""
+Unit tests for the structure-keyed strategy cache
+"""
+
+import pytest
+
+from iwsa.llm.strategy_cache import StrategyCache, structure_tokens
+from iwsa.llm.strategy_generator import ScrapingStrategy
+
+
+JOB_CARD = (
+    "<div class='job-card' data-job-id='{i}'>"
+    "<h3 class='job-title'>Job {i}</h3>"
+    "<div class='salary'>${i}0,000</div>"
+    "</div>"
+)
+
+
+def job_page(count: int) -> str:
+    cards = "".join(JOB_CARD.format(i=i) for i in range(count))
+    return f"<html><body><div class='job-listings'>{cards}</div></body></html>"
+
+
+class TestStructureTokens:
+    """Test cases for HTML skeleton extraction"""
+    
+    def test_ignores_text_and_scripts(self):
+        """Test that text content and script tags do not affect the skeleton"""
+        plain = "<div class='a'><p>Hello</p></div>"
+        noisy = "<div class='a'><script>var x = 1;</script><p>Goodbye</p></div>"
+        
+        assert structure_tokens(plain) == structure_tokens(noisy) == ["div.a", "p"]
+    
+    def test_normalizes_numeric_ids(self):
+        """Test that per-item numbers in ids and classes are normalized"""
+        assert structure_tokens("<li id='item-12'></li>") == structure_tokens("<li id='item-7'></li>")
+
+
+class TestStrategyCache:
+    """Test cases for StrategyCache"""
+    
+    @pytest.fixture
+    def cache(self):
+        return StrategyCache(cache_dir=None)
+    
+    @pytest.fixture
+    def strategy(self):
+        return ScrapingStrategy(
+            success=True,
+            selectors=[".job-card"],
+            confidence_score=0.9,
+            provider_used="openai",
+            cost=0.05
+        )
+    
+    def test_exact_hit(self, cache, strategy):
+        """Test that the same structure and request returns the stored strategy"""
+        cache.set(job_page(5), "Extract jobs", ["title"], strategy)
+        
+        cached = cache.get(job_page(5), "Extract jobs", ["title"])
+        
+        assert cached is not None
+        assert cached.selectors == [".job-card"]
+        assert cached.provider_used == "openai"
+    
+    def test_similar_structure_hit(self, cache, strategy):
+        """Test that a page with more of the same cards reuses the strategy"""
+        cache.set(job_page(5), "Extract jobs", ["title"], strategy)
+        
+        assert cache.get(job_page(8), "Extract jobs", ["title"]) is not None
+    
+    def test_different_structure_miss(self, cache, strategy):
+        """Test that an unrelated layout does not match"""
+        cache.set(job_page(5), "Extract jobs", ["title"], strategy)
+        
+        table_page = "<html><body><table><tr><td>Job</td></tr></table></body></html>"
+        assert cache.get(table_page, "Extract jobs", ["title"]) is None
+    
+    def test_different_request_miss(self, cache, strategy):
+        """Test that the same page with different fields is a separate entry"""
+        cache.set(job_page(5), "Extract jobs", ["title"], strategy)
+        
+        assert cache.get(job_page(5), "Extract jobs", ["salary"]) is None
+    
+    def test_failed_strategy_not_cached(self, cache):
+        """Test that unsuccessful strategies are never stored"""
+        cache.set(job_page(5), "Extract jobs", None, ScrapingStrategy(success=False))
+        
+        assert cache.get(job_page(5), "Extract jobs", None) is None
+    
+    def test_returned_strategy_is_a_copy(self, cache, strategy):
+        """Test that mutating a cached result does not alter the cache"""
+        cache.set(job_page(5), "Extract jobs", None, strategy)
+        
+        cache.get(job_page(5), "Extract jobs", None).selectors.append(".extra")
+        
+        assert cache.get(job_page(5), "Extract jobs", None).selectors == [".job-card"]
+    
+    def test_eviction_updates_similarity_index(self, strategy):
+        """Test that evicted entries are no longer matched by similarity"""
+        cache = StrategyCache(cache_dir=None, max_entries=1)
+        cache.set(job_page(5), "Extract jobs", None, strategy)
+        cache.set("<table><tr><td></td></tr></table>", "Extract jobs", None, strategy)
+        
+        assert cache.get(job_page(8), "Extract jobs", None) is None
+    
+    def test_same_content_skips_parsing(self, cache, strategy, monkeypatch):
+        """Test that a page seen before is resolved without parsing its HTML"""
+        cache.set(job_page(5), "Extract jobs", ["title"], strategy)
+        
+        def fail(html_content):
+            raise AssertionError("page was parsed")
+        
+        monkeypatch.setattr("iwsa.llm.strategy_cache.structure_tokens", fail)
+        
+        assert cache.get(job_page(5), "Extract jobs", ["title"]).selectors == [".job-card"]
+        with pytest.raises(AssertionError):
+            cache.get(job_page(6), "Extract jobs", ["title"])
@@ -0,0 +1,112 @@
+"""
+Unit tests for streamed strategy generation
+"""
+
+import json
+
+import pytest
+
+from iwsa.llm.strategy_generator import _closed_selectors
+
+
+STRATEGY = {
+    "selectors": [".job-card", "a[title=\"x]\"]"],
+    "extraction_logic": "logic",
+    "pagination_strategy": {"type": "none", "selectors": []},
+    "confidence_score": 0.9
+}
+
+
+class FakeStreamingProvider:
+    """Streams a fixed response in small chunks"""
+    
+    def __init__(self, content: str, chunk_size: int = 7):
+        self.chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+    
+    async def stream_response(self, request):
+        for chunk in self.chunks:
+            yield chunk
+    
+    def estimate_cost(self, request):
+        return 0.01
+
+
+class DroppedStreamingProvider(FakeStreamingProvider):
+    """Streams its content, then fails before the response is finished"""
+    
+    async def stream_response(self, request):
+        async for chunk in super().stream_response(request):
+            yield chunk
+        raise ConnectionError("stream reset")
+
+
+class TestClosedSelectors:
+    """Test cases for detecting a completed selector list"""
+    
+    def test_incomplete_list(self):
+        """Test that a selector list still being streamed is not returned"""
+        assert _closed_selectors('{"selectors": [".a", ".b') is None
+        assert _closed_selectors('{"extraction_logic": "x"') is None
+    
+    def test_brackets_inside_strings(self):
+        """Test that brackets inside selector strings do not end the list"""
+        content = '{"selectors": ["a[href]", "div[data-x=\\"]\\"]"], "extraction'
+        
+        assert _closed_selectors(content) == ["a[href]", 'div[data-x="]"]']
+
+
+class TestStrategyStream:
+    """Test cases for generate_scraping_strategy_stream"""
+    
+    @pytest.mark.asyncio
+    async def test_selectors_before_complete_strategy(self, make_generator):
+        """Test that selectors are yielded before the full strategy"""
+        generator = make_generator(fake=FakeStreamingProvider(json.dumps(STRATEGY)))
+        
+        partials = [
+            partial async for partial in
+            generator.generate_scraping_strategy_stream("<div></div>", "https://example.com", "Extract jobs")
+        ]
+        
+        assert len(partials) == 2
+        assert not partials[0].complete
+        assert partials[0].selectors == STRATEGY["selectors"]
+        assert partials[1].complete
+        assert partials[1].strategy.success
+        assert partials[1].strategy.provider_used == "fake"
+    
+    @pytest.mark.asyncio
+    async def test_unparseable_stream_fails(self, make_generator):
+        """Test that a stream without a valid strategy ends in a failed strategy"""
+        generator = make_generator(fake=FakeStreamingProvider("no strategy here"))
+        
+        partials = [
+            partial async for partial in
+            generator.generate_scraping_strategy_stream("<div></div>", "https://example.com", "Extract jobs")
+        ]
+        
+        assert len(partials) == 1
+        assert partials[0].complete
+        assert not partials[0].strategy.success
+    
+    @pytest.mark.asyncio
+    async def test_failed_provider_retracts_its_selectors(self, make_generator):
+        """Test that selectors from a provider that fails mid-stream are withdrawn"""
+        content = json.dumps(STRATEGY)
+        fallback = dict(STRATEGY, selectors=[".fallback"])
+        generator = make_generator(
+            first=DroppedStreamingProvider(content[:content.index('"extraction_logic"')]),
+            second=FakeStreamingProvider(json.dumps(fallback))
+        )
+        
+        partials = [
+            partial async for partial in
+            generator.generate_scraping_strategy_stream("<div></div>", "https://example.com", "Extract jobs")
+        ]
+        
+        assert [(p.provider_used, p.selectors, p.retracted, p.complete) for p in partials] == [
+            ("first", STRATEGY["selectors"], False, False),
+            ("first", [], True, False),
+            ("second", [".fallback"], False, False),
+            ("second", [".fallback"], False, True),
+        ]
@@ -0,0 +1,31 @@
+"""
+Unit tests for approximate token counting
+"""
+
+import numpy as np
+import pytest
+
+from iwsa.llm._tokcount import count_tokens, _count_tokens_fast, _count_tokens_numpy
+
+
+class TestCountTokens:
+    """Test cases for count_tokens"""
+    
+    def test_words_and_punctuation(self):
+        """Test that words and punctuation marks each count as tokens"""
+        assert count_tokens("") == 0
+        assert count_tokens("hello world") == 2
+        assert count_tokens("<div class=\"job\">") == 8
+    
+    def test_long_words_split(self):
+        """Test that long words count as several tokens"""
+        assert count_tokens("internationalization") == 4
+    
+    @pytest.mark.parametrize("text", [
+        "Hello, world!",
+        "<ul><li class='job-card'>Senior Engineer — ünïcode</li></ul>\n" * 20,
+    ])
+    def test_numpy_fallback_matches(self, text):
+        """Test that the NumPy fallback agrees with the default path"""
+        buf = text.encode("utf-8")
+        assert _count_tokens_numpy(np.frombuffer(buf, dtype=np.uint8)) == _count_tokens_fast(buf)
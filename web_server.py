@@ -100,7 +100,7 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     global scraping_engine
     if scraping_engine:
-        await scraping_engine.cleanup()
+        await scraping_engine.aclose()
     logger.info("🛑 Local Web Scraper Server stopped")
 
 # WebSocket for real-time updates